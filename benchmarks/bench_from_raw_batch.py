@@ -0,0 +1,82 @@
+"""Сравнение скорости создания экземпляров Vacancy по одному и методом Vacancy.from_raw_batch.
+
+Запуск из корня проекта: python -m benchmarks.bench_from_raw_batch --count 1000000
+"""
+import argparse
+import time
+
+from src.class_vacancies import Vacancy
+
+
+def make_items(count: int) -> list[dict]:
+    """Функция создания списка вакансий в формате ответа API HH.ru."""
+
+    experiences = ["Нет опыта", "От 1 года до 3 лет", "От 3 до 6 лет", "Более 6 лет"]
+    return [
+        {
+            "id": str(i),
+            "name": f"Python-разработчик {i}",
+            "salary": {"from": 100000 + i % 1000 * 100, "to": None if i % 3 else 250000, "currency": "RUR"},
+            "alternate_url": f"https://hh.ru/vacancy/{i}",
+            "employer": {"id": str(i % 5000), "name": f"Компания {i % 5000}"},
+            "snippet": {"requirement": "Опыт коммерческой разработки на Python от 3 лет", "responsibility": None},
+            "experience": {"id": str(i % 4), "name": experiences[i % 4]},
+            "employment": {"id": "full", "name": "Полная занятость"}
+        }
+        for i in range(count)
+    ]
+
+
+def one_by_one(items: list[dict]) -> list[Vacancy]:
+    """Функция создания экземпляров Vacancy по одному, как до появления from_raw_batch."""
+
+    return [
+        Vacancy(
+            item["name"],
+            item["salary"],
+            item["alternate_url"],
+            item["employer"],
+            item["snippet"],
+            item["experience"],
+            item["employment"]
+        )
+        for item in items
+    ]
+
+
+def measure(title: str, function, items: list[dict], repeat: int) -> float:
+    """Функция измерения лучшего времени из repeat запусков."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        vacancies = function(items)
+        best = min(best, time.perf_counter() - start)
+        assert len(vacancies) == len(items)
+    print(f"{title:<40} {best:8.3f} с")
+    return best
+
+
+def main() -> None:
+    """Функция запуска сравнения."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500000, help="количество вакансий")
+    parser.add_argument("--repeat", type=int, default=3, help="количество повторов каждого замера")
+    args = parser.parse_args()
+
+    items = make_items(args.count)
+    assert [v.to_dict() for v in Vacancy.from_raw_batch(items[:1000])] == \
+        [v.to_dict() for v in one_by_one(items[:1000])]
+
+    print(f"Вакансий: {args.count}")
+    base = measure("Vacancy(...) по одному", one_by_one, items, args.repeat)
+    batch = measure("from_raw_batch", Vacancy.from_raw_batch, items, args.repeat)
+    paused = measure(
+        "from_raw_batch(pause_gc=True)", lambda raw: Vacancy.from_raw_batch(raw, pause_gc=True), items, args.repeat
+    )
+    print(f"Ускорение: {base / batch:.2f}x, с паузой сборки мусора: {base / paused:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
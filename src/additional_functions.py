@@ -1,6 +1,24 @@
+import sys
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, TypeGuard, overload
+
 from src.class_API import HH
+from src.class_keyword_index import KeywordIndex
+from src.class_salary_index import SalaryIndex
+from src.class_top_n import TopVacancies
 from src.class_vacancies import Vacancy
 
+if TYPE_CHECKING:
+    from src.class_vacancy_table import VacancyTable
+
+
+def _is_table(vacancies: object) -> TypeGuard["VacancyTable"]:
+    """Функция проверки, является ли vacancies таблицей VacancyTable. Модуль таблицы (и NumPy)
+    не импортируется: если он еще не загружен, таблиц в программе нет."""
+
+    module = sys.modules.get("src.class_vacancy_table")
+    return module is not None and isinstance(vacancies, module.VacancyTable)
+
 
 def check_currency(data: HH) -> list:
     """Функция для отсеивания вакансий из класса HH, которая группирует только
@@ -17,26 +35,32 @@ def check_currency(data: HH) -> list:
 
 def vacancy_objects(vacancy_hh: list) -> list[Vacancy]:
     """Функция создания списка с объектами класса Vacancy из списка вакансий, полученного
-    от API HH.ru."""
+    от API HH.ru (методом Vacancy.from_raw_batch)."""
+
+    return Vacancy.from_raw_batch(vacancy_hh)
 
-    vacancyies_object = []
-    for vac in vacancy_hh:
-        v = Vacancy(
-            vac["name"],
-            vac["salary"],
-            vac["alternate_url"],
-            vac["employer"],
-            vac["snippet"],
-            vac["experience"],
-            vac["employment"]
-        )
-        vacancyies_object.append(v)
 
-    return vacancyies_object
+@overload
+def filter_vacancies(vacancies: "VacancyTable", keywords: list[str]) -> "VacancyTable":
+    ...
 
 
-def filter_vacancies(vacancies: list[Vacancy], keywords: list[str]) -> list[Vacancy]:
-    """"Функция поиска вакансий по ключевым словам."""
+@overload
+def filter_vacancies(vacancies: list[Vacancy] | KeywordIndex, keywords: list[str]) -> list[Vacancy]:
+    ...
+
+
+def filter_vacancies(
+        vacancies: "list[Vacancy] | VacancyTable | KeywordIndex",
+        keywords: list[str]
+) -> "list[Vacancy] | VacancyTable":
+    """"Функция поиска вакансий по ключевым словам. Для VacancyTable возвращает таблицу, а для индекса
+    KeywordIndex - вакансии, в названии которых есть слово, начинающееся с одного из ключевых слов."""
+
+    if _is_table(vacancies):
+        return vacancies.search(keywords)
+    if isinstance(vacancies, KeywordIndex):
+        return vacancies.search(keywords)
 
     filtered_vacancies = []
 
@@ -47,13 +71,32 @@ def filter_vacancies(vacancies: list[Vacancy], keywords: list[str]) -> list[Vaca
     return filtered_vacancies
 
 
-def get_vacancies_by_salary(vacancies: list[Vacancy], salary_range: list[str]) -> list[Vacancy]:
-    """Функция для фильтрования списка вакансий по диапазону зарплат."""
+@overload
+def get_vacancies_by_salary(vacancies: "VacancyTable", salary_range: list[str]) -> "VacancyTable":
+    ...
+
+
+@overload
+def get_vacancies_by_salary(vacancies: list[Vacancy] | SalaryIndex, salary_range: list[str]) -> list[Vacancy]:
+    ...
+
+
+def get_vacancies_by_salary(
+        vacancies: "list[Vacancy] | VacancyTable | SalaryIndex",
+        salary_range: list[str]
+) -> "list[Vacancy] | VacancyTable":
+    """Функция для фильтрования списка вакансий по диапазону зарплат. Для VacancyTable возвращает таблицу,
+    а для индекса SalaryIndex - список вакансий по возрастанию зарплаты, найденный двоичным поиском."""
 
     vacancies_by_salary = []
     salary_from = int(salary_range[0])
     salary_to = int(salary_range[1])
 
+    if _is_table(vacancies):
+        return vacancies.salary_range(salary_from, salary_to)
+    if isinstance(vacancies, SalaryIndex):
+        return vacancies.range(salary_from, salary_to)
+
     for vac in vacancies:
         if salary_from <= vac.salary <= salary_to:
             vacancies_by_salary.append(vac)
@@ -61,17 +104,43 @@ def get_vacancies_by_salary(vacancies: list[Vacancy], salary_range: list[str]) -
     return vacancies_by_salary
 
 
+@overload
+def sort_vacancies(vacancies: "VacancyTable") -> "VacancyTable":
+    ...
+
+
+@overload
 def sort_vacancies(vacancies: list[Vacancy]) -> list[Vacancy]:
-    """Функция для сортировки списка объектов вакансий по убываеию зарплаты."""
+    ...
+
+
+def sort_vacancies(vacancies: "list[Vacancy] | VacancyTable") -> "list[Vacancy] | VacancyTable":
+    """Функция для сортировки списка объектов вакансий по убываеию зарплаты. Для VacancyTable возвращает таблицу."""
+
+    if _is_table(vacancies):
+        return vacancies.sort()
 
     sorted_vacancies = sorted(vacancies, key=lambda vac: vac.salary, reverse=True)
 
     return sorted_vacancies
 
 
-def get_top_vacancies(vacancies: list[Vacancy], top_n: int) -> list[Vacancy]:
-    """Функция, которая возвращает список из топ N вакансий."""
+@overload
+def get_top_vacancies(vacancies: "VacancyTable", top_n: int) -> "VacancyTable":
+    ...
+
+
+@overload
+def get_top_vacancies(vacancies: list[Vacancy] | Iterator[Vacancy], top_n: int) -> list[Vacancy]:
+    ...
+
+
+def get_top_vacancies(vacancies: "list[Vacancy] | Iterator[Vacancy] | VacancyTable", top_n: int) -> "list[Vacancy] | VacancyTable":
+    """Функция, которая возвращает список из топ N вакансий. Для VacancyTable возвращает таблицу.
+    Весь список не сортируется: лучшие вакансии отбираются в куче из top_n элементов, поэтому
+    вместо списка можно передать и итератор (например, JSONFileWorker.iter_data)."""
 
-    sorted_vacancies = sort_vacancies(vacancies)
+    if _is_table(vacancies):
+        return vacancies.top(top_n)
 
-    return sorted_vacancies[:top_n]
+    return TopVacancies(top_n).extend(vacancies).result()
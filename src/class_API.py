@@ -1,27 +1,202 @@
+import itertools
+import random
+import threading
+import time
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
 import requests
+from requests.adapters import HTTPAdapter
 from src.class_Parser import Parser
+from src.class_abs_cache import ResponseCache
+from src.class_health import ApiHealth
+from src.class_rate_limiter import RateLimiter
+from src.class_vacancies import Vacancy
+from src.class_watermark import WatermarkStore
 
 class HH(Parser):
     """Класс для работы с API HeadHunter."""
 
-    def __init__(self) -> None:
+    # Максимальное количество страниц, которое отдает API HH.ru
+    MAX_PAGES = 20
+
+    # Общая для всех экземпляров сессия с пулом соединений и размер ее пула
+    __session = None
+    __pool_size = 0
+    __session_lock = threading.Lock()
+
+    # Общее для всех экземпляров состояние доступности API
+    _health = ApiHealth()
+
+    # Общий для всех экземпляров ограничитель частоты запросов
+    _rate_limiter = RateLimiter()
+
+    # Параметры повторных запросов: статусы, при которых запрос повторяется,
+    # максимальное количество повторов и базовая/максимальная задержка в секундах
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    MAX_RETRIES = 5
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 30.0
+
+    # Параметры разбиения запросов, выдача которых не помещается в MAX_PAGES страниц:
+    # период первого разбиения в днях, минимальная длительность части и максимальное количество частей
+    PARTITION_DAYS = 30
+    MIN_PARTITION = timedelta(minutes=1)
+    MAX_PARTITIONS = 200
+
+    def __init__(self, concurrency: int = 1, cache: ResponseCache | None = None, partition: bool = True) -> None:
         """Конструктор класса HH, который закладывает логику подключения к API HH.ru,
-        и подготавливает список для последующего добавления в него вакансий."""
+        и подготавливает список для последующего добавления в него вакансий.
+        concurrency - количество страниц, загружаемых параллельно (1 - последовательная загрузка);
+        cache - кеш ответов API (если не передан, каждый запрос выполняется заново);
+        partition - разбивать ли по дате публикации запросы, выдача которых больше MAX_PAGES страниц."""
 
         self.__url = 'https://api.hh.ru/vacancies'
         self.__headers = {'User-Agent': 'HH-User-Agent'}
-        self.__params = {'text': '', 'page': 0, 'per_page': 100, 'only_with_salary': True}
+        self.__params: dict[str, Any] = {'text': '', 'page': 0, 'per_page': 100, 'only_with_salary': True}
+        self.__concurrency = max(1, concurrency)
+        self.__cache = cache
+        self.__partition = partition
         self.vacancies = []
+        # Статистика запросов: сколько страниц загружено и сколько пропущено благодаря метаданным
+        self.requests_issued = 0
+        self.requests_skipped = 0
+        # Количество частей разбитого запроса, которые не удалось разделить дальше, хотя их выдача
+        # больше MAX_PAGES страниц: вакансии таких частей загружены не полностью
+        self.partitions_truncated = 0
+
+    @classmethod
+    def _get_session(cls, pool_size: int = 1) -> requests.Session:
+        """Метод получения общей сессии с пулом соединений. Через нее выполняются все запросы,
+        поэтому соединение с сервером используется повторно. Если пул меньше pool_size
+        (количества одновременных запросов), он заменяется пулом нужного размера."""
+
+        with cls.__session_lock:
+            if cls.__session is None:
+                cls.__session = requests.Session()
+            if pool_size > cls.__pool_size:
+                cls.__session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+                cls.__pool_size = pool_size
+            return cls.__session
+
+    def _get_connection(self) -> bool:
+        """Метод проверки доступности API сайта HH.ru. Отдельный запрос не выполняется:
+        используется общее состояние, сохраненное по результатам запросов за страницами.
+        Возвращает False, только если API недавно отвечал ошибкой."""
+
+        return not self._health.is_down()
+
+    def __fetch_page(self, params: dict) -> dict:
+        """Приватный метод загрузки одной страницы вакансий с заданными параметрами.
+        Возвращает ответ API целиком, вместе с метаданными пагинации.
+        Результат запроса сохраняется в общем состоянии доступности API.
+        Если задан кеш, свежий ответ берется из него, а устаревший проверяется на сервере
+        по заголовкам ETag и Last-Modified."""
+
+        headers = self.__headers
+        entry = None
+        cached: dict = {}
+        if self.__cache is not None:
+            entry = self.__cache.get(self.__url, params)
+            if entry is not None:
+                cached = entry["body"]
+                if entry["fresh"]:
+                    return cached
+                headers = {**headers, **self.__validators(entry)}
+
+        response = self.__request(headers, params)
+
+        if self.__cache is not None and entry is not None and response.status_code == 304:
+            self.__cache.refresh(self.__url, params)
+            return cached
+
+        data = response.json()
+        if not isinstance(data, dict) or 'items' not in data:
+            raise requests.exceptions.InvalidJSONError("В ответе API нет списка вакансий", response=response)
+        if self.__cache is not None:
+            self.__cache.put(
+                self.__url,
+                params,
+                data,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified")
+            )
+        return data
+
+    def __request(self, headers: dict, params: dict) -> requests.Response:
+        """Приватный метод выполнения запроса с ограничением частоты и повторами.
+        При ошибке соединения и ответах 429/5xx запрос повторяется с экспоненциально растущей
+        задержкой со случайным разбросом, а заголовок Retry-After соблюдается.
+        Недоступным API считается только при ошибке соединения или ответе 429/5xx после всех повторов:
+        ответ 4xx относится к самому запросу и не мешает запросам других экземпляров."""
+
+        get = self._get_session(self.__concurrency).get
+        for attempt in range(self.MAX_RETRIES + 1):
+            last_attempt = attempt == self.MAX_RETRIES
+            self._rate_limiter.acquire()
+            try:
+                response = get(url=self.__url, headers=headers, params=params)
+            except requests.exceptions.RequestException:
+                if last_attempt:
+                    self._health.mark(False)
+                    raise
+                time.sleep(self.__backoff(attempt))
+                continue
+
+            if response.status_code not in self.RETRY_STATUSES:
+                self._rate_limiter.on_success()
+                break
+            if response.status_code == 429:
+                self._rate_limiter.on_throttle()
+            if last_attempt:
+                break
+            time.sleep(max(self.__backoff(attempt), self.__retry_after(response)))
+
+        self._health.mark(response.status_code not in self.RETRY_STATUSES)
+        response.raise_for_status()
+        return response
+
+    def __backoff(self, attempt: int) -> float:
+        """Приватный метод расчета задержки перед повтором: экспоненциальный рост
+        со случайным разбросом (full jitter)."""
+
+        return random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt))
 
-    def _get_connection(self) -> bool | None:
-        """Метод подключения к API сайта HH.ru"""
+    def __retry_after(self, response: requests.Response) -> float:
+        """Приватный метод получения задержки из заголовка Retry-After (в секундах или в виде даты)."""
 
+        value = response.headers.get("Retry-After")
+        if not value:
+            return 0.0
         try:
-            response = requests.get(url=self.__url, headers=self.__headers)
-            if response.status_code == 200:
-                return True
-        except requests.exceptions.RequestException:
-            print("Ошибка соединения с сайтом")
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return 0.0
+        return min(self.BACKOFF_MAX, max(0.0, delay))
+
+    @staticmethod
+    def __validators(entry: dict) -> dict[str, str]:
+        """Приватный метод формирования заголовков условного запроса по сохраненному ответу."""
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def __last_page(self, data: dict) -> int:
+        """Приватный метод определения номера страницы, после которой загрузку можно прекратить.
+        Если API не вернул количество страниц (pages), загружаются все доступные страницы."""
+
+        pages: int = data.get('pages', self.MAX_PAGES)
+        return min(pages, self.MAX_PAGES)
 
     def load_vacancies(self, keyword: str) -> None:
         """Метод для загрузки списка словарей вакансий с сайта hh.ru
@@ -29,11 +204,317 @@ class HH(Parser):
         и добавление вакансий."""
 
         if self._get_connection():
-            self.__params['text'] = keyword
-            while self.__params.get('page') != 20:
-                response = requests.get(url=self.__url, headers=self.__headers, params=self.__params)
-                vacancies = response.json()['items']
+            for vacancies in self.__iter_pages(keyword):
                 self.vacancies.extend(vacancies)
-                self.__params['page'] += 1
         else:
             print("Ошибка загрузки данных с вакансиями.")
+
+    def iter_vacancies(self, keyword: str) -> Iterator[Vacancy]:
+        """Метод-генератор, который постранично загружает вакансии с сайта hh.ru,
+        отсеивает вакансии с зарплатой не в рублях и возвращает объекты класса Vacancy
+        по одному. В отличие от load_vacancies, вакансии не накапливаются в self.vacancies,
+        поэтому в памяти одновременно находится примерно одна страница выдачи."""
+
+        if not self._get_connection():
+            print("Ошибка загрузки данных с вакансиями.")
+            return
+
+        for vacancies in self.__iter_pages(keyword):
+            yield from self.__rur_vacancy_objects(vacancies)
+
+    def load_incremental(self, keyword: str, watermarks: WatermarkStore) -> None:
+        """Метод для загрузки только тех вакансий, которые опубликованы после предыдущей загрузки
+        по этому ключевому слову. Вакансии запрашиваются отсортированными по дате публикации,
+        начиная с самых новых, и загрузка прекращается на первой уже известной вакансии.
+        Если новых вакансий больше, чем API отдает по одному запросу, запрос разбивается на части
+        по дате публикации. После загрузки отметка в watermarks сдвигается на время публикации
+        самой новой вакансии; если загрузить удалось не все новые вакансии, отметка не сдвигается.
+        Страницы неразбитого запроса загружаются последовательно при любом concurrency: при параллельной
+        загрузке все страницы запрашивались бы сразу, и остановка на известной вакансии не экономила бы запросов."""
+
+        if not self._get_connection():
+            print("Ошибка загрузки данных с вакансиями.")
+            return
+
+        since = watermarks.get(keyword)
+        newest = since
+        params = {**self.__params, 'text': keyword, 'page': 0, 'order_by': 'publication_time'}
+        if since is not None:
+            params['date_from'] = since.isoformat()
+
+        truncated = self.partitions_truncated
+        try:
+            first = self.__fetch_page(params)
+            self.requests_issued += 1
+            for published_at, vac in self.__iter_new(params, first, since):
+                self.vacancies.append(vac)
+                if newest is None or published_at > newest:
+                    newest = published_at
+        except requests.exceptions.RequestException:
+            # Отметка не сдвигается, чтобы при следующей загрузке не пропустить недогруженные вакансии
+            print("Ошибка соединения с сайтом")
+            return
+
+        # Без разбиения загружаются только самые новые вакансии, а при разбиении могут остаться части,
+        # которые не удалось разделить дальше; более старые вакансии в обоих случаях остаются пропуском
+        if self.__partition:
+            complete = self.partitions_truncated == truncated
+        else:
+            complete = not self.__over_cap(first)
+        if not complete:
+            print("Загружены не все новые вакансии, отметка загрузки не сдвигается")
+        elif newest is not None and newest != since:
+            watermarks.set(keyword, newest)
+
+    def __iter_new(
+            self,
+            params: dict,
+            first: dict,
+            since: datetime | None
+    ) -> Iterator[tuple[datetime, dict]]:
+        """Приватный метод-генератор, который возвращает вакансии, опубликованные позже since,
+        вместе с временем их публикации. Выдача одного запроса упорядочена от новых вакансий к старым,
+        поэтому загрузка прекращается на первой известной вакансии; части разбитого запроса
+        загружаются полностью."""
+
+        if self.__partition and self.__over_cap(first):
+            for vacancies in self.__iter_partitions(params, since):
+                for vac in vacancies:
+                    published_at = datetime.fromisoformat(vac['published_at'])
+                    if since is None or published_at > since:
+                        yield published_at, vac
+            return
+
+        pages = self.__iter_next_pages(params, first, sequential=True)
+        for vacancies in itertools.chain([first['items']], pages):
+            for vac in vacancies:
+                published_at = datetime.fromisoformat(vac['published_at'])
+                if since is not None and published_at <= since:
+                    pages.close()
+                    self.requests_skipped += self.MAX_PAGES - max(params['page'], 1)
+                    return
+                yield published_at, vac
+
+    def load_many(self, keywords: list[str]) -> None:
+        """Метод для загрузки вакансий сразу по нескольким ключевым словам.
+        Вакансии, найденные по нескольким запросам, добавляются в self.vacancies только один раз
+        (совпадение определяется по id или alternate_url вакансии)."""
+
+        if self._get_connection():
+            self.vacancies.extend(self.__iter_unique(keywords))
+        else:
+            print("Ошибка загрузки данных с вакансиями.")
+
+    def iter_many(self, keywords: list[str]) -> Iterator[Vacancy]:
+        """Метод-генератор для загрузки вакансий сразу по нескольким ключевым словам.
+        Повторяющиеся вакансии отбрасываются до преобразования в объекты класса Vacancy,
+        вакансии с зарплатой не в рублях отсеиваются."""
+
+        if not self._get_connection():
+            print("Ошибка загрузки данных с вакансиями.")
+            return
+
+        yield from self.__rur_vacancy_objects(self.__iter_unique(keywords))
+
+    def __iter_unique(self, keywords: list[str]) -> Iterator[dict]:
+        """Приватный метод-генератор, который возвращает вакансии по всем ключевым словам,
+        пропуская вакансии, уже найденные по предыдущим запросам или уже имеющиеся в self.vacancies."""
+
+        seen = {self.__vacancy_key(vac) for vac in self.vacancies}
+        for keyword in keywords:
+            for vacancies in self.__iter_pages(keyword):
+                for vac in vacancies:
+                    key = self.__vacancy_key(vac)
+                    if key not in seen:
+                        seen.add(key)
+                        yield vac
+
+    @staticmethod
+    def __vacancy_key(vac: dict) -> str | None:
+        """Приватный метод получения ключа вакансии для поиска дубликатов."""
+
+        return vac.get("id") or vac.get("alternate_url")
+
+    @staticmethod
+    def __rur_vacancy_objects(vacancies: Iterable[dict]) -> Iterator[Vacancy]:
+        """Приватный метод-генератор, который отсеивает вакансии с зарплатой не в рублях
+        и преобразует остальные в объекты класса Vacancy."""
+
+        for vac in vacancies:
+            if vac["salary"]["currency"] == "RUR":
+                yield Vacancy(
+                    vac["name"],
+                    vac["salary"],
+                    vac["alternate_url"],
+                    vac["employer"],
+                    vac["snippet"],
+                    vac["experience"],
+                    vac["employment"]
+                )
+
+    def __iter_pages(self, keyword: str) -> Iterator[list[dict]]:
+        """Приватный метод-генератор, который возвращает списки вакансий постранично.
+        Загрузка прекращается после последней страницы выдачи из метаданных pages.
+        Если вакансий больше, чем API отдает по одному запросу, запрос разбивается на части."""
+
+        self.__params['text'] = keyword
+        self.__params['page'] = 0
+
+        try:
+            first = self.__fetch_page(self.__params)
+            self.requests_issued += 1
+            if self.__partition and self.__over_cap(first):
+                yield from self.__iter_partitions(self.__params)
+                return
+            yield first['items']
+            yield from self.__iter_next_pages(self.__params, first)
+        except requests.exceptions.RequestException:
+            print("Ошибка соединения с сайтом")
+
+    def __iter_next_pages(
+            self,
+            params: dict,
+            first: dict,
+            sequential: bool = False
+    ) -> Generator[list[dict], None, None]:
+        """Приватный метод-генератор, который загружает страницы выдачи, следующие за первой.
+        При concurrency = 1 или sequential = True страницы загружаются последовательно (следующая -
+        только когда запрошена), иначе - параллельно через общий пул соединений.
+        Страницы возвращаются в порядке следования."""
+
+        last_page = self.__last_page(first)
+        params['page'] = 1
+
+        if self.__concurrency == 1 or sequential:
+            while params['page'] < last_page:
+                data = self.__fetch_page(params)
+                last_page = self.__last_page(data)
+                params['page'] += 1
+                self.requests_issued += 1
+                yield data['items']
+        else:
+            pages = [{**params, 'page': page} for page in range(1, last_page)]
+            params['page'] = max(last_page, 1)
+            self.requests_issued += len(pages)
+            with ThreadPoolExecutor(max_workers=self.__concurrency) as executor:
+                for data in executor.map(self.__fetch_page, pages):
+                    yield data['items']
+
+        self.requests_skipped += self.MAX_PAGES - params['page']
+
+    def __over_cap(self, data: dict) -> bool:
+        """Приватный метод проверки, превышает ли количество найденных вакансий (found)
+        количество вакансий, которое API отдает по одному запросу."""
+
+        found: int = data.get('found', 0)
+        per_page: int = self.__params['per_page']
+        return found > self.MAX_PAGES * per_page
+
+    def __iter_partitions(self, query: dict, since: datetime | None = None) -> Iterator[list[dict]]:
+        """Приватный метод-генератор загрузки выдачи запроса query, разбитой на части по дате публикации
+        так, чтобы в каждой части было не больше вакансий, чем API отдает по одному запросу. Сначала выдача
+        делится на последние PARTITION_DAYS дней и более старые вакансии (или, если задано since, берутся
+        вакансии начиная с since), затем слишком большие части делятся пополам.
+        Первые страницы частей и остальные страницы загружаются через общий пул (concurrency запросов
+        одновременно) и возвращаются по мере загрузки, а вакансии, попавшие в несколько частей на их
+        границах, возвращаются только один раз. Части, которые больше MAX_PAGES страниц, но разделить
+        их дальше нельзя, загружаются не полностью и учитываются в self.partitions_truncated."""
+
+        # Верхняя граница округляется до часа вперед, чтобы повторные запросы попадали в кеш
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        span = timedelta(days=self.PARTITION_DAYS)
+        windows = [(since, now)] if since is not None else [(None, now - span), (now - span, now)]
+        seen: set[str | None] = set()
+        # Загружаемая страница -> границы части для первой страницы части или None для остальных страниц
+        pending: dict[Future[dict], tuple[datetime | None, datetime] | None] = {}
+        partitions = 0
+        executor = ThreadPoolExecutor(max_workers=self.__concurrency)
+
+        def submit(params: dict, window: tuple[datetime | None, datetime] | None) -> None:
+            pending[executor.submit(self.__fetch_page, params)] = window
+            self.requests_issued += 1
+
+        try:
+            for bounds in windows:
+                submit(self.__window_params(query, *bounds), bounds)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window = pending.pop(future)
+                    data = future.result()
+                    if window is not None:
+                        children = self.__split(*window, data, partitions + len(pending))
+                        for child in children:
+                            submit(self.__window_params(query, *child), child)
+                        if children:
+                            continue
+                        # Первая страница части: загружаем остальные страницы этой части
+                        partitions += 1
+                        for params in self.__next_pages(self.__window_params(query, *window), data):
+                            submit(params, None)
+                    yield self.__unique(data['items'], seen)
+        finally:
+            # Запросы, которые еще не начались, отменяются при ошибке или прекращении перебора
+            executor.shutdown(cancel_futures=True)
+
+    def __truncated(self, date_from: datetime | None, date_to: datetime) -> None:
+        """Приватный метод учета части выдачи, которую нельзя разделить дальше (достигнуты MAX_PARTITIONS
+        или MIN_PARTITION), хотя вакансий в ней больше, чем API отдает по одному запросу."""
+
+        self.partitions_truncated += 1
+        period = f"{date_from.isoformat()} - {date_to.isoformat()}" if date_from else f"до {date_to.isoformat()}"
+        print(f"Выдача за период {period} не разбивается дальше, загружены не все вакансии")
+
+    def __next_pages(self, params: dict, first: dict) -> list[dict]:
+        """Приватный метод получения параметров запросов страниц, следующих за первой страницей first."""
+
+        if not first['items']:
+            return []
+        last_page = self.__last_page(first)
+        self.requests_skipped += self.MAX_PAGES - last_page
+        return [{**params, 'page': page} for page in range(1, last_page)]
+
+    @classmethod
+    def __unique(cls, vacancies: list[dict], seen: set) -> list[dict]:
+        """Приватный метод отбора вакансий, которых еще нет в seen (seen дополняется ими)."""
+
+        result = []
+        for vac in vacancies:
+            key = cls.__vacancy_key(vac)
+            if key not in seen:
+                seen.add(key)
+                result.append(vac)
+        return result
+
+    @staticmethod
+    def __window_params(query: dict, date_from: datetime | None, date_to: datetime) -> dict:
+        """Приватный метод получения параметров запроса первой страницы части выдачи."""
+
+        params = {**query, 'page': 0, 'date_to': date_to.isoformat()}
+        if date_from is not None:
+            params['date_from'] = date_from.isoformat()
+        return params
+
+    def __split(
+            self,
+            date_from: datetime | None,
+            date_to: datetime,
+            first: dict,
+            count: int
+    ) -> list[tuple[datetime | None, datetime]]:
+        """Приватный метод разбиения части выдачи [date_from, date_to] с первой страницей first.
+        Возвращает границы двух новых частей или пустой список, если часть делить не нужно или нельзя
+        (count - количество уже найденных и еще проверяемых частей). Часть, которую нужно, но нельзя
+        разделить, учитывается как загруженная не полностью."""
+
+        if not self.__over_cap(first):
+            return []
+        splittable = date_from is None or date_to - date_from > self.MIN_PARTITION
+        if not splittable or count >= self.MAX_PARTITIONS:
+            self.__truncated(date_from, date_to)
+            return []
+        if date_from is None:
+            span = timedelta(days=self.PARTITION_DAYS)
+            return [(None, date_to - span), (date_to - span, date_to)]
+        middle = (date_from + (date_to - date_from) / 2).replace(microsecond=0)
+        return [(date_from, middle), (middle, date_to)]
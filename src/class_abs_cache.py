@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+class ResponseCache(ABC):
+    """Абстрактный класс кеша ответов API. Является родительским для
+    класса FileResponseCache."""
+
+    @abstractmethod
+    def __init__(self) -> None:
+        """Конструктор класса"""
+
+        pass
+
+    @abstractmethod
+    def get(self, url: str, params: dict) -> dict[str, Any] | None:
+        """Абстрактный метод получения сохраненного ответа по адресу и параметрам запроса.
+        Возвращает словарь с ключами body, etag, last_modified, stored_at и fresh
+        или None, если ответа нет в кеше."""
+
+        pass
+
+    @abstractmethod
+    def put(self, url: str, params: dict, body: Any, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Абстрактный метод сохранения ответа по адресу и параметрам запроса."""
+
+        pass
+
+    @abstractmethod
+    def refresh(self, url: str, params: dict) -> None:
+        """Абстрактный метод продления срока жизни ответа, подтвержденного сервером (304 Not Modified)."""
+
+        pass
@@ -27,3 +27,10 @@ class FileWorker(ABC):
         """Абстрактный метод удаления данных из файла."""
 
         pass
+
+    def delete_many(self, urls: list[str]) -> None:
+        """Метод удаления данных о нескольких вакансиях. По умолчанию вызывает delete_data
+        для каждой ссылки, дочерние классы могут удалять вакансии одной операцией."""
+
+        for url in urls:
+            self.delete_data(url)
@@ -0,0 +1,109 @@
+import asyncio
+
+import aiohttp
+from src.class_Parser import Parser
+from src.class_health import ApiHealth
+
+
+class AsyncHH(Parser):
+    """Асинхронный класс для работы с API HeadHunter. Повторяет контракт класса HH,
+    но загружает вакансии в цикле событий asyncio."""
+
+    # Максимальное количество страниц, которое отдает API HH.ru
+    MAX_PAGES = 20
+
+    # Общее для всех экземпляров состояние доступности API
+    _health = ApiHealth()
+
+    def __init__(
+            self,
+            session: aiohttp.ClientSession,
+            semaphore: asyncio.Semaphore | None = None,
+            url: str = 'https://api.hh.ru/vacancies'
+    ) -> None:
+        """Конструктор класса AsyncHH.
+        session - общая сессия aiohttp, через которую идут все запросы;
+        semaphore - общий для всех поисков ограничитель количества одновременных запросов;
+        url - адрес API (переопределяется, например, для локального тестового сервера)."""
+
+        self.__session = session
+        self.__semaphore = semaphore or asyncio.Semaphore(self.MAX_PAGES)
+        self.__url = url
+        self.__headers = {'User-Agent': 'HH-User-Agent'}
+        self.__params: dict[str, str | int] = {'text': '', 'per_page': 100, 'only_with_salary': 'true'}
+        self.vacancies: list[dict] = []
+        # Статистика запросов: сколько страниц загружено и сколько пропущено благодаря метаданным
+        self.requests_issued = 0
+        self.requests_skipped = 0
+
+    async def _get_connection(self) -> bool:
+        """Метод проверки доступности API сайта HH.ru. Отдельный запрос не выполняется:
+        используется общее состояние, сохраненное по результатам запросов за страницами."""
+
+        return not self._health.is_down()
+
+    async def __fetch_page(self, page: int) -> dict:
+        """Приватный метод загрузки одной страницы вакансий.
+        Возвращает ответ API целиком, вместе с метаданными пагинации.
+        Ответ 4xx, кроме 429, не считается недоступностью API. Ответ без списка вакансий
+        или с некорректным JSON вызывает aiohttp.ClientPayloadError, как и ошибки соединения."""
+
+        params = {**self.__params, 'page': page}
+        try:
+            async with self.__semaphore:
+                async with self.__session.get(self.__url, headers=self.__headers, params=params) as response:
+                    response.raise_for_status()
+                    data = await response.json()
+        except aiohttp.ClientResponseError as error:
+            self._health.mark(error.status < 500 and error.status != 429)
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._health.mark(False)
+            raise
+        except ValueError:
+            # Сервер ответил, но тело ответа не является JSON
+            data = None
+        self._health.mark(True)
+        if not isinstance(data, dict) or 'items' not in data:
+            raise aiohttp.ClientPayloadError("В ответе API нет списка вакансий")
+        return data
+
+    async def load_vacancies(self, keyword: str) -> None:
+        """Метод для асинхронной загрузки списка словарей вакансий с сайта hh.ru
+        keyword - ключевое слово или слова, по которым будет произведен поиск
+        и добавление вакансий. Вакансии добавляются в порядке следования страниц.
+        Первая страница загружается отдельно, чтобы узнать количество страниц в выдаче."""
+
+        if await self._get_connection():
+            self.__params['text'] = keyword
+            try:
+                first = await self.__fetch_page(0)
+                last_page = max(1, min(first.get('pages', self.MAX_PAGES), self.MAX_PAGES))
+                pages = await asyncio.gather(*(self.__fetch_page(page) for page in range(1, last_page)))
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                # Ошибка одного поиска не прерывает остальные поиски search_many
+                print("Ошибка соединения с сайтом")
+                return
+            for data in [first, *pages]:
+                self.vacancies.extend(data['items'])
+            self.requests_issued += last_page
+            self.requests_skipped += self.MAX_PAGES - last_page
+        else:
+            print("Ошибка загрузки данных с вакансиями.")
+
+
+async def search_many(
+        keywords: list[str],
+        max_in_flight: int = 10,
+        url: str = 'https://api.hh.ru/vacancies'
+) -> dict[str, list[dict]]:
+    """Функция для одновременного поиска вакансий по нескольким ключевым словам
+    в одном цикле событий. max_in_flight - общее ограничение количества одновременных
+    запросов для всех поисков."""
+
+    semaphore = asyncio.Semaphore(max_in_flight)
+    async with aiohttp.ClientSession() as session:
+        searches = [AsyncHH(session, semaphore, url) for _ in keywords]
+        await asyncio.gather(*(hh.load_vacancies(keyword) for hh, keyword in zip(searches, keywords)))
+
+    return {keyword: hh.vacancies for hh, keyword in zip(searches, keywords)}
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any
+from src.class_abs_cache import ResponseCache
+
+
+class FileResponseCache(ResponseCache):
+    """Класс для хранения ответов API на диске. Ответ хранится в отдельном JSON-файле,
+    имя которого вычисляется по адресу и параметрам запроса. Является дочерним от
+    класса ResponseCache."""
+
+    def __init__(self, directory: str = "data/cache", ttl: float = 300.0, max_bytes: int = 50 * 1024 * 1024):
+        """Конструктор класса FileResponseCache.
+        directory - папка для файлов кеша;
+        ttl - время в секундах, в течение которого ответ отдается без обращения к API;
+        max_bytes - максимальный размер кеша, при превышении удаляются давно не использованные ответы."""
+
+        self.__directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        os.makedirs(self.__directory, exist_ok=True)
+
+    def __path(self, url: str, params: dict) -> str:
+        """Приватный метод получения пути к файлу кеша для адреса и параметров запроса."""
+
+        key = json.dumps([url, params], sort_keys=True, ensure_ascii=False)
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.__directory, f"{name}.json")
+
+    def get(self, url: str, params: dict) -> dict[str, Any] | None:
+        """Метод получения сохраненного ответа. Возвращает словарь с ключами body, etag,
+        last_modified, stored_at и fresh (True, если срок жизни ответа не истек)
+        или None, если ответа нет в кеше."""
+
+        path = self.__path(url, params)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry: dict[str, Any] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # Обновляем время последнего обращения для вытеснения давно не использованных ответов
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        entry["fresh"] = time.time() - entry["stored_at"] < self.ttl
+        return entry
+
+    def put(self, url: str, params: dict, body: Any, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Метод сохранения ответа вместе с заголовками ETag и Last-Modified для повторной проверки."""
+
+        entry = {"body": body, "etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        self.__write(self.__path(url, params), entry)
+        self.__evict()
+
+    def refresh(self, url: str, params: dict) -> None:
+        """Метод продления срока жизни ответа, который сервер подтвердил статусом 304 Not Modified."""
+
+        entry = self.get(url, params)
+        if entry is not None:
+            del entry["fresh"]
+            entry["stored_at"] = time.time()
+            self.__write(self.__path(url, params), entry)
+
+    @staticmethod
+    def __write(path: str, entry: dict) -> None:
+        """Приватный метод записи ответа через временный файл, чтобы не оставлять частично записанных файлов."""
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def __evict(self) -> None:
+        """Приватный метод удаления давно не использованных ответов при превышении max_bytes."""
+
+        files = []
+        total = 0
+        for entry in os.scandir(self.__directory):
+            if entry.name.endswith(".json"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
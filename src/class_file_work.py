@@ -1,71 +1,425 @@
+import copy
 import json
+import os
+import secrets
+import textwrap
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 from src.class_abs_file_work import FileWorker
 from src.class_vacancies import Vacancy
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Контекстный менеджер для исключительной рекомендательной блокировки файла path.
+    Блокировка действует между процессами и между потоками одного процесса."""
+
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def atomic_write(path: str) -> Iterator[Any]:
+    """Контекстный менеджер для записи файла через временный файл в той же папке.
+    Временный файл заменяет path только после успешной записи, поэтому при сбое
+    в процессе записи файл path остается прежним. Права доступа прежнего файла сохраняются."""
+
+    directory = os.path.dirname(os.path.abspath(path))
+    # Временный файл создается с правами 0o666 за вычетом маски процесса, как при обычном open
+    while True:
+        tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{secrets.token_hex(8)}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0), 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # Права прежнего файла переносятся на новый
+            try:
+                os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
 
 class JSONFileWorker(FileWorker):
     """Класс для загрузки, получения и удаления данных о полученных вакансиях в файл в формате JSON.
-    Является дочерним от класса FileWorker."""
+    Является дочерним от класса FileWorker.
+    Рядом с файлом хранятся индекс (filename.idx) с позицией каждой вакансии в файле по ключу
+    alternate_url и список удаленных вакансий (filename.deleted). Удаление только дописывает ссылку
+    в список удаленных, а сами записи убираются из файла при следующем сохранении.
+    Чтение и запись выполняются под блокировкой (filename.lock)."""
+
+    # Наибольшая длина одной записи в символах при последовательном чтении (iter_data):
+    # запись длиннее считается повреждением файла, поэтому объем памяти ограничен
+    MAX_RECORD_SIZE = 1 << 24
+
+    # Общий для всех экземпляров кеш разобранных JSON-файлов:
+    # путь к файлу -> ((время изменения, размер, inode), данные)
+    __read_cache: dict[str, tuple[tuple[int, int, int], Any]] = {}
 
     def __init__(self, filename: str = "data/vacancy.json"):
         """Конструктор класса JSONFileWorker."""
 
         self.__filename = filename
+        self.__index_filename = f"{filename}.idx"
+        self.__deleted_filename = f"{filename}.deleted"
+        self.__lock_filename = f"{filename}.lock"
+        # Прочитанные индекс и список удаленных вакансий, чтобы не читать их при каждом удалении
+        self.__index: dict[str, list[int]] | None = None
+        self.__index_stat: tuple[int, int, int] | None = None
+        self.__deleted: set[str] = set()
+        self.__deleted_header: bytes | None = None
+        self.__deleted_offset = 0
 
-    def get_data(self) -> Any | None:
-        """Метод получения данных о вакансиях из JSON-файла."""
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Метод очистки общего кеша разобранных JSON-файлов."""
+
+        cls.__read_cache.clear()
+
+    @staticmethod
+    def __stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+        """Приватный метод получения признаков изменения файла: время изменения, размер и inode."""
+
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def __parse(self) -> tuple[tuple[int, int, int], Any]:
+        """Приватный метод чтения данных из JSON-файла. Возвращает признаки изменения файла и данные.
+        Разобранные данные кешируются для всего процесса и используются повторно, пока у файла
+        не изменились время изменения, размер или inode.
+        Возвращаемый список и записи в нем общие для всех вызовов, поэтому изменять их нельзя."""
 
-        # Если файл существует, читаем данные
+        path = os.path.abspath(self.__filename)
+        key = self.__stat_key(os.stat(path))
+        cached = self.__read_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.__read_cache[path] = (key, data)
+        return key, data
+
+    @staticmethod
+    def __deleted_header_for(data_key: tuple[int, int, int]) -> bytes:
+        """Приватный метод получения первой строки списка удаленных вакансий: признаков версии
+        файла с вакансиями, к которой относится список."""
+
+        return ("# " + " ".join(map(str, data_key)) + "\n").encode("utf-8")
+
+    def __reset_deleted(self, header: bytes | None) -> None:
+        """Приватный метод сброса прочитанного списка удаленных вакансий."""
+
+        self.__deleted = set()
+        self.__deleted_header = header
+        self.__deleted_offset = len(header or b"")
+
+    def __read_deleted(self, data_key: tuple[int, int, int]) -> set[str]:
+        """Приватный метод получения ссылок на удаленные вакансии для версии файла data_key.
+        Список удаленных вакансий только дописывается, поэтому читаются лишь строки, появившиеся
+        с момента предыдущего чтения. Список, оставшийся от прежней версии файла (его первая строка
+        не совпадает с data_key), не учитывается."""
+
+        header = self.__deleted_header_for(data_key)
         try:
-            with open(self.__filename, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-            return existing_data
+            f = open(self.__deleted_filename, "rb")
+        except FileNotFoundError:
+            self.__reset_deleted(None)
+            return self.__deleted
+
+        with f:
+            if f.readline() != header:
+                self.__reset_deleted(None)
+                return self.__deleted
+            if header != self.__deleted_header or os.fstat(f.fileno()).st_size < self.__deleted_offset:
+                self.__reset_deleted(header)
+            f.seek(self.__deleted_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                self.__deleted.add(line[:-1].decode("utf-8"))
+                self.__deleted_offset += len(line)
+        return self.__deleted
+
+    def __read_index(self) -> dict[str, list[int]] | None:
+        """Приватный метод чтения индекса: для каждой ссылки - позиция и длина записи в файле (в байтах).
+        Если индекса нет или он устарел, индекс строится заново перезаписью файла."""
+
+        try:
+            index_stat = os.stat(self.__index_filename)
+            if index_stat.st_mtime_ns >= os.stat(self.__filename).st_mtime_ns:
+                stat_key = (index_stat.st_mtime_ns, index_stat.st_size, index_stat.st_ino)
+                if stat_key != self.__index_stat:
+                    with open(self.__index_filename, "r", encoding="utf-8") as f:
+                        self.__index = json.load(f)
+                    self.__index_stat = stat_key
+                return self.__index
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+        try:
+            key, existing_data = self.__parse()
         except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        deleted = self.__read_deleted(key)
+        return self.__write([v for v in existing_data if v.get("alternate_url") not in deleted])
+
+    def __write(self, vacancies: list[dict]) -> dict[str, list[int]]:
+        """Приватный метод записи списка вакансий в JSON-файл в том же формате, что и json.dump
+        с indent=4, с построением индекса позиций записей. Список удаленных вакансий очищается.
+        Файл и индекс записываются через временные файлы, поэтому при сбое не повреждаются."""
+
+        index = {}
+        with atomic_write(self.__filename) as f:
+            if not vacancies:
+                f.write(b"[]")
+            else:
+                f.write(b"[\n")
+                for i, vacancy in enumerate(vacancies):
+                    if i:
+                        f.write(b",\n")
+                    chunk = textwrap.indent(json.dumps(vacancy, ensure_ascii=False, indent=4), "    ").encode("utf-8")
+                    if vacancy.get("alternate_url"):
+                        index[vacancy["alternate_url"]] = [f.tell(), len(chunk)]
+                    f.write(chunk)
+                f.write(b"\n]")
+
+        with atomic_write(self.__index_filename) as f:
+            f.write(json.dumps(index, ensure_ascii=False).encode("utf-8"))
+
+        # Записанные данные сразу помещаются в кеш, чтобы не разбирать файл при следующем чтении
+        path = os.path.abspath(self.__filename)
+        key = self.__stat_key(os.stat(path))
+        self.__read_cache[path] = (key, vacancies)
+        # Новый список удаленных вакансий начинается с признаков новой версии файла
+        header = self.__deleted_header_for(key)
+        with atomic_write(self.__deleted_filename) as f:
+            f.write(header)
+        self.__reset_deleted(header)
+        return index
+
+    def get_data(self) -> Any | None:
+        """Метод получения данных о вакансиях из JSON-файла."""
+
+        if not os.path.exists(self.__filename):
             print("Файл не существует или пустой/поврежден.")
+            return None
+
+        with file_lock(self.__lock_filename):
+            # Повторно файл разбирается, только если он изменился
+            try:
+                key, existing_data = self.__parse()
+            except (FileNotFoundError, json.JSONDecodeError):
+                print("Файл не существует или пустой/поврежден.")
+                return None
+
+            if not isinstance(existing_data, list):
+                return copy.deepcopy(existing_data)
+            # Убираем вакансии, отмеченные как удаленные. Возвращаются копии записей из кеша,
+            # чтобы их изменение вызывающим кодом не попало в кеш и при следующей записи в файл
+            deleted = self.__read_deleted(key)
+            return [dict(v) for v in existing_data if v.get("alternate_url") not in deleted]
+
+    def iter_data(self, chunk_size: int = 1 << 16) -> Iterator[Vacancy]:
+        """Метод последовательного чтения вакансий из JSON-файла без загрузки всего файла в память.
+        Файл читается частями по chunk_size символов, а записи разбираются по одной, поэтому в памяти
+        находятся только текущая часть файла и одна вакансия. Удаленные вакансии пропускаются."""
+
+        opened = self.__open_version()
+        if opened is None:
+            print("Файл не существует или пустой/поврежден.")
+            return
+        f, deleted = opened
+        decoder = json.JSONDecoder()
+
+        with f:
+            buffer, pos = "", 0
+            while True:
+                buffer, pos = self.__skip_separators(f, buffer, pos, chunk_size)
+                if pos >= len(buffer) or buffer[pos] == "]":
+                    return
+                # Каждая запись - объект; любой другой символ означает, что файл поврежден
+                if buffer[pos] != "{":
+                    print("Файл не существует или пустой/поврежден.")
+                    return
+
+                try:
+                    record, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Запись не поместилась в прочитанную часть файла - дочитываем следующую
+                    refilled = self.__refill(f, buffer, pos, chunk_size)
+                    if refilled is None:
+                        print("Файл не существует или пустой/поврежден.")
+                        return
+                    buffer, pos = refilled, 0
+                    continue
+
+                if record.get("alternate_url") not in deleted:
+                    yield Vacancy.from_dict(record)
+
+    def __open_version(self) -> tuple[Any, set[str]] | None:
+        """Приватный метод открытия JSON-файла для последовательного чтения вместе со ссылками
+        на удаленные вакансии этой версии файла. Открытый файл остается прежней версией, даже если
+        другой процесс перезапишет его во время чтения. Возвращает None, если файла нет."""
+
+        if not os.path.exists(self.__filename):
+            return None
+        with file_lock(self.__lock_filename):
+            try:
+                f = open(self.__filename, "r", encoding="utf-8")
+            except FileNotFoundError:
+                return None
+            return f, set(self.__read_deleted(self.__stat_key(os.fstat(f.fileno()))))
+
+    @staticmethod
+    def __skip_separators(f: Any, buffer: str, pos: int, chunk_size: int) -> tuple[str, int]:
+        """Приватный метод пропуска пробелов, открывающей скобки списка и запятых между записями.
+        При необходимости дочитывает следующие части файла. Возвращает буфер и позицию начала
+        следующей записи; позиция в конце буфера означает конец файла."""
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n[,":
+                pos += 1
+            if pos < len(buffer):
+                return buffer, pos
+            buffer, pos = f.read(chunk_size), 0
+            if not buffer:
+                return buffer, pos
+
+    def __refill(self, f: Any, buffer: str, pos: int, chunk_size: int) -> str | None:
+        """Приватный метод дочитывания файла к неразобранному остатку буфера, начиная с позиции pos.
+        Объем дочитываемой части растет вместе с остатком, поэтому длинная запись копируется
+        в буфер линейное число раз. Возвращает None, если файл закончился или запись длиннее
+        MAX_RECORD_SIZE символов: такой файл считается поврежденным."""
+
+        rest = buffer[pos:]
+        if len(rest) >= self.MAX_RECORD_SIZE:
+            return None
+        chunk: str = f.read(max(chunk_size, len(rest)))
+        if not chunk:
+            return None
+        return rest + chunk
+
+    def find_data(self, url: str) -> dict | None:
+        """Метод получения данных об одной вакансии по ключу alternate_url.
+        Запись читается по позиции из индекса, без чтения всего файла."""
+
+        if not os.path.exists(self.__filename):
+            return None
+
+        with file_lock(self.__lock_filename):
+            index = self.__read_index()
+            if not index or url not in index:
+                return None
+            if url in self.__read_deleted(self.__stat_key(os.stat(self.__filename))):
+                return None
+
+            offset, length = index[url]
+            with open(self.__filename, "rb") as f:
+                f.seek(offset)
+                record: dict = json.loads(f.read(length))
+                return record
 
     def load_data(self, vacancies: list[Vacancy]) -> None:
-        """Метод добавления данных о вакансиях в JSON-файл."""
+        """Метод добавления данных о вакансиях в JSON-файл. На время чтения и записи файл
+        блокируется, поэтому несколько процессов могут сохранять вакансии в один файл."""
 
-        # Сначала собираем все данные в список словарей
-        all_vacancies = []
+        with file_lock(self.__lock_filename):
+            # Сначала собираем все данные в список словарей
+            all_vacancies = []
+            deleted = set()
 
-        # Если файл существует, читаем старые данные
-        try:
-            with open(self.__filename, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
+            # Если файл существует, читаем старые данные
+            try:
+                key, existing_data = self.__parse()
                 if isinstance(existing_data, list):
-                    all_vacancies = existing_data
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Если файла нет или он пустой/поврежден, начинаем с пустого списка
-            all_vacancies = []
+                    all_vacancies = list(existing_data)
+                deleted = self.__read_deleted(key)
+            except FileNotFoundError:
+                # Если файла нет, начинаем с пустого списка
+                all_vacancies = []
+            except json.JSONDecodeError:
+                # Поврежденный файл не перезаписывается, а сохраняется рядом для восстановления
+                os.replace(self.__filename, f"{self.__filename}.corrupt")
+                print(f"Файл поврежден и сохранен как {self.__filename}.corrupt")
+                all_vacancies = []
 
-        # Собираем URL уже существующих вакансий, чтобы избежать дублирования
-        existing_urls = {v.get('alternate_url') for v in all_vacancies if v.get('alternate_url')}
+            # Убираем вакансии, отмеченные как удаленные
+            if deleted:
+                all_vacancies = [v for v in all_vacancies if v.get('alternate_url') not in deleted]
 
-        # Добавляем только новые уникальные вакансии
-        for v in vacancies:
-            if v.alternate_url not in existing_urls:
-                all_vacancies.append(v.to_dict())
-                existing_urls.add(v.alternate_url)  # Обновляем множество для контроля дубликатов
+            # Собираем URL уже существующих вакансий, чтобы избежать дублирования
+            existing_urls = {v.get('alternate_url') for v in all_vacancies if v.get('alternate_url')}
 
-        # Записываем весь список обратно в файл
-        with open(self.__filename, "w", encoding="utf-8") as f:
-            json.dump(all_vacancies, f, ensure_ascii=False, indent=4)
+            # Добавляем только новые уникальные вакансии
+            for v in vacancies:
+                if v.alternate_url not in existing_urls:
+                    all_vacancies.append(v.to_dict())
+                    existing_urls.add(v.alternate_url)  # Обновляем множество для контроля дубликатов
+
+            # Записываем весь список обратно в файл вместе с индексом
+            self.__write(all_vacancies)
 
     def delete_data(self, url: str) -> None:
         """Метод для удаления данных о вакансиях по ключу alternate_url из JSON-файла."""
 
-        # Если файл существует, читаем старые данные
-        try:
-            with open(self.__filename, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
+        self.delete_many([url])
 
-            # Удаляем данные по ключу alternate_url
-            existing_data = [vacancy for vacancy in existing_data if vacancy["alternate_url"] != url]
+    def delete_many(self, urls: list[str]) -> None:
+        """Метод для удаления данных о нескольких вакансиях по ключу alternate_url.
+        Наличие вакансий проверяется по индексу, а их ссылки дописываются в список удаленных,
+        поэтому стоимость удаления не зависит от размера файла."""
 
-            # Сохраняем данные обратно в файл
-            with open(self.__filename, "w", encoding="utf-8") as f:
-                json.dump(existing_data, f, ensure_ascii=False, indent=4)
-        except (FileNotFoundError, json.JSONDecodeError):
+        if not os.path.exists(self.__filename):
             print("Файла нет или он пустой/поврежден")
+            return
+
+        with file_lock(self.__lock_filename):
+            index = self.__read_index()
+            if index is None:
+                print("Файла нет или он пустой/поврежден")
+                return
+
+            key = self.__stat_key(os.stat(self.__filename))
+            deleted = self.__read_deleted(key)
+            new_deleted: dict[str, None] = {}
+            for url in urls:
+                if url in index and url not in deleted:
+                    new_deleted[url] = None
+
+            if new_deleted:
+                # Список, оставшийся от прежней версии файла, заменяется новым
+                header = self.__deleted_header_for(key)
+                if self.__deleted_header != header:
+                    with atomic_write(self.__deleted_filename) as f:
+                        f.write(header)
+                    self.__reset_deleted(header)
+                with open(self.__deleted_filename, "a", encoding="utf-8") as f:
+                    f.writelines(f"{url}\n" for url in new_deleted)
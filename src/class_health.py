@@ -0,0 +1,31 @@
+import threading
+import time
+
+
+class ApiHealth:
+    """Класс для хранения состояния доступности API. Состояние обновляется по результатам
+    обычных запросов за страницами вакансий и считается актуальным в течение ttl секунд."""
+
+    def __init__(self, ttl: float = 60.0) -> None:
+        """Конструктор класса ApiHealth.
+        ttl - время в секундах, в течение которого сохраненное состояние считается актуальным."""
+
+        self.ttl = ttl
+        self.__ok: bool | None = None
+        self.__checked_at = 0.0
+        self.__lock = threading.Lock()
+
+    def mark(self, ok: bool) -> None:
+        """Метод для сохранения результата очередного запроса к API."""
+
+        with self.__lock:
+            self.__ok = ok
+            self.__checked_at = time.monotonic()
+
+    def is_down(self) -> bool:
+        """Метод возвращает True, если последний запрос к API завершился ошибкой
+        и это состояние еще не устарело."""
+
+        with self.__lock:
+            fresh = time.monotonic() - self.__checked_at < self.ttl
+            return fresh and self.__ok is False
@@ -0,0 +1,200 @@
+import json
+import os
+import threading
+import uuid
+from typing import Any
+from src.class_abs_file_work import FileWorker
+from src.class_file_work import atomic_write, file_lock
+from src.class_vacancies import Vacancy
+
+
+class JSONLFileWorker(FileWorker):
+    """Класс для загрузки, получения и удаления данных о вакансиях в файле формата JSON Lines
+    (одна вакансия в строке). Новые вакансии дописываются в конец файла, а ссылки на уже
+    сохраненные вакансии хранятся в отдельном индексном файле, поэтому сохранение не требует
+    чтения и перезаписи всего файла. Запись и сжатие файла выполняются под блокировкой
+    (filename.lock), поэтому файл могут использовать несколько процессов.
+    Является дочерним от класса FileWorker."""
+
+    def __init__(self, filename: str = "data/vacancy.jsonl", compact_ratio: float = 0.5):
+        """Конструктор класса JSONLFileWorker.
+        filename - файл с вакансиями, рядом с ним хранится индекс ссылок (filename.idx);
+        compact_ratio - доля удаленных записей, при превышении которой файл сжимается в фоне."""
+
+        self.__filename = filename
+        self.__index_filename = f"{filename}.idx"
+        self.__lock_filename = f"{filename}.lock"
+        self.compact_ratio = compact_ratio
+        self.__urls: set[str] = set()
+        self.__deleted = 0
+        self.__index_offset = 0
+        # Метка перезаписи индекса из его первой строки
+        self.__generation = b""
+        self.__lock = threading.RLock()
+
+    def __refresh_index(self) -> None:
+        """Приватный метод чтения индексного файла. Читаются только строки, дописанные
+        с момента предыдущего чтения. Сжатие записывает в первую строку индекса новую метку
+        ("# метка"), поэтому перезаписанный индекс читается заново, даже если он успел
+        дописаться длиннее прочитанного ранее."""
+
+        try:
+            f = open(self.__index_filename, "rb")
+        except FileNotFoundError:
+            self.__reset_index(b"")
+            return
+
+        with f:
+            header = f.readline()
+            generation = header if header.startswith(b"#") and header.endswith(b"\n") else b""
+            size = os.fstat(f.fileno()).st_size
+            if generation != self.__generation or size < self.__index_offset:
+                self.__reset_index(generation)
+            f.seek(self.__index_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Строка еще дописывается другим процессом
+                    break
+                op, url = line[:1], line[2:-1].decode("utf-8")
+                self.__index_offset += len(line)
+                if op == b"+":
+                    self.__urls.add(url)
+                elif op == b"-" and url in self.__urls:
+                    self.__urls.discard(url)
+                    self.__deleted += 1
+
+    def __reset_index(self, generation: bytes) -> None:
+        """Приватный метод сброса прочитанного индекса перед чтением индексного файла заново."""
+
+        self.__urls = set()
+        self.__deleted = 0
+        self.__index_offset = len(generation)
+        self.__generation = generation
+
+    @staticmethod
+    def __truncate_partial_line(filename: str) -> None:
+        """Приватный метод удаления недописанной последней строки файла (остается при сбое во время
+        дописывания), чтобы следующая запись не склеилась с ней. Вызывается под блокировкой файла."""
+
+        try:
+            with open(filename, "r+b") as f:
+                size = f.seek(0, os.SEEK_END)
+                if not size:
+                    return
+                f.seek(size - 1)
+                if f.read(1) == b"\n":
+                    return
+                # Ищем конец последней полной строки
+                end = size
+                while end > 0:
+                    start = max(end - 4096, 0)
+                    f.seek(start)
+                    position = f.read(end - start).rfind(b"\n")
+                    if position != -1:
+                        f.truncate(start + position + 1)
+                        return
+                    end = start
+                f.truncate(0)
+        except FileNotFoundError:
+            pass
+
+    def __append(self, records: list[dict], index_lines: list[str]) -> None:
+        """Приватный метод дописывания записей в файл с вакансиями и строк в индексный файл.
+        Вызывается под блокировкой файла."""
+
+        self.__truncate_partial_line(self.__filename)
+        self.__truncate_partial_line(self.__index_filename)
+        with open(self.__filename, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with open(self.__index_filename, "ab") as f:
+            f.write("".join(index_lines).encode("utf-8"))
+
+    def __read_records(self) -> list[dict] | None:
+        """Приватный метод чтения актуальных записей файла. Недописанная последняя строка
+        (без перевода строки) пропускается. Возвращает None, если файла нет или он поврежден."""
+
+        try:
+            with open(self.__filename, "rb") as f:
+                records: dict[str, dict] = {}
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        if not line.endswith(b"\n"):
+                            break
+                        raise
+                    if "deleted" in record:
+                        records.pop(record["deleted"], None)
+                    else:
+                        records[record["alternate_url"]] = record
+            return list(records.values())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def get_data(self) -> Any | None:
+        """Метод получения данных о вакансиях из JSONL-файла."""
+
+        records = self.__read_records()
+        if records is None:
+            print("Файл не существует или пустой/поврежден.")
+        return records
+
+    def load_data(self, vacancies: list[Vacancy]) -> None:
+        """Метод добавления данных о вакансиях в JSONL-файл. В файл дописываются только
+        вакансии, ссылок на которые еще нет в индексе."""
+
+        with self.__lock, file_lock(self.__lock_filename):
+            self.__refresh_index()
+            records = []
+            index_lines = []
+            for v in vacancies:
+                if v.alternate_url not in self.__urls:
+                    records.append(v.to_dict())
+                    index_lines.append(f"+ {v.alternate_url}\n")
+                    self.__urls.add(v.alternate_url)
+            if records:
+                self.__append(records, index_lines)
+
+    def delete_data(self, url: str) -> None:
+        """Метод для удаления данных о вакансии по ключу alternate_url. В файл дописывается
+        отметка об удалении, а сама запись удаляется при сжатии файла."""
+
+        with self.__lock, file_lock(self.__lock_filename):
+            self.__refresh_index()
+            if url not in self.__urls:
+                return
+            self.__append([{"deleted": url}], [f"- {url}\n"])
+            self.__urls.discard(url)
+            self.__deleted += 1
+            need_compact = self.__deleted > len(self.__urls) * self.compact_ratio
+
+        if need_compact:
+            self.compact_in_background()
+
+    def compact(self) -> None:
+        """Метод сжатия файла: удаленные записи и отметки об удалении убираются,
+        файл и индекс перезаписываются через временные файлы. Если файл не удалось прочитать,
+        сжатие не выполняется, чтобы не потерять сохраненные вакансии."""
+
+        with self.__lock, file_lock(self.__lock_filename):
+            records = self.__read_records()
+            if records is None:
+                print("Файл не существует или поврежден, сжатие не выполнено.")
+                return
+            generation = f"# {uuid.uuid4().hex}\n"
+            with atomic_write(self.__filename) as f:
+                f.write("".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode("utf-8"))
+            with atomic_write(self.__index_filename) as f:
+                f.write((generation + "".join(f"+ {record['alternate_url']}\n" for record in records)).encode("utf-8"))
+
+            self.__reset_index(generation.encode("utf-8"))
+            self.__refresh_index()
+
+    def compact_in_background(self) -> threading.Thread:
+        """Метод запуска сжатия файла в фоновом потоке. Возвращает запущенный поток."""
+
+        thread = threading.Thread(target=self.compact, daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,119 @@
+import re
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from src.class_vacancies import Vacancy
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text: str | None) -> str:
+    """Функция приведения текста к виду для поиска: без учета регистра и с заменой "ё" на "е"."""
+
+    return (text or "").casefold().replace("ё", "е")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Функция разбиения текста на нормализованные слова."""
+
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+class KeywordIndex:
+    """Класс инвертированного индекса вакансий по словам названия и требований.
+    Для каждого слова хранится список номеров вакансий, в которых оно встречается, поэтому
+    поиск по ключевым словам объединяет или пересекает готовые списки, а не перебирает вакансии.
+    Ключевое слово совпадает со словами, которые с него начинаются ("разраб" - "разработчик"),
+    регистр и различие "ё"/"е" не учитываются."""
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        """Конструктор класса KeywordIndex."""
+
+        self.__vacancies: list[Vacancy] = []
+        # Слово -> список номеров вакансий (по возрастанию) отдельно для названий и требований
+        self.__postings: dict[str, dict[str, list[int]]] = {"name": {}, "snippet": {}}
+        # Отсортированные слова для поиска по началу слова, строятся при первом поиске после добавления
+        self.__tokens: dict[str, list[str] | None] = {"name": None, "snippet": None}
+        self.extend(vacancies)
+
+    def __len__(self) -> int:
+        """Магический метод получения количества вакансий в индексе."""
+
+        return len(self.__vacancies)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Магический метод перебора вакансий в порядке добавления."""
+
+        return iter(self.__vacancies)
+
+    def add(self, vacancy: Vacancy) -> None:
+        """Метод добавления одной вакансии в индекс."""
+
+        doc_id = len(self.__vacancies)
+        self.__vacancies.append(vacancy)
+        for field, text in (("name", vacancy.name), ("snippet", vacancy.snippet)):
+            postings = self.__postings[field]
+            for token in dict.fromkeys(tokenize(text)):
+                postings.setdefault(token, []).append(doc_id)
+            self.__tokens[field] = None
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        """Метод добавления нескольких вакансий в индекс."""
+
+        for vacancy in vacancies:
+            self.add(vacancy)
+
+    def __lookup(self, token: str, fields: tuple[str, ...], prefix: bool) -> set[int]:
+        """Приватный метод получения номеров вакансий, в полях fields которых есть слово token
+        (или слово, начинающееся с token, при prefix=True)."""
+
+        doc_ids: set[int] = set()
+        for field in fields:
+            postings = self.__postings[field]
+            if not prefix:
+                doc_ids.update(postings.get(token, ()))
+                continue
+
+            tokens = self.__tokens[field]
+            if tokens is None:
+                tokens = self.__tokens[field] = sorted(postings)
+            i = bisect_left(tokens, token)
+            while i < len(tokens) and tokens[i].startswith(token):
+                doc_ids.update(postings[tokens[i]])
+                i += 1
+        return doc_ids
+
+    def match(self, keyword: str, in_snippet: bool = False, prefix: bool = True) -> set[int]:
+        """Метод получения множества номеров вакансий, подходящих под ключевое слово.
+        Если ключевое слово состоит из нескольких слов, вакансия должна содержать их все."""
+
+        fields = ("name", "snippet") if in_snippet else ("name",)
+        tokens = tokenize(keyword)
+        if not tokens:
+            return set()
+        # Пересечение начинается с самого короткого списка
+        matches = sorted((self.__lookup(token, fields, prefix) for token in tokens), key=len)
+        return matches[0].intersection(*matches[1:])
+
+    def search(
+            self,
+            keywords: list[str],
+            mode: str = "any",
+            in_snippet: bool = False,
+            prefix: bool = True
+    ) -> list[Vacancy]:
+        """Метод поиска вакансий по ключевым словам в порядке добавления.
+        mode="any" - вакансии, подходящие хотя бы под одно ключевое слово, mode="all" - под все;
+        in_snippet - искать также в требованиях; prefix - искать слова, начинающиеся с ключевого слова."""
+
+        if mode not in ("any", "all"):
+            raise ValueError(f"Неизвестный режим поиска: {mode}")
+        if not keywords:
+            return []
+
+        matches = [self.match(keyword, in_snippet, prefix) for keyword in keywords]
+        if mode == "any":
+            doc_ids = set().union(*matches)
+        else:
+            matches.sort(key=len)
+            doc_ids = matches[0].intersection(*matches[1:])
+        return [self.__vacancies[doc_id] for doc_id in sorted(doc_ids)]
@@ -0,0 +1,158 @@
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from src.class_keyword_index import KeywordIndex, tokenize
+from src.class_salary_index import SalaryIndex
+from src.class_top_n import TopVacancies
+from src.class_vacancies import Vacancy
+
+# Количество вакансий, по которым оценивается доля вакансий, проходящих каждое условие
+SAMPLE_SIZE = 64
+
+
+class Query:
+    """Класс составного запроса к вакансиям: условия по ключевым словам, зарплате, работодателю
+    и опыту задаются цепочкой методов, например Query().keywords(["python"]).salary(100000, 200000).top(10),
+    а выполняются за один проход без промежуточных списков. Условия проверяются, начиная с самого
+    избирательного (доля подходящих вакансий оценивается по выборке), а если вакансии не переданы,
+    по индексам KeywordIndex и SalaryIndex перебираются только найденные по индексу вакансии."""
+
+    def __init__(self, keyword_index: KeywordIndex | None = None, salary_index: SalaryIndex | None = None):
+        """Конструктор класса Query. Индексы необязательны и должны быть построены по одним и тем же вакансиям."""
+
+        self.__keyword_index = keyword_index
+        self.__salary_index = salary_index
+        self.__keywords: tuple[list[str], str, bool] | None = None
+        self.__salary: tuple[int, int] | None = None
+        # Условия на точное совпадение поля: имя атрибута Vacancy -> значение
+        self.__equals: dict[str, str] = {}
+        self.__top_n: int | None = None
+
+    def keywords(self, words: list[str], mode: str = "any", in_snippet: bool = False) -> "Query":
+        """Метод добавления условия по ключевым словам с той же логикой, что у KeywordIndex.search:
+        слово вакансии должно начинаться с ключевого слова, mode="any" - хотя бы одно, mode="all" - все."""
+
+        if mode not in ("any", "all"):
+            raise ValueError(f"Неизвестный режим поиска: {mode}")
+        self.__keywords = (list(words), mode, in_snippet)
+        return self
+
+    def salary(self, salary_from: int, salary_to: int) -> "Query":
+        """Метод добавления условия по диапазону зарплат [salary_from, salary_to]."""
+
+        self.__salary = (int(salary_from), int(salary_to))
+        return self
+
+    def employer(self, name: str) -> "Query":
+        """Метод добавления условия по названию работодателя."""
+
+        # Названия у вакансий хранятся общими копиями строк (sys.intern), поэтому сравнение идет по ссылке
+        self.__equals["employer"] = sys.intern(name)
+        return self
+
+    def experience(self, name: str) -> "Query":
+        """Метод добавления условия по требуемому опыту работы."""
+
+        self.__equals["experience"] = sys.intern(name)
+        return self
+
+    def top(self, top_n: int) -> "Query":
+        """Метод ограничения результата топ N вакансиями по убыванию зарплаты."""
+
+        self.__top_n = top_n
+        return self
+
+    @staticmethod
+    def __keyword_predicate(words: list[str], mode: str, in_snippet: bool) -> Callable[[Vacancy], bool]:
+        """Приватный метод создания функции проверки вакансии по ключевым словам."""
+
+        keywords = [tokenize(word) for word in words]
+        combine = any if mode == "any" else all
+
+        def predicate(vacancy: Vacancy) -> bool:
+            """Функция проверки вакансии по ключевым словам."""
+
+            tokens = tokenize(vacancy.name)
+            if in_snippet:
+                tokens += tokenize(vacancy.snippet)
+            return bool(keywords) and combine(
+                bool(keyword) and all(any(token.startswith(part) for token in tokens) for part in keyword)
+                for keyword in keywords
+            )
+
+        return predicate
+
+    @staticmethod
+    def __equals_predicate(attribute: str, value: str) -> Callable[[Vacancy], bool]:
+        """Приватный метод создания функции проверки совпадения атрибута вакансии со значением."""
+
+        return lambda vacancy: getattr(vacancy, attribute) == value
+
+    def __predicates(self, by_keywords: bool, by_salary: bool) -> list[Callable[[Vacancy], bool]]:
+        """Приватный метод создания функций проверки вакансии по условиям запроса, кроме уже
+        выполненных по индексу. Порядок по умолчанию - от самых дешевых проверок к самым дорогим."""
+
+        predicates: list[Callable[[Vacancy], bool]] = []
+        for attribute, value in self.__equals.items():
+            predicates.append(self.__equals_predicate(attribute, value))
+        if self.__salary is not None and not by_salary:
+            salary_from, salary_to = self.__salary
+            predicates.append(lambda vacancy: salary_from <= vacancy.salary <= salary_to)
+        if self.__keywords is not None and not by_keywords:
+            predicates.append(self.__keyword_predicate(*self.__keywords))
+        return predicates
+
+    @staticmethod
+    def __plan(
+            predicates: list[Callable[[Vacancy], bool]],
+            vacancies: Iterable[Vacancy]
+    ) -> list[Callable[[Vacancy], bool]]:
+        """Приватный метод упорядочивания условий по избирательности: доля вакансий, проходящих каждое
+        условие, оценивается по равномерной выборке. Для итераторов, которые нельзя просмотреть дважды,
+        сохраняется порядок по умолчанию."""
+
+        if len(predicates) < 2 or not isinstance(vacancies, Sequence) or not vacancies:
+            return predicates
+        sample = vacancies[::max(len(vacancies) // SAMPLE_SIZE, 1)]
+        # sorted устойчива, поэтому при равной оценке сохраняется порядок по стоимости проверки
+        return sorted(predicates, key=lambda predicate: sum(map(predicate, sample)))
+
+    def __source(self) -> tuple[Iterable[Vacancy], bool, bool]:
+        """Приватный метод выбора вакансий индекса для перебора. Возвращает вакансии и признаки того,
+        что условия по ключевым словам и по зарплате уже выполнены для них благодаря индексу.
+        Без top вакансии перебираются в порядке индекса KeywordIndex (если он есть), поэтому индекс
+        SalaryIndex, отдающий вакансии по возрастанию зарплаты, используется только вместе с top."""
+
+        keyword_index, salary_index = self.__keyword_index, self.__salary_index
+        if keyword_index is not None and salary_index is not None and self.__top_n is None:
+            salary_index = None
+        # Перебираются вакансии из индекса, нашедшего меньше всего вакансий
+        matches = None
+        if keyword_index is not None and self.__keywords is not None:
+            matches = keyword_index.search(*self.__keywords)
+        if salary_index is not None and self.__salary is not None:
+            if matches is None or salary_index.count(*self.__salary) < len(matches):
+                return salary_index.range(*self.__salary), False, True
+        if matches is not None:
+            return matches, True, False
+
+        source = keyword_index if keyword_index is not None else salary_index
+        if source is None:
+            raise ValueError("Не переданы вакансии для запроса")
+        return source, False, False
+
+    def run(self, vacancies: Iterable[Vacancy] | None = None) -> Iterator[Vacancy]:
+        """Метод выполнения запроса. Возвращает итератор подходящих вакансий: без top - в порядке
+        перебора, с top - по убыванию зарплаты. Переданные вакансии перебираются целиком (индексы
+        относятся к своим вакансиям и для них не используются); без вакансий перебираются вакансии,
+        найденные по индексам запроса, а порядок без top - порядок индекса KeywordIndex, если он есть."""
+
+        if vacancies is not None:
+            source, by_keywords, by_salary = vacancies, False, False
+        else:
+            source, by_keywords, by_salary = self.__source()
+        predicates = self.__plan(self.__predicates(by_keywords, by_salary), source)
+
+        matches = (vacancy for vacancy in source if all(predicate(vacancy) for predicate in predicates))
+        if self.__top_n is not None:
+            return iter(TopVacancies(self.__top_n).extend(matches).result())
+        return matches
@@ -0,0 +1,63 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Класс ограничения частоты запросов по алгоритму "корзины токенов" (token bucket).
+    Частота подстраивается под API: после каждого успешного запроса она плавно растет,
+    а после ответа 429 Too Many Requests уменьшается вдвое."""
+
+    def __init__(
+            self,
+            rate: float = 10.0,
+            capacity: float = 10.0,
+            min_rate: float = 0.5,
+            max_rate: float = 30.0,
+            increase: float = 0.1
+    ) -> None:
+        """Конструктор класса RateLimiter.
+        rate - начальная частота запросов в секунду;
+        capacity - максимальное количество запросов, которые можно выполнить подряд без ожидания;
+        min_rate, max_rate - границы, в которых подстраивается частота;
+        increase - прибавка к частоте после каждого успешного запроса."""
+
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.__tokens = capacity
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Метод резервирования одного запроса. Возвращает время в секундах,
+        которое нужно подождать перед выполнением запроса."""
+
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.capacity, self.__tokens + (now - self.__updated_at) * self.rate)
+            self.__updated_at = now
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.rate
+
+    def acquire(self) -> None:
+        """Метод ожидания, пока частота запросов не позволит выполнить следующий запрос."""
+
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        """Метод увеличения частоты запросов после успешного ответа API."""
+
+        with self.__lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self) -> None:
+        """Метод уменьшения частоты запросов вдвое после ответа 429 Too Many Requests."""
+
+        with self.__lock:
+            self.rate = max(self.min_rate, self.rate / 2)
@@ -0,0 +1,62 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from src.class_vacancies import Vacancy
+
+
+class SalaryIndex:
+    """Класс индекса вакансий по зарплате: вакансии хранятся отсортированными по зарплате,
+    поэтому выборка по диапазону зарплат выполняется двоичным поиском за O(log n + k)
+    без просмотра всех вакансий. Один индекс можно использовать для многих диапазонов.
+    Вакансии с одинаковой зарплатой хранятся в порядке добавления."""
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        """Конструктор класса SalaryIndex."""
+
+        # Параллельные списки зарплат и вакансий, упорядоченные по зарплате
+        self.__salaries: list[int] = []
+        self.__vacancies: list[Vacancy] = []
+        self.extend(vacancies)
+
+    def __len__(self) -> int:
+        """Магический метод получения количества вакансий в индексе."""
+
+        return len(self.__vacancies)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Магический метод перебора вакансий по возрастанию зарплаты."""
+
+        return iter(self.__vacancies)
+
+    def add(self, vacancy: Vacancy) -> None:
+        """Метод добавления одной вакансии в индекс."""
+
+        i = bisect_right(self.__salaries, vacancy.salary)
+        self.__salaries.insert(i, vacancy.salary)
+        self.__vacancies.insert(i, vacancy)
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> None:
+        """Метод добавления нескольких вакансий в индекс. Новые вакансии дописываются в конец
+        и индекс пересортировывается: устойчивая сортировка почти упорядоченного списка выполняется
+        быстрее, чем вставка каждой вакансии по отдельности."""
+
+        vacancies = sorted((*self.__vacancies, *vacancies), key=lambda vacancy: vacancy.salary)
+        self.__vacancies = vacancies
+        self.__salaries = [vacancy.salary for vacancy in vacancies]
+
+    def __bounds(self, salary_from: int, salary_to: int) -> tuple[int, int]:
+        """Приватный метод получения границ диапазона зарплат в отсортированном списке."""
+
+        return bisect_left(self.__salaries, salary_from), bisect_right(self.__salaries, salary_to)
+
+    def range(self, salary_from: int, salary_to: int) -> list[Vacancy]:
+        """Метод получения вакансий с зарплатой в диапазоне [salary_from, salary_to]
+        по возрастанию зарплаты."""
+
+        lo, hi = self.__bounds(salary_from, salary_to)
+        return self.__vacancies[lo:hi]
+
+    def count(self, salary_from: int, salary_to: int) -> int:
+        """Метод получения количества вакансий с зарплатой в диапазоне [salary_from, salary_to]."""
+
+        lo, hi = self.__bounds(salary_from, salary_to)
+        return max(hi - lo, 0)
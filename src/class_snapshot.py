@@ -0,0 +1,213 @@
+import json
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any
+from src.class_file_work import atomic_write
+from src.class_vacancies import COLUMNS, Vacancy
+
+# Колонки с небольшим числом различных значений хранятся словарем значений и кодами строк
+DICTIONARY_COLUMNS = ("employer", "experience", "employment")
+
+MAGIC = b"VSNP"
+VERSION = 1
+# Заголовок файла: сигнатура, версия, флаг сжатия и длина JSON-описания колонок
+PREFIX = struct.Struct("<4sBBI")
+ALIGNMENT = 8
+
+
+class VacancySnapshot:
+    """Класс для сохранения архива вакансий в компактном колоночном двоичном формате и его загрузки.
+    Каждая колонка хранится отдельным блоком: зарплаты - массивом 64-битных чисел, строки - общим
+    текстом и массивом смещений, а работодатель, опыт и тип занятости - словарем различных значений
+    и массивом кодов. Блоки можно сжать zlib. Файл загружается через отображение в память (mmap),
+    а колонки разбираются только при обращении к ним."""
+
+    def __init__(self, filename: str):
+        """Конструктор класса VacancySnapshot. Открывает файл снимка и читает описание колонок."""
+
+        with open(filename, "rb") as f:
+            self.__mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, compressed, header_length = PREFIX.unpack_from(self.__mm)
+        except struct.error:
+            self.close()
+            raise ValueError(f"Файл {filename} не является снимком вакансий")
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Файл {filename} не является снимком вакансий версии {VERSION}")
+
+        header = json.loads(self.__mm[PREFIX.size:PREFIX.size + header_length])
+        self.__compressed = bool(compressed)
+        self.__body = PREFIX.size + header_length
+        self.__count: int = header["count"]
+        self.__columns: dict[str, dict[str, Any]] = header["columns"]
+        # Уже разобранные колонки
+        self.__cache: dict[str, list] = {}
+
+    @classmethod
+    def save(cls, filename: str, vacancies: list[Vacancy | dict], compress: bool = False) -> None:
+        """Метод сохранения вакансий (экземпляров Vacancy или словарей в формате Vacancy.to_dict)
+        в файл снимка. При compress=True блоки колонок сжимаются zlib."""
+
+        records: list[dict[str, Any]] = [v.to_dict() if isinstance(v, Vacancy) else v for v in vacancies]
+        columns: dict[str, dict[str, Any]] = {}
+        blocks = []
+        offset = 0
+
+        def add_block(data: bytes) -> list[int]:
+            """Функция добавления блока колонки. Возвращает его смещение, длину и исходную длину."""
+
+            nonlocal offset
+            raw_length = len(data)
+            if compress:
+                data = zlib.compress(data)
+            padding = -len(data) % ALIGNMENT
+            blocks.append(data + b"\0" * padding)
+            block = [offset, len(data), raw_length]
+            offset += len(data) + padding
+            return block
+
+        for name in COLUMNS:
+            values = [record.get(name) for record in records]
+            if name == "salary":
+                columns[name] = {"type": "int", "blocks": [add_block(cls.__to_bytes(array("q", values)))]}
+            elif name in DICTIONARY_COLUMNS:
+                dictionary: dict[str | None, int] = {}
+                codes = [dictionary.setdefault(value, len(dictionary)) for value in values]
+                typecode = "B" if len(dictionary) <= 1 << 8 else "H" if len(dictionary) <= 1 << 16 else "I"
+                columns[name] = {
+                    "type": "dict",
+                    "typecode": typecode,
+                    "values": list(dictionary),
+                    "blocks": [add_block(cls.__to_bytes(array(typecode, codes)))]
+                }
+            else:
+                # Смещения считаются в символах, чтобы при загрузке декодировать весь текст колонки разом
+                offsets = array("q", [0])
+                nulls = bytearray()
+                for value in values:
+                    nulls.append(value is None)
+                    offsets.append(offsets[-1] + len(value or ""))
+                column_blocks = [
+                    add_block(cls.__to_bytes(offsets)),
+                    add_block("".join(value or "" for value in values).encode("utf-8"))
+                ]
+                if any(nulls):
+                    column_blocks.append(add_block(bytes(nulls)))
+                columns[name] = {"type": "str", "blocks": column_blocks}
+
+        header = json.dumps({"count": len(records), "columns": columns}, ensure_ascii=False).encode("utf-8")
+        header += b" " * (-(PREFIX.size + len(header)) % ALIGNMENT)
+        with atomic_write(filename) as f:
+            f.write(PREFIX.pack(MAGIC, VERSION, compress, len(header)))
+            f.write(header)
+            f.writelines(blocks)
+
+    @staticmethod
+    def __to_bytes(values: array) -> bytes:
+        """Приватный метод преобразования массива чисел в байты в порядке little-endian."""
+
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values.tobytes()
+
+    def __block(self, block: list[int]) -> bytes | memoryview:
+        """Приватный метод получения содержимого блока колонки (со снятым сжатием)."""
+
+        offset, length, raw_length = block
+        start = self.__body + offset
+        if self.__compressed:
+            return zlib.decompress(self.__mm[start:start + length], bufsize=max(raw_length, 1))
+        return memoryview(self.__mm)[start:start + length]
+
+    def __array(self, block: list[int], typecode: str) -> array:
+        """Приватный метод чтения блока колонки как массива чисел."""
+
+        values = array(typecode)
+        data = self.__block(block)
+        try:
+            values.frombytes(data)
+        finally:
+            # Представление отображенного файла освобождается сразу, чтобы файл можно было закрыть
+            if isinstance(data, memoryview):
+                data.release()
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def __len__(self) -> int:
+        """Магический метод получения количества вакансий в снимке."""
+
+        return self.__count
+
+    def __enter__(self) -> "VacancySnapshot":
+        """Магический метод входа в контекстный менеджер."""
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Магический метод выхода из контекстного менеджера. Закрывает файл снимка."""
+
+        self.close()
+
+    def close(self) -> None:
+        """Метод закрытия отображенного в память файла снимка."""
+
+        self.__mm.close()
+
+    def codes(self, name: str) -> tuple[array, list]:
+        """Метод получения колонки со словарным кодированием (employer, experience, employment)
+        в виде массива кодов и списка значений: значение строки i - values[codes[i]]."""
+
+        column = self.__columns[name]
+        if column["type"] != "dict":
+            raise ValueError(f"Колонка {name} хранится без словаря значений")
+        return self.__array(column["blocks"][0], column["typecode"]), column["values"]
+
+    def column(self, name: str) -> list:
+        """Метод получения значений одной колонки для всех вакансий снимка."""
+
+        if name in self.__cache:
+            return self.__cache[name]
+
+        column = self.__columns[name]
+        if column["type"] == "int":
+            values = self.__array(column["blocks"][0], "q").tolist()
+        elif column["type"] == "dict":
+            codes, dictionary = self.codes(name)
+            values = [dictionary[code] for code in codes]
+        else:
+            offsets = self.__array(column["blocks"][0], "q")
+            data = self.__block(column["blocks"][1])
+            text = str(data, "utf-8")
+            if isinstance(data, memoryview):
+                data.release()
+            values = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+            if len(column["blocks"]) > 2:
+                nulls = self.__block(column["blocks"][2])
+                values = [None if null else value for value, null in zip(values, nulls)]
+                if isinstance(nulls, memoryview):
+                    nulls.release()
+        self.__cache[name] = values
+        return values
+
+    def get_data(self) -> list[dict]:
+        """Метод получения всех вакансий снимка в виде словарей в формате Vacancy.to_dict."""
+
+        return [
+            {
+                "name": name,
+                "salary": salary,
+                "alternate_url": alternate_url,
+                "employer": employer,
+                "snippet": snippet,
+                "experience": experience,
+                "employment": employment
+            }
+            for name, salary, alternate_url, employer, snippet, experience, employment
+            in zip(*(self.column(column) for column in COLUMNS))
+        ]
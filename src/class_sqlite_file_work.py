@@ -0,0 +1,116 @@
+import sqlite3
+from contextlib import closing
+from operator import itemgetter
+from typing import Any
+from src.class_abs_file_work import FileWorker
+from src.class_vacancies import COLUMNS, Vacancy
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vacancies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    salary INTEGER NOT NULL,
+    alternate_url TEXT NOT NULL,
+    employer TEXT,
+    snippet TEXT,
+    experience TEXT,
+    employment TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_vacancies_alternate_url ON vacancies (alternate_url);
+CREATE INDEX IF NOT EXISTS idx_vacancies_salary ON vacancies (salary);
+CREATE INDEX IF NOT EXISTS idx_vacancies_employer ON vacancies (employer);
+CREATE VIRTUAL TABLE IF NOT EXISTS vacancies_fts USING fts5 (
+    name, snippet, content='vacancies', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS vacancies_ai AFTER INSERT ON vacancies BEGIN
+    INSERT INTO vacancies_fts (rowid, name, snippet) VALUES (new.id, new.name, new.snippet);
+END;
+CREATE TRIGGER IF NOT EXISTS vacancies_ad AFTER DELETE ON vacancies BEGIN
+    INSERT INTO vacancies_fts (vacancies_fts, rowid, name, snippet) VALUES ('delete', old.id, old.name, old.snippet);
+END;
+"""
+
+
+class SQLiteFileWorker(FileWorker):
+    """Класс для загрузки, получения и удаления данных о вакансиях в базе данных SQLite.
+    Поиск по зарплате, работодателю и ключевым словам выполняется запросами к индексам базы
+    без загрузки всех вакансий в память. Является дочерним от класса FileWorker."""
+
+    def __init__(self, filename: str = "data/vacancy.db"):
+        """Конструктор класса SQLiteFileWorker. Создает таблицу и индексы, если их еще нет."""
+
+        self.__filename = filename
+        with closing(self.__connect()) as connection:
+            connection.executescript(SCHEMA)
+
+    def __connect(self) -> sqlite3.Connection:
+        """Приватный метод подключения к базе данных."""
+
+        connection = sqlite3.connect(self.__filename)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def __select(self, where: str = "", params: tuple = (), order: str = "id", limit: int | None = None) -> list[dict]:
+        """Приватный метод выборки вакансий с заданным условием и сортировкой."""
+
+        query = f"SELECT {', '.join(COLUMNS)} FROM vacancies {where} ORDER BY {order}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (*params, limit)
+        with closing(self.__connect()) as connection:
+            return [dict(row) for row in connection.execute(query, params)]
+
+    def get_data(self) -> Any | None:
+        """Метод получения данных обо всех вакансиях из базы данных."""
+
+        return self.__select()
+
+    def load_data(self, vacancies: list[Vacancy]) -> None:
+        """Метод добавления данных о вакансиях в базу данных. Вакансии с уже сохраненной
+        ссылкой пропускаются благодаря уникальному индексу по alternate_url."""
+
+        # Словарь каждой вакансии строится один раз, значения колонок выбираются из него разом
+        row = itemgetter(*COLUMNS)
+        rows = (row(v.to_dict()) for v in vacancies)
+        with closing(self.__connect()) as connection, connection:
+            connection.executemany(
+                f"INSERT OR IGNORE INTO vacancies ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                rows
+            )
+
+    def delete_data(self, url: str) -> None:
+        """Метод для удаления данных о вакансии по ключу alternate_url из базы данных."""
+
+        with closing(self.__connect()) as connection, connection:
+            connection.execute("DELETE FROM vacancies WHERE alternate_url = ?", (url,))
+
+    def delete_many(self, urls: list[str]) -> None:
+        """Метод для удаления данных о нескольких вакансиях по ключу alternate_url одной транзакцией."""
+
+        with closing(self.__connect()) as connection, connection:
+            connection.executemany("DELETE FROM vacancies WHERE alternate_url = ?", ((url,) for url in urls))
+
+    def get_vacancies_by_salary(self, salary_range: list[str]) -> list[dict]:
+        """Метод получения вакансий с зарплатой в заданном диапазоне (по индексу зарплаты)."""
+
+        return self.__select("WHERE salary BETWEEN ? AND ?", (int(salary_range[0]), int(salary_range[1])), "salary")
+
+    def get_vacancies_by_employer(self, employer: str) -> list[dict]:
+        """Метод получения вакансий работодателя (по индексу работодателя)."""
+
+        return self.__select("WHERE employer = ?", (employer,))
+
+    def filter_vacancies(self, keywords: list[str], in_snippet: bool = False) -> list[dict]:
+        """Метод поиска вакансий, в названии которых есть слово, начинающееся с одного из ключевых слов
+        (по полнотекстовому индексу). При in_snippet=True поиск ведется также по требованиям."""
+
+        if not keywords:
+            return []
+        columns = "{name snippet}" if in_snippet else "name"
+        match = " OR ".join(f'{columns} : "{word.replace(chr(34), chr(34) * 2)}"*' for word in keywords)
+        return self.__select("WHERE id IN (SELECT rowid FROM vacancies_fts WHERE vacancies_fts MATCH ?)", (match,))
+
+    def get_top_vacancies(self, top_n: int) -> list[dict]:
+        """Метод получения топ N вакансий по убыванию зарплаты (по индексу зарплаты)."""
+
+        return self.__select(order="salary DESC, id", limit=top_n)
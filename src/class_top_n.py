@@ -0,0 +1,51 @@
+import heapq
+from collections.abc import Callable, Iterable
+from typing import Any
+from src.class_vacancies import Vacancy
+
+
+class TopVacancies:
+    """Класс для выбора топ N вакансий по убыванию зарплаты без сортировки всего списка.
+    Хранит не больше N лучших вакансий в куче, поэтому вакансии можно добавлять по мере
+    получения (например, постранично из HH.iter_vacancies) и в любой момент получить текущий топ.
+    Из вакансий с одинаковой зарплатой выше оказывается добавленная раньше, как при устойчивой сортировке."""
+
+    def __init__(self, top_n: int, key: Callable[[Any], Any] = lambda vacancy: vacancy.salary):
+        """Конструктор класса TopVacancies.
+        top_n - количество вакансий в топе;
+        key - функция, значение которой сравнивается (по умолчанию зарплата)."""
+
+        self.top_n = top_n
+        self.__key = key
+        # Минимальная куча из (значение, -порядковый номер, вакансия): в корне худшая из лучших вакансий
+        self.__heap: list[tuple[Any, int, Vacancy]] = []
+        self.__count = 0
+
+    def __len__(self) -> int:
+        """Магический метод получения количества вакансий в текущем топе."""
+
+        return len(self.__heap)
+
+    def push(self, vacancy: Vacancy) -> None:
+        """Метод добавления одной вакансии."""
+
+        if self.top_n <= 0:
+            return
+        entry = (self.__key(vacancy), -self.__count, vacancy)
+        self.__count += 1
+        if len(self.__heap) < self.top_n:
+            heapq.heappush(self.__heap, entry)
+        elif entry > self.__heap[0]:
+            heapq.heapreplace(self.__heap, entry)
+
+    def extend(self, vacancies: Iterable[Vacancy]) -> "TopVacancies":
+        """Метод добавления нескольких вакансий. Возвращает сам объект для цепочки вызовов."""
+
+        for vacancy in vacancies:
+            self.push(vacancy)
+        return self
+
+    def result(self) -> list[Vacancy]:
+        """Метод получения текущего топа вакансий по убыванию зарплаты."""
+
+        return [entry[2] for entry in sorted(self.__heap, reverse=True)]
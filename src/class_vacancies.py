@@ -1,5 +1,41 @@
+import gc
+import sys
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
 from typing import Any
 
+# Поля вакансии в порядке ключей Vacancy.to_dict: колонки таблицы SQLite и снимка вакансий
+COLUMNS = ("name", "salary", "alternate_url", "employer", "snippet", "experience", "employment")
+
+# Количество действующих пауз сборки мусора (из разных потоков) и нужно ли включить сборщик после них
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_restore = False
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Контекстный менеджер приостановки автоматической сборки мусора на время создания множества объектов:
+    все они остаются нужны, поэтому сборщик запускался бы впустую. Сборщик мусора общий для процесса,
+    поэтому сборка не запускается и в других потоках; он включается обратно после последней из
+    одновременных пауз, если был включен до первой. Выключение сборщика другим потоком во время паузы
+    не учитывается, поэтому пауза включается только по явному запросу вызывающего кода."""
+
+    global _gc_pauses, _gc_restore
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_restore = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_restore:
+                gc.enable()
+
 
 class Vacancy:
     """Класс для работы с вакансиями."""
@@ -29,10 +65,19 @@ class Vacancy:
         self.name = name
         self.salary = self.__salary_validate(salary)
         self.alternate_url = alternate_url
-        self.employer = employer["name"]
+        self.employer = self.__pool(employer["name"])
         self.snippet = snippet["requirement"]
-        self.experience = experience["name"]
-        self.employment = employment["name"]
+        self.experience = self.__pool(experience["name"])
+        self.employment = self.__pool(employment["name"])
+
+    @staticmethod
+    def __pool(value: str | None) -> str | None:
+        """Приватный метод получения общей для всех вакансий копии строки (sys.intern).
+        Работодатель, опыт и тип занятости принимают немного различных значений, поэтому вакансии
+        хранят ссылки на одни и те же строки, а не собственные копии; такие строки к тому же
+        сравниваются быстрее, так как совпадают по ссылке."""
+
+        return sys.intern(value) if type(value) is str else value
 
     @staticmethod
     def __salary_validate(salary: dict[str | int]) -> int:
@@ -51,6 +96,81 @@ class Vacancy:
         else:
             return 0
 
+    @classmethod
+    def __assign(
+            cls,
+            name: str,
+            salary: int,
+            alternate_url: str,
+            employer: str | None,
+            snippet: str | None,
+            experience: str | None,
+            employment: str | None
+    ) -> "Vacancy":
+        """Приватный метод создания экземпляра класса с прямым присваиванием уже проверенных значений
+        атрибутов (без вызова конструктора). Работодатель, опыт и тип занятости заменяются общими копиями строк."""
+
+        vacancy = cls.__new__(cls)
+        vacancy.name = name
+        vacancy.salary = salary
+        vacancy.alternate_url = alternate_url
+        vacancy.employer = cls.__pool(employer)
+        vacancy.snippet = snippet
+        vacancy.experience = cls.__pool(experience)
+        vacancy.employment = cls.__pool(employment)
+        return vacancy
+
+    @classmethod
+    def from_dict(cls, record: dict[str, Any]) -> "Vacancy":
+        """Метод создания экземпляра класса из словаря в формате to_dict (например, прочитанного из файла).
+        Данные считаются уже проверенными: зарплата не пересчитывается, атрибуты присваиваются напрямую,
+        а работодатель, опыт и тип занятости заменяются общими копиями строк."""
+
+        return cls.__assign(
+            record["name"],
+            record["salary"],
+            record["alternate_url"],
+            record["employer"],
+            record["snippet"],
+            record["experience"],
+            record["employment"]
+        )
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]], pause_gc: bool = False) -> list["Vacancy"]:
+        """Метод создания списка экземпляров класса из словарей в формате to_dict без проверки данных.
+        При pause_gc=True сборка мусора на это время приостанавливается, как в from_raw_batch."""
+
+        assign = cls.__assign
+        with _gc_paused() if pause_gc else nullcontext():
+            return [
+                assign(r["name"], r["salary"], r["alternate_url"], r["employer"], r["snippet"], r["experience"],
+                       r["employment"])
+                for r in records
+            ]
+
+    @classmethod
+    def from_raw_batch(cls, items: list[dict], pause_gc: bool = False) -> list["Vacancy"]:
+        """Метод создания списка экземпляров класса из большого списка вакансий, полученного от API HH.ru.
+        Результат совпадает с созданием экземпляров по одному. При pause_gc=True сборка мусора на это время
+        приостанавливается для всего процесса (см. _gc_paused), поэтому включать паузу должен вызывающий код,
+        которому известно, что другие потоки не управляют сборщиком мусора."""
+
+        assign = cls.__assign
+        with _gc_paused() if pause_gc else nullcontext():
+            return [
+                assign(
+                    item["name"],
+                    cls.__salary_validate(item["salary"]),
+                    item["alternate_url"],
+                    item["employer"]["name"],
+                    item["snippet"]["requirement"],
+                    item["experience"]["name"],
+                    item["employment"]["name"]
+                )
+                for item in items
+            ]
+
     def __str__(self) -> str:
         """Магический метод для представления информации об экземпляре объекта в виде строки. """
 
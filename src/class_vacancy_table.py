@@ -0,0 +1,140 @@
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from src.class_vacancies import Vacancy
+
+# Колонки с небольшим числом различных значений хранятся целочисленными кодами
+CATEGORICAL_COLUMNS = ("employer", "experience", "employment")
+
+
+class VacancyTable:
+    """Класс колоночной таблицы вакансий для быстрой фильтрации, сортировки и выбора топ N.
+    Зарплаты хранятся массивом NumPy, а работодатель, опыт и тип занятости - целочисленными
+    кодами и словарем различных значений, поэтому фильтры по ним вычисляются булевыми масками
+    над массивами, а не циклом по объектам. Результаты операций - новые таблицы."""
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        """Конструктор класса VacancyTable. Строит колонки из списка экземпляров Vacancy."""
+
+        self.__vacancies = list(vacancies)
+        self.__salary = np.fromiter(
+            (v.salary for v in self.__vacancies), dtype=np.int64, count=len(self.__vacancies)
+        )
+        # Коды категориальных колонок и словари "значение -> код"
+        self.__codes: dict[str, np.ndarray] = {}
+        self.__categories: dict[str, dict[str, int]] = {}
+        for column in CATEGORICAL_COLUMNS:
+            categories: dict[str, int] = {}
+            self.__codes[column] = np.fromiter(
+                (categories.setdefault(getattr(v, column), len(categories)) for v in self.__vacancies),
+                dtype=np.int32,
+                count=len(self.__vacancies)
+            )
+            self.__categories[column] = categories
+        # Названия в нижнем регистре для поиска по ключевым словам строятся при первом поиске
+        self.__names: list[str] | None = None
+
+    def __take(self, indices: np.ndarray) -> "VacancyTable":
+        """Приватный метод создания таблицы из строк с заданными номерами без повторного кодирования колонок."""
+
+        table = VacancyTable.__new__(VacancyTable)
+        table.__vacancies = [self.__vacancies[i] for i in indices.tolist()]
+        table.__salary = self.__salary[indices]
+        table.__codes = {column: codes[indices] for column, codes in self.__codes.items()}
+        table.__categories = self.__categories
+        table.__names = None if self.__names is None else [self.__names[i] for i in indices.tolist()]
+        return table
+
+    def __len__(self) -> int:
+        """Магический метод получения количества вакансий в таблице."""
+
+        return len(self.__vacancies)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        """Магический метод перебора вакансий таблицы."""
+
+        return iter(self.__vacancies)
+
+    @property
+    def salary(self) -> np.ndarray:
+        """Массив зарплат вакансий таблицы (только для чтения)."""
+
+        salary = self.__salary.view()
+        salary.flags.writeable = False
+        return salary
+
+    def to_list(self) -> list[Vacancy]:
+        """Метод получения списка вакансий таблицы."""
+
+        return list(self.__vacancies)
+
+    def mask(self, mask: np.ndarray) -> "VacancyTable":
+        """Метод выбора вакансий по булевой маске длины len(table)."""
+
+        return self.__take(np.flatnonzero(mask))
+
+    def category_mask(self, column: str, value: str) -> np.ndarray:
+        """Метод получения булевой маски вакансий, у которых колонка column (employer, experience
+        или employment) равна value. Сравниваются целочисленные коды, а не строки."""
+
+        code = self.__categories[column].get(value)
+        if code is None:
+            return np.zeros(len(self), dtype=bool)
+        mask: np.ndarray = self.__codes[column] == code
+        return mask
+
+    def salary_mask(self, salary_from: int, salary_to: int) -> np.ndarray:
+        """Метод получения булевой маски вакансий с зарплатой в диапазоне [salary_from, salary_to]."""
+
+        return (self.__salary >= salary_from) & (self.__salary <= salary_to)
+
+    def keyword_mask(self, keywords: list[str]) -> np.ndarray:
+        """Метод получения булевой маски вакансий, в названии которых есть одно из ключевых слов."""
+
+        names = self.__names
+        if names is None:
+            names = self.__names = [v.name.lower() for v in self.__vacancies]
+        words = [word.lower() for word in keywords]
+        return np.fromiter(
+            (any(word in name for word in words) for name in names), dtype=bool, count=len(self)
+        )
+
+    def filter(self, column: str, value: str) -> "VacancyTable":
+        """Метод выбора вакансий, у которых колонка column равна value."""
+
+        return self.mask(self.category_mask(column, value))
+
+    def salary_range(self, salary_from: int, salary_to: int) -> "VacancyTable":
+        """Метод выбора вакансий с зарплатой в диапазоне [salary_from, salary_to]."""
+
+        return self.mask(self.salary_mask(salary_from, salary_to))
+
+    def search(self, keywords: list[str]) -> "VacancyTable":
+        """Метод выбора вакансий, в названии которых есть одно из ключевых слов."""
+
+        return self.mask(self.keyword_mask(keywords))
+
+    def sort(self) -> "VacancyTable":
+        """Метод сортировки вакансий по убыванию зарплаты. Вакансии с одинаковой зарплатой
+        остаются в исходном порядке."""
+
+        return self.__take(np.argsort(-self.__salary, kind="stable"))
+
+    def top(self, top_n: int) -> "VacancyTable":
+        """Метод выбора топ N вакансий по убыванию зарплаты. Кандидаты выбираются argpartition
+        за линейное время, сортируются только N выбранных вакансий. Результат совпадает с первыми
+        N вакансиями отсортированной таблицы."""
+
+        if top_n <= 0:
+            return self.__take(np.empty(0, dtype=np.intp))
+        if top_n >= len(self):
+            return self.sort()
+
+        # Зарплата N-й по величине вакансии
+        threshold = self.__salary[np.argpartition(-self.__salary, top_n - 1)[top_n - 1]]
+        greater = np.flatnonzero(self.__salary > threshold)
+        # Из вакансий с пограничной зарплатой берутся первые по порядку, как при устойчивой сортировке
+        equal = np.flatnonzero(self.__salary == threshold)[:top_n - len(greater)]
+        indices = np.concatenate((greater, equal))
+        indices.sort()
+        return self.__take(indices[np.argsort(-self.__salary[indices], kind="stable")])
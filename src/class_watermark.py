@@ -0,0 +1,39 @@
+import json
+from datetime import datetime
+from src.class_file_work import atomic_write
+
+
+class WatermarkStore:
+    """Класс для хранения отметок инкрементальной загрузки: для каждого ключевого слова
+    сохраняется время публикации самой новой из уже загруженных вакансий."""
+
+    def __init__(self, filename: str = "data/watermarks.json"):
+        """Конструктор класса WatermarkStore."""
+
+        self.__filename = filename
+
+    def __read(self) -> dict[str, str]:
+        """Приватный метод чтения всех отметок из JSON-файла."""
+
+        try:
+            with open(self.__filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, keyword: str) -> datetime | None:
+        """Метод получения отметки для ключевого слова. Возвращает None, если по этому
+        ключевому слову вакансии еще не загружались."""
+
+        value = self.__read().get(keyword)
+        return datetime.fromisoformat(value) if value else None
+
+    def set(self, keyword: str, published_at: datetime) -> None:
+        """Метод сохранения отметки для ключевого слова. Файл записывается через временный файл,
+        поэтому сбой во время записи не повреждает сохраненные отметки."""
+
+        data = self.__read()
+        data[keyword] = published_at.isoformat()
+        with atomic_write(self.__filename) as f:
+            f.write(json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8"))
@@ -1,6 +1,7 @@
 from src.additional_functions import (check_currency, vacancy_objects, filter_vacancies,
                                       get_vacancies_by_salary, get_top_vacancies)
 from src.class_API import HH
+from src.class_file_cache import FileResponseCache
 from src.class_file_work import JSONFileWorker
 
 
@@ -12,8 +13,10 @@ def user_interaction() -> None:
 
     search = input("Какую вакансию вы хотите найти?:")
 
-    vacancy_from_hh_ru = HH()
+    vacancy_from_hh_ru = HH(cache=FileResponseCache())
     vacancy_from_hh_ru.load_vacancies(search)
+    print(f"Выполнено запросов к API: {vacancy_from_hh_ru.requests_issued}, "
+          f"пропущено лишних запросов: {vacancy_from_hh_ru.requests_skipped}.")
 
     print("Производится поиск вакансий с валютой в рублях....")
 
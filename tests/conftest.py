@@ -0,0 +1,42 @@
+import pytest
+
+from src.class_vacancies import Vacancy
+
+
+@pytest.fixture
+def make_vacancy():
+    """Фикстура с функцией создания вакансии для тестов. Номер i задает ссылку на вакансию,
+    остальные поля по умолчанию одинаковы и переопределяются по имени."""
+
+    def make(
+            i: int = 0,
+            name: str = "Python Developer",
+            salary: int = 100000,
+            employer: str = "Company A",
+            snippet: str | None = "Опыт работы с Python",
+            experience: str = "Нет опыта",
+            employment: str = "Полная занятость"
+    ) -> Vacancy:
+        """Функция создания вакансии с заданными полями."""
+        return Vacancy(
+            name,
+            {"from": salary, "to": None},
+            f"https://hh.ru/vacancy/{i}",
+            {"name": employer},
+            {"requirement": snippet},
+            {"name": experience},
+            {"name": employment}
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_vacancies(make_vacancy):
+    """Фикстура с функцией создания списка вакансий с заданными зарплатами."""
+
+    def make(salaries: list[int]) -> list[Vacancy]:
+        """Функция создания вакансий с заданными зарплатами и разными ссылками."""
+        return [make_vacancy(i, salary=salary) for i, salary in enumerate(salaries)]
+
+    return make
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import Mock
 
@@ -5,6 +8,7 @@ from src.additional_functions import (check_currency, vacancy_objects, filter_va
                                       get_vacancies_by_salary, sort_vacancies, get_top_vacancies)
 from src.class_API import HH
 from src.class_vacancies import Vacancy
+from src.class_vacancy_table import VacancyTable
 
 
 class TestCheckCurrency:
@@ -274,6 +278,46 @@ class TestGetTopVacancies:
         assert result[1].salary == 110000
         assert result[2].salary == 100000  # Самая низкая
 
+    def test_get_top_vacancies_from_iterator(self):
+        """Тест выбора топ вакансий из генератора с равными зарплатами"""
+        vacancies = []
+        for salary in [100000, 150000, 150000, 120000]:
+            vacancy = Mock(spec=Vacancy)
+            vacancy.salary = salary
+            vacancies.append(vacancy)
+
+        result = get_top_vacancies((v for v in vacancies), 2)
+
+        assert result == [vacancies[1], vacancies[2]]
+
+
+class TestVacancyTableDispatch:
+    """Тесты передачи VacancyTable в функции вместо списка вакансий"""
+
+    @pytest.fixture
+    def vacancies(self, make_vacancy):
+        """Фикстура со списком вакансий"""
+        return [
+            make_vacancy(i, name, 100000 + (i % 3) * 20000, employer="Company")
+            for i, name in enumerate(["Python Developer", "Java Developer", "Senior Python", "Go Developer"])
+        ]
+
+    def test_functions_accept_table(self, vacancies):
+        """Тест совпадения результатов для списка и таблицы вакансий"""
+        table = VacancyTable(vacancies)
+
+        assert isinstance(filter_vacancies(table, ["python"]), VacancyTable)
+        assert filter_vacancies(table, ["python"]).to_list() == filter_vacancies(vacancies, ["python"])
+        assert (get_vacancies_by_salary(table, ["110000", "150000"]).to_list()
+                == get_vacancies_by_salary(vacancies, ["110000", "150000"]))
+        assert sort_vacancies(table).to_list() == sort_vacancies(vacancies)
+        assert get_top_vacancies(table, 2).to_list() == get_top_vacancies(vacancies, 2)
+
+    def test_numpy_not_imported(self):
+        """Тест что функции для списков вакансий не импортируют NumPy"""
+        code = "import sys, src.additional_functions; sys.exit('numpy' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
 
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
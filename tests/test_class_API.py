@@ -1,6 +1,22 @@
+import threading
+
 import pytest
+import requests
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock
 from src.class_API import HH
+from src.class_file_cache import FileResponseCache
+from src.class_health import ApiHealth
+from src.class_rate_limiter import RateLimiter
+from src.class_vacancies import Vacancy
+from src.class_watermark import WatermarkStore
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state(monkeypatch):
+    """Фикстура для сброса общего состояния доступности API и ограничителя частоты между тестами"""
+    monkeypatch.setattr(HH, '_health', ApiHealth())
+    monkeypatch.setattr(HH, '_rate_limiter', RateLimiter(rate=1000, capacity=1000))
 
 
 class TestHH:
@@ -20,29 +36,66 @@ class TestHH:
         }
         assert hh.vacancies == []
 
-    @pytest.mark.parametrize("status_code,expected", [
-        (200, True),
-        (404, None),
-        (500, None),
+    def test_get_connection_does_not_send_requests(self, mocker):
+        """Тест что _get_connection не выполняет отдельный запрос к API"""
+
+        hh = HH()
+        mock_get = mocker.patch('requests.Session.get')
+
+        assert hh._get_connection() is True
+        mock_get.assert_not_called()
+
+    @pytest.mark.parametrize("status_code, side_effect", [
+        (None, requests.exceptions.ConnectionError),
+        (503, None),
     ])
-    def test_get_connection_success(self, mocker, status_code, expected):
-        """Тест метода _get_connection с разными статус-кодами"""
+    def test_failed_page_request_is_shared_between_instances(self, mocker, capsys, status_code, side_effect):
+        """Тест что ошибка соединения или ответ 5xx после всех повторов сохраняется в общем состоянии
+        для всех экземпляров"""
+
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.headers = {}
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response, side_effect=side_effect)
+        mocker.patch.object(HH, 'MAX_RETRIES', 0)
 
         hh = HH()
+        hh.load_vacancies("Python")
+
+        assert mock_get.call_count == 1
+        assert hh.vacancies == []
+        assert "Ошибка соединения с сайтом" in capsys.readouterr().out
+
+        # Другой экземпляр не выполняет запросов, пока состояние не устарело
+        other = HH()
+        other.load_vacancies("Python")
+        assert mock_get.call_count == 1
+        assert "Ошибка загрузки данных с вакансиями." in capsys.readouterr().out
+
+    @pytest.mark.parametrize("status_code", [400, 403, 404])
+    def test_client_error_does_not_mark_api_down(self, mocker, capsys, status_code):
+        """Тест что ответ 4xx не считается недоступностью API и не блокирует другие экземпляры"""
+
         mock_response = Mock()
         mock_response.status_code = status_code
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response)
 
-        # Мокаем requests.get
-        mock_get = mocker.patch('requests.get', return_value=mock_response)
+        HH().load_vacancies("Python")
+        assert "Ошибка соединения с сайтом" in capsys.readouterr().out
 
-        result = hh._get_connection()
+        assert HH()._get_connection() is True
+        HH().load_vacancies("Python")
+        assert mock_get.call_count == 2
 
-        # Assert
-        mock_get.assert_called_once_with(
-            url=hh._HH__url,
-            headers=hh._HH__headers
-        )
-        assert result == expected
+    def test_health_state_expires_after_ttl(self, mocker):
+        """Тест что сохраненное состояние доступности устаревает через ttl секунд"""
+
+        HH._health.ttl = 0
+        HH._health.mark(False)
+
+        assert HH()._get_connection() is True
 
     def test_load_vacancies_failed_connection(self, mocker, capsys):
         """Тест загрузки вакансий при неудачном подключении"""
@@ -53,8 +106,8 @@ class TestHH:
         # Мокаем _get_connection чтобы вернуть None
         mocker.patch.object(hh, '_get_connection', return_value=None)
 
-        # Мокаем requests.get чтобы убедиться что он не вызывается
-        mock_get = mocker.patch('requests.get')
+        # Мокаем запросы сессии чтобы убедиться что они не выполняются
+        mock_get = mocker.patch('requests.Session.get')
 
         hh.load_vacancies(keyword)
 
@@ -64,7 +117,7 @@ class TestHH:
         # Проверяем что _get_connection был вызван
         assert hh._get_connection.call_count == 1
 
-        # Проверяем что requests.get не вызывался
+        # Проверяем что запросы не выполнялись
         mock_get.assert_not_called()
 
         # Проверяем что список вакансий пуст
@@ -102,7 +155,7 @@ class TestHH:
                 yield mock_resp
 
         # Создаем side_effect для имитации разных ответов на разных страницах
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.side_effect = list(mock_response_generator())
 
         hh.load_vacancies("Python")
@@ -135,7 +188,7 @@ class TestHH:
         mocker.patch.object(hh, '_get_connection', return_value=True)
         mock_response = Mock()
         mock_response.json.return_value = {'items': []}
-        mocker.patch('requests.get', return_value=mock_response)
+        mocker.patch('requests.Session.get', return_value=mock_response)
 
         hh.load_vacancies(keyword)
 
@@ -153,7 +206,7 @@ class TestHH:
         # Создаем бесконечный генератор ответов
         mock_response = Mock()
         mock_response.json.return_value = {'items': [{'id': '1'}]}
-        mock_get = mocker.patch('requests.get', return_value=mock_response)
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response)
 
         hh.load_vacancies("Test")
 
@@ -199,7 +252,7 @@ class TestHH:
 
         mock_response = Mock()
         mock_response.json.return_value = {'items': [mock_vacancy]}
-        mocker.patch('requests.get', return_value=mock_response)
+        mocker.patch('requests.Session.get', return_value=mock_response)
 
         hh.load_vacancies("Python")
 
@@ -224,7 +277,7 @@ class TestHH:
         mocker.patch.object(hh, '_get_connection', return_value=True)
         mock_response = Mock()
         mock_response.json.return_value = {'items': []}
-        mock_get = mocker.patch('requests.get', return_value=mock_response)
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response)
 
         hh.load_vacancies("Test")
 
@@ -232,3 +285,632 @@ class TestHH:
         for call_args in mock_get.call_args_list:
             params = call_args[1]['params']
             assert params['only_with_salary'] is True
+
+    def test_load_vacancies_concurrent_keeps_page_order(self, mocker):
+        """Тест параллельной загрузки: вакансии идут в порядке страниц"""
+
+        hh = HH(concurrency=5)
+        mocker.patch.object(hh, '_get_connection', return_value=True)
+
+        def fake_get(url, headers, params):
+            """Ответ зависит от номера запрошенной страницы"""
+            mock_resp = Mock()
+            mock_resp.json.return_value = {'items': [{'id': f"{params['page']}"}]}
+            return mock_resp
+
+        mock_session = Mock()
+        mock_session.get.side_effect = fake_get
+        mocker.patch.object(HH, '_get_session', return_value=mock_session)
+        mock_get = mocker.patch('requests.get')
+
+        hh.load_vacancies("Python")
+
+        # Все страницы загружены через общую сессию, а не через requests.get
+        assert mock_session.get.call_count == 20
+        mock_get.assert_not_called()
+
+        # Порядок вакансий совпадает с порядком страниц
+        assert [v['id'] for v in hh.vacancies] == [str(page) for page in range(20)]
+        assert hh._HH__params['page'] == 20
+
+    def test_get_session_is_shared(self):
+        """Тест что сессия с пулом соединений общая для всех экземпляров"""
+
+        assert HH()._get_session() is HH(concurrency=4)._get_session()
+
+    def test_serial_loading_uses_shared_session(self, mocker):
+        """Тест что последовательная загрузка тоже идет через общую сессию с пулом соединений"""
+
+        mock_session = Mock()
+        mock_session.get.return_value.json.return_value = {'items': [{'id': '1'}], 'pages': 1}
+        mocker.patch.object(HH, '_get_session', return_value=mock_session)
+        mock_get = mocker.patch('requests.get')
+
+        hh = HH()
+        hh.load_vacancies("Python")
+
+        assert hh.vacancies == [{'id': '1'}]
+        assert mock_session.get.call_count == 1
+        mock_get.assert_not_called()
+
+    def test_session_pool_sized_by_concurrency(self, monkeypatch):
+        """Тест что пул соединений общей сессии не меньше количества одновременных запросов"""
+
+        monkeypatch.setattr(HH, '_HH__session', None)
+        monkeypatch.setattr(HH, '_HH__pool_size', 0)
+
+        session = HH._get_session(1)
+        assert session.get_adapter('https://api.hh.ru')._pool_maxsize == 1
+        assert HH._get_session(8) is session
+        assert session.get_adapter('https://api.hh.ru')._pool_maxsize == 8
+        # Пул не уменьшается для экземпляров с меньшим количеством одновременных запросов
+        HH._get_session(2)
+        assert session.get_adapter('https://api.hh.ru')._pool_maxsize == 8
+
+    def test_load_vacancies_stops_after_last_real_page(self, mocker):
+        """Тест что загрузка прекращается после последней страницы из метаданных pages"""
+
+        hh = HH()
+        mocker.patch.object(hh, '_get_connection', return_value=True)
+
+        mock_response = Mock()
+        mock_response.json.return_value = {'items': [{'id': '1'}], 'pages': 3, 'found': 250}
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response)
+
+        hh.load_vacancies("Niche")
+
+        assert mock_get.call_count == 3
+        assert len(hh.vacancies) == 3
+        assert hh.requests_issued == 3
+        assert hh.requests_skipped == 17
+
+    def test_load_vacancies_empty_result_single_request(self, mocker):
+        """Тест что при пустой выдаче выполняется только один запрос"""
+
+        hh = HH()
+        mocker.patch.object(hh, '_get_connection', return_value=True)
+
+        mock_response = Mock()
+        mock_response.json.return_value = {'items': [], 'pages': 0, 'found': 0}
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response)
+
+        hh.load_vacancies("Nothing")
+
+        assert mock_get.call_count == 1
+        assert hh.requests_issued == 1
+        assert hh.requests_skipped == 19
+
+    def test_load_vacancies_concurrent_stops_after_last_real_page(self, mocker):
+        """Тест параллельной загрузки с учетом метаданных pages"""
+
+        hh = HH(concurrency=4)
+        mocker.patch.object(hh, '_get_connection', return_value=True)
+
+        def fake_get(url, headers, params):
+            """Ответ зависит от номера запрошенной страницы"""
+            mock_resp = Mock()
+            mock_resp.json.return_value = {'items': [{'id': f"{params['page']}"}], 'pages': 5}
+            return mock_resp
+
+        mock_session = Mock()
+        mock_session.get.side_effect = fake_get
+        mocker.patch.object(HH, '_get_session', return_value=mock_session)
+
+        hh.load_vacancies("Python")
+
+        assert mock_session.get.call_count == 5
+        assert [v['id'] for v in hh.vacancies] == ['0', '1', '2', '3', '4']
+        assert hh.requests_issued == 5
+        assert hh.requests_skipped == 15
+
+    def test_iter_vacancies_yields_rur_vacancy_objects(self, mocker):
+        """Тест генератора iter_vacancies: только рублевые вакансии в виде объектов Vacancy"""
+
+        hh = HH()
+        mocker.patch.object(hh, '_get_connection', return_value=True)
+
+        def make_item(currency):
+            return {
+                'name': 'Python Developer',
+                'salary': {'from': 100000, 'to': 200000, 'currency': currency},
+                'alternate_url': f'https://hh.ru/vacancy/{currency}',
+                'employer': {'name': 'Яндекс'},
+                'snippet': {'requirement': 'Python'},
+                'experience': {'name': 'От 1 года до 3 лет'},
+                'employment': {'name': 'Полная занятость'}
+            }
+
+        mock_response = Mock()
+        mock_response.json.return_value = {'items': [make_item('RUR'), make_item('USD')], 'pages': 2}
+        mocker.patch('requests.Session.get', return_value=mock_response)
+
+        vacancies = list(hh.iter_vacancies("Python"))
+
+        assert len(vacancies) == 2  # По одной рублевой вакансии на каждой из 2 страниц
+        assert all(isinstance(v, Vacancy) for v in vacancies)
+        assert vacancies[0].salary == 150000
+        # Сырые данные не накапливаются в экземпляре
+        assert hh.vacancies == []
+
+    def test_iter_vacancies_is_lazy(self, mocker):
+        """Тест что следующая страница запрашивается только по мере потребления генератора"""
+
+        hh = HH()
+        mocker.patch.object(hh, '_get_connection', return_value=True)
+
+        item = {
+            'name': 'Dev', 'salary': {'from': 1, 'to': None, 'currency': 'RUR'},
+            'alternate_url': 'url', 'employer': {'name': 'A'}, 'snippet': {'requirement': ''},
+            'experience': {'name': 'Нет опыта'}, 'employment': {'name': 'Полная занятость'}
+        }
+        mock_response = Mock()
+        mock_response.json.return_value = {'items': [item]}
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response)
+
+        generator = hh.iter_vacancies("Dev")
+        next(generator)
+
+        assert mock_get.call_count == 1
+
+    def test_iter_vacancies_failed_connection(self, mocker, capsys):
+        """Тест генератора при неудачном подключении"""
+
+        hh = HH()
+        mocker.patch.object(hh, '_get_connection', return_value=None)
+
+        assert list(hh.iter_vacancies("Python")) == []
+        assert "Ошибка загрузки данных с вакансиями." in capsys.readouterr().out
+
+    def test_load_vacancies_served_from_cache(self, mocker, tmp_path):
+        """Тест что повторный поиск берет свежие ответы из кеша без запросов к API"""
+
+        cache = FileResponseCache(str(tmp_path / "cache"), ttl=60)
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'ETag': '"v1"'}
+        mock_response.json.return_value = {'items': [{'id': '1'}], 'pages': 2}
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response)
+
+        HH(cache=cache).load_vacancies("Python")
+        assert mock_get.call_count == 2
+
+        hh = HH(cache=cache)
+        hh.load_vacancies("Python")
+
+        assert mock_get.call_count == 2
+        assert hh.vacancies == [{'id': '1'}, {'id': '1'}]
+
+    def test_stale_cache_revalidated_with_etag(self, mocker, tmp_path):
+        """Тест что устаревший ответ проверяется по ETag и берется из кеша при ответе 304"""
+
+        cache = FileResponseCache(str(tmp_path / "cache"), ttl=0)
+        params = {'text': 'Python', 'page': 0, 'per_page': 100, 'only_with_salary': True}
+        cache.put('https://api.hh.ru/vacancies', params, {'items': [{'id': 'cached'}], 'pages': 1}, etag='"v1"')
+
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_get = mocker.patch('requests.Session.get', return_value=mock_response)
+
+        hh = HH(cache=cache)
+        hh.load_vacancies("Python")
+
+        assert mock_get.call_args[1]['headers']['If-None-Match'] == '"v1"'
+        mock_response.json.assert_not_called()
+        assert hh.vacancies == [{'id': 'cached'}]
+
+    def test_retry_on_429_honours_retry_after(self, mocker):
+        """Тест повтора запроса после ответа 429 с учетом заголовка Retry-After"""
+
+        throttled = Mock()
+        throttled.status_code = 429
+        throttled.headers = {'Retry-After': '7'}
+        ok = Mock()
+        ok.status_code = 200
+        ok.json.return_value = {'items': [{'id': '1'}], 'pages': 1}
+
+        mock_get = mocker.patch('requests.Session.get', side_effect=[throttled, ok])
+        mock_sleep = mocker.patch('src.class_API.time.sleep')
+        rate_before = HH._rate_limiter.rate
+
+        hh = HH()
+        hh.load_vacancies("Python")
+
+        assert mock_get.call_count == 2
+        assert hh.vacancies == [{'id': '1'}]
+        # Задержка не меньше значения из Retry-After
+        assert mock_sleep.call_args[0][0] >= 7
+        # Частота запросов уменьшена после 429 и снова растет после успешного ответа
+        assert HH._rate_limiter.rate < rate_before
+
+    def test_retry_on_server_error_and_connection_error(self, mocker):
+        """Тест повторов при ошибках сервера и соединения"""
+
+        server_error = Mock()
+        server_error.status_code = 503
+        server_error.headers = {}
+        ok = Mock()
+        ok.status_code = 200
+        ok.json.return_value = {'items': [{'id': '1'}], 'pages': 1}
+
+        mock_get = mocker.patch(
+            'requests.Session.get',
+            side_effect=[requests.exceptions.ConnectionError, server_error, ok]
+        )
+        mocker.patch('src.class_API.time.sleep')
+
+        hh = HH()
+        hh.load_vacancies("Python")
+
+        assert mock_get.call_count == 3
+        assert hh.vacancies == [{'id': '1'}]
+        assert hh._get_connection() is True
+
+    def test_gives_up_after_max_retries(self, mocker, capsys):
+        """Тест что после исчерпания повторов загрузка прекращается без исключения"""
+
+        server_error = Mock()
+        server_error.status_code = 500
+        server_error.headers = {}
+        server_error.raise_for_status.side_effect = requests.exceptions.HTTPError
+        mock_get = mocker.patch('requests.Session.get', return_value=server_error)
+        mocker.patch('src.class_API.time.sleep')
+
+        hh = HH()
+        hh.load_vacancies("Python")
+
+        assert mock_get.call_count == HH.MAX_RETRIES + 1
+        assert hh.vacancies == []
+        assert "Ошибка соединения с сайтом" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("body", [
+        requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0),
+        {'errors': [{'type': 'captcha_required'}]},
+    ])
+    def test_invalid_response_does_not_crash(self, mocker, capsys, body):
+        """Тест что ответ не в формате JSON или без списка вакансий не прерывает работу программы"""
+
+        response = Mock()
+        response.status_code = 200
+        if isinstance(body, Exception):
+            response.json.side_effect = body
+        else:
+            response.json.return_value = body
+        mocker.patch('requests.Session.get', return_value=response)
+
+        hh = HH()
+        hh.load_vacancies("Python")
+
+        assert hh.vacancies == []
+        assert "Ошибка соединения с сайтом" in capsys.readouterr().out
+
+    def test_load_many_deduplicates_across_keywords(self, mocker):
+        """Тест загрузки по нескольким ключевым словам без дубликатов"""
+
+        pages = {
+            'python': [{'id': '1'}, {'id': '2'}],
+            'django': [{'id': '2'}, {'id': '3'}],
+            'fastapi': [{'alternate_url': 'https://hh.ru/vacancy/4'}, {'id': '1'}],
+        }
+
+        def fake_get(url, headers, params):
+            """Ответ зависит от ключевого слова"""
+            mock_resp = Mock()
+            mock_resp.json.return_value = {'items': pages[params['text']], 'pages': 1}
+            return mock_resp
+
+        mocker.patch('requests.Session.get', side_effect=fake_get)
+
+        hh = HH()
+        hh.load_many(['python', 'django', 'fastapi'])
+
+        assert hh.vacancies == [
+            {'id': '1'}, {'id': '2'}, {'id': '3'}, {'alternate_url': 'https://hh.ru/vacancy/4'}
+        ]
+
+    def test_iter_many_yields_unique_rur_vacancies(self, mocker):
+        """Тест генератора iter_many: дубликаты отбрасываются до создания объектов Vacancy"""
+
+        def make_item(vacancy_id, currency='RUR'):
+            return {
+                'id': vacancy_id,
+                'name': f'Вакансия {vacancy_id}',
+                'salary': {'from': 100000, 'to': None, 'currency': currency},
+                'alternate_url': f'https://hh.ru/vacancy/{vacancy_id}',
+                'employer': {'name': 'Компания'},
+                'snippet': {'requirement': 'Python'},
+                'experience': {'name': 'Нет опыта'},
+                'employment': {'name': 'Полная занятость'}
+            }
+
+        pages = {
+            'python': [make_item('1'), make_item('2', 'USD')],
+            'django': [make_item('1'), make_item('3')],
+        }
+
+        def fake_get(url, headers, params):
+            """Ответ зависит от ключевого слова"""
+            mock_resp = Mock()
+            mock_resp.json.return_value = {'items': pages[params['text']], 'pages': 1}
+            return mock_resp
+
+        mocker.patch('requests.Session.get', side_effect=fake_get)
+        mock_vacancy = mocker.patch('src.class_API.Vacancy', wraps=Vacancy)
+
+        vacancies = list(HH().iter_many(['python', 'django']))
+
+        assert [v.alternate_url for v in vacancies] == ['https://hh.ru/vacancy/1', 'https://hh.ru/vacancy/3']
+        # Объекты создаются только для уникальных рублевых вакансий
+        assert mock_vacancy.call_count == 2
+
+
+class FakeSearchAPI:
+    """Имитация поиска API HH.ru: фильтрация по дате публикации и постраничная выдача
+    не больше 20 страниц по per_page вакансий"""
+
+    def __init__(self, total, days=60):
+        now = datetime.now(timezone.utc)
+        step = timedelta(days=days) / total
+        self.items = [
+            {'id': str(i), 'published_at': now - step * i, 'alternate_url': f'https://hh.ru/vacancy/{i}'}
+            for i in range(total)
+        ]
+        self.calls = []
+
+    def __call__(self, url, headers, params):
+        self.calls.append(dict(params))
+        date_from = params.get('date_from')
+        date_to = params.get('date_to')
+        found = [
+            item for item in self.items
+            if (date_from is None or item['published_at'] >= datetime.fromisoformat(date_from))
+            and (date_to is None or item['published_at'] <= datetime.fromisoformat(date_to))
+        ]
+        per_page = params['per_page']
+        page = params['page']
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            'items': [{'id': item['id'], 'alternate_url': item['alternate_url'],
+                       'published_at': item['published_at'].isoformat()}
+                      for item in found[page * per_page:(page + 1) * per_page]],
+            'found': len(found),
+            'pages': min(-(-len(found) // per_page), 20),
+        }
+        return response
+
+
+class TestHHPartitioning:
+    """Тесты разбиения запросов, выдача которых превышает 2000 вакансий"""
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_large_result_set_is_loaded_completely(self, mocker, concurrency):
+        """Тест что при found больше 2000 загружаются все вакансии без дубликатов"""
+
+        api = FakeSearchAPI(total=4500)
+        mocker.patch('requests.Session.get', side_effect=api)
+        mock_session = Mock()
+        mock_session.get.side_effect = api
+        mocker.patch.object(HH, '_get_session', return_value=mock_session)
+
+        hh = HH(concurrency=concurrency)
+        hh.load_vacancies("Python")
+
+        ids = [v['id'] for v in hh.vacancies]
+        assert len(ids) == 4500
+        assert hh.partitions_truncated == 0
+        assert set(ids) == {str(i) for i in range(4500)}
+        # Все запросы частей ограничены датой публикации
+        assert all('date_to' in params for params in api.calls[1:])
+
+    @pytest.mark.parametrize("concurrency", [2, 4])
+    def test_partition_pages_are_yielded_before_all_probes_finish(self, mocker, concurrency):
+        """Тест что части проверяются параллельно, и первая страница части возвращается сразу,
+        не дожидаясь проверки остальных частей"""
+
+        api = FakeSearchAPI(total=4500)
+        released = threading.Event()
+        answered = threading.Event()
+
+        def slow_api(url, headers, params):
+            # Запрос более старых вакансий (без нижней границы) ждет, пока тест его не отпустит
+            if 'date_to' in params and 'date_from' not in params and params['page'] == 0:
+                released.wait(timeout=5)
+                answered.set()
+            return api(url, headers, params)
+
+        mocker.patch('requests.Session.get', side_effect=slow_api)
+        hh = HH(concurrency=concurrency)
+
+        pages = hh._HH__iter_pages("Python")
+        first = next(pages)
+        assert first and not answered.is_set()
+
+        released.set()
+        ids = [v['id'] for v in first] + [v['id'] for items in pages for v in items]
+        assert sorted(ids, key=int) == [str(i) for i in range(4500)]
+
+    def test_truncated_partitions_are_reported(self, mocker, monkeypatch, capsys):
+        """Тест что части, которые нельзя разделить дальше, учитываются как загруженные не полностью"""
+
+        api = FakeSearchAPI(total=4500)
+        mocker.patch('requests.Session.get', side_effect=api)
+        monkeypatch.setattr(HH, 'MAX_PARTITIONS', 1)
+
+        hh = HH()
+        hh.load_vacancies("Python")
+
+        assert len(hh.vacancies) == 4000
+        assert hh.partitions_truncated == 2
+        assert "загружены не все вакансии" in capsys.readouterr().out
+
+    def test_small_result_set_is_not_partitioned(self, mocker):
+        """Тест что выдача в пределах 2000 вакансий загружается обычным образом"""
+
+        api = FakeSearchAPI(total=250)
+        mocker.patch('requests.Session.get', side_effect=api)
+
+        hh = HH()
+        hh.load_vacancies("Python")
+
+        assert len(hh.vacancies) == 250
+        assert len(api.calls) == 3
+        assert all('date_to' not in params for params in api.calls)
+
+    def test_partitioning_can_be_disabled(self, mocker):
+        """Тест что без разбиения загружается не больше 2000 вакансий"""
+
+        api = FakeSearchAPI(total=4500)
+        mocker.patch('requests.Session.get', side_effect=api)
+
+        hh = HH(partition=False)
+        hh.load_vacancies("Python")
+
+        assert len(hh.vacancies) == 2000
+        assert len(api.calls) == 20
+
+
+class TestHHIncremental:
+    """Тесты инкрементальной загрузки вакансий"""
+
+    @staticmethod
+    def make_api(items_by_page):
+        """Имитация ответа API с заданными страницами"""
+
+        def fake_get(url, headers, params):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {
+                'items': items_by_page[params['page']],
+                'pages': len(items_by_page),
+            }
+            return response
+        return fake_get
+
+    def test_first_run_loads_everything_and_sets_watermark(self, mocker, tmp_path):
+        """Тест первой загрузки: загружаются все вакансии, отметка равна самой новой публикации"""
+
+        watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+        pages = [
+            [{'id': '3', 'published_at': '2024-01-15T12:00:00+0300'},
+             {'id': '2', 'published_at': '2024-01-15T11:00:00+0300'}],
+            [{'id': '1', 'published_at': '2024-01-15T10:00:00+0300'}],
+        ]
+        mock_get = mocker.patch('requests.Session.get', side_effect=self.make_api(pages))
+
+        hh = HH()
+        hh.load_incremental("Python", watermarks)
+
+        assert [v['id'] for v in hh.vacancies] == ['3', '2', '1']
+        assert watermarks.get("Python") == datetime.fromisoformat('2024-01-15T12:00:00+0300')
+        params = mock_get.call_args_list[0][1]['params']
+        assert params['order_by'] == 'publication_time'
+        assert 'date_from' not in params
+
+    def test_next_run_stops_at_known_vacancies(self, mocker, tmp_path):
+        """Тест повторной загрузки: только новые вакансии, загрузка останавливается на известной"""
+
+        watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+        watermarks.set("Python", datetime.fromisoformat('2024-01-15T12:00:00+0300'))
+        pages = [
+            [{'id': '5', 'published_at': '2024-01-15T14:00:00+0300'},
+             {'id': '4', 'published_at': '2024-01-15T13:00:00+0300'},
+             {'id': '3', 'published_at': '2024-01-15T12:00:00+0300'}],
+            [{'id': '2', 'published_at': '2024-01-15T11:00:00+0300'}],
+            [{'id': '1', 'published_at': '2024-01-15T10:00:00+0300'}],
+        ]
+        mock_get = mocker.patch('requests.Session.get', side_effect=self.make_api(pages))
+
+        hh = HH()
+        hh.load_incremental("Python", watermarks)
+
+        assert [v['id'] for v in hh.vacancies] == ['5', '4']
+        assert mock_get.call_count == 1
+        assert mock_get.call_args[1]['params']['date_from'] == '2024-01-15T12:00:00+03:00'
+        assert watermarks.get("Python") == datetime.fromisoformat('2024-01-15T14:00:00+0300')
+
+    def test_parallel_loading_stops_at_known_vacancies(self, mocker, tmp_path):
+        """Тест что при concurrency > 1 следующие страницы не запрашиваются после известной вакансии"""
+
+        watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+        watermarks.set("Python", datetime.fromisoformat('2024-01-15T12:00:00+0300'))
+        pages = [
+            [{'id': '5', 'published_at': '2024-01-15T14:00:00+0300'},
+             {'id': '4', 'published_at': '2024-01-15T13:00:00+0300'}],
+            [{'id': '3', 'published_at': '2024-01-15T12:00:00+0300'}],
+            [{'id': '2', 'published_at': '2024-01-15T11:00:00+0300'}],
+            [{'id': '1', 'published_at': '2024-01-15T10:00:00+0300'}],
+        ]
+        mock_get = mocker.patch('requests.Session.get', side_effect=self.make_api(pages))
+
+        hh = HH(concurrency=4)
+        hh.load_incremental("Python", watermarks)
+
+        assert [v['id'] for v in hh.vacancies] == ['5', '4']
+        assert mock_get.call_count == 2
+
+    def test_watermark_not_moved_on_error(self, mocker, tmp_path, capsys):
+        """Тест что при ошибке загрузки отметка не сдвигается"""
+
+        watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+        ok = Mock()
+        ok.status_code = 200
+        ok.json.return_value = {'items': [{'id': '2', 'published_at': '2024-01-15T11:00:00+0300'}], 'pages': 2}
+        mocker.patch('requests.Session.get', side_effect=[ok, requests.exceptions.ConnectionError] * 10)
+        mocker.patch('src.class_API.time.sleep')
+        mocker.patch.object(HH, 'MAX_RETRIES', 0)
+
+        HH().load_incremental("Python", watermarks)
+
+        assert watermarks.get("Python") is None
+        assert "Ошибка соединения с сайтом" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("since_days", [None, 30])
+    def test_large_increment_is_partitioned(self, mocker, tmp_path, since_days):
+        """Тест что при новых вакансиях больше 2000 загружаются все они, а отметка сдвигается"""
+
+        api = FakeSearchAPI(total=4500)
+        mocker.patch('requests.Session.get', side_effect=api)
+        watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+        expected = api.items
+        if since_days is not None:
+            since = datetime.now(timezone.utc) - timedelta(days=since_days)
+            watermarks.set("Python", since)
+            expected = [item for item in api.items if item['published_at'] > since]
+
+        hh = HH()
+        hh.load_incremental("Python", watermarks)
+
+        assert sorted(v['id'] for v in hh.vacancies) == sorted(item['id'] for item in expected)
+        assert watermarks.get("Python") == api.items[0]['published_at']
+        if since_days is not None:
+            assert all(params['date_from'] >= since.isoformat() for params in api.calls)
+
+    def test_watermark_not_moved_past_gap(self, mocker, tmp_path, capsys):
+        """Тест что без разбиения запроса отметка не сдвигается, если загружены не все новые вакансии"""
+
+        api = FakeSearchAPI(total=4500)
+        mocker.patch('requests.Session.get', side_effect=api)
+        watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+
+        hh = HH(partition=False)
+        hh.load_incremental("Python", watermarks)
+
+        assert len(hh.vacancies) == 2000
+        assert watermarks.get("Python") is None
+        assert "Загружены не все новые вакансии" in capsys.readouterr().out
+
+    def test_watermark_not_moved_past_truncated_partition(self, mocker, monkeypatch, tmp_path, capsys):
+        """Тест что отметка не сдвигается, если часть разбитого запроса загружена не полностью"""
+
+        api = FakeSearchAPI(total=4500)
+        mocker.patch('requests.Session.get', side_effect=api)
+        monkeypatch.setattr(HH, 'MAX_PARTITIONS', 1)
+        watermarks = WatermarkStore(str(tmp_path / "watermarks.json"))
+
+        hh = HH()
+        hh.load_incremental("Python", watermarks)
+
+        assert len(hh.vacancies) == 4000
+        assert watermarks.get("Python") is None
+        assert "Загружены не все новые вакансии" in capsys.readouterr().out
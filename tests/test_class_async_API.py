@@ -0,0 +1,177 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from src.class_Parser import Parser
+from src.class_async_API import AsyncHH, search_many
+from src.class_health import ApiHealth
+
+
+@pytest.fixture(autouse=True)
+def reset_health(monkeypatch):
+    """Фикстура для сброса общего состояния доступности API между тестами"""
+    monkeypatch.setattr(AsyncHH, '_health', ApiHealth())
+
+
+async def start_stub_server(handler):
+    """Запуск локального тестового сервера, имитирующего API HH.ru"""
+
+    app = web.Application()
+    app.router.add_get('/vacancies', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f'http://127.0.0.1:{port}/vacancies'
+
+
+class TestAsyncHH:
+    """Тесты для класса AsyncHH и функции search_many"""
+
+    def test_inheritance(self):
+        """Тест, что класс реализует контракт Parser"""
+
+        assert issubclass(AsyncHH, Parser)
+
+    def test_load_vacancies_from_stub_server(self):
+        """Тест загрузки всех страниц с локального сервера в порядке страниц"""
+
+        async def handler(request):
+            # Отдельного запроса для проверки соединения (без номера страницы) быть не должно
+            assert 'page' in request.query
+            page = request.query['page']
+            return web.json_response({'items': [{'id': f"{request.query['text']}_{page}"}]})
+
+        async def main():
+            runner, url = await start_stub_server(handler)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    hh = AsyncHH(session, url=url)
+                    await hh.load_vacancies("python")
+                return hh.vacancies
+            finally:
+                await runner.cleanup()
+
+        vacancies = asyncio.run(main())
+
+        assert [v['id'] for v in vacancies] == [f'python_{page}' for page in range(20)]
+
+    def test_load_vacancies_failed_connection(self, capsys):
+        """Тест загрузки вакансий при ответе сервера с ошибкой на запрос страницы"""
+
+        async def handler(request):
+            return web.json_response({}, status=503)
+
+        async def main():
+            runner, url = await start_stub_server(handler)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    hh = AsyncHH(session, url=url)
+                    await hh.load_vacancies("python")
+                return hh.vacancies
+            finally:
+                await runner.cleanup()
+
+        assert asyncio.run(main()) == []
+        assert "Ошибка соединения с сайтом" in capsys.readouterr().out
+        # Ошибка сохранена в общем состоянии, и следующий поиск не выполняет запросов
+        assert asyncio.run(AsyncHH(session=None)._get_connection()) is False
+
+    def test_client_error_does_not_mark_api_down(self, capsys):
+        """Тест что ответ 4xx на запрос страницы не считается недоступностью API"""
+
+        async def handler(request):
+            return web.json_response({}, status=400)
+
+        async def main():
+            runner, url = await start_stub_server(handler)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    hh = AsyncHH(session, url=url)
+                    await hh.load_vacancies("python")
+                return hh.vacancies
+            finally:
+                await runner.cleanup()
+
+        assert asyncio.run(main()) == []
+        assert "Ошибка соединения с сайтом" in capsys.readouterr().out
+        assert asyncio.run(AsyncHH(session=None)._get_connection()) is True
+
+    @pytest.mark.parametrize("body, content_type", [
+        ('{"errors": [{"type": "bad_argument"}]}', 'application/json'),
+        ('{"items": [', 'application/json'),
+        ('<html></html>', 'text/html'),
+    ])
+    def test_invalid_response_does_not_abort_other_searches(self, capsys, body, content_type):
+        """Тест что некорректный ответ по одному ключевому слову не прерывает поиск по остальным"""
+
+        async def handler(request):
+            if request.query['text'] == 'broken':
+                return web.Response(text=body, content_type=content_type)
+            return web.json_response({'items': [{'id': request.query['page']}], 'pages': 1})
+
+        async def main():
+            runner, url = await start_stub_server(handler)
+            try:
+                return await search_many(["python", "broken", "django"], url=url)
+            finally:
+                await runner.cleanup()
+
+        result = asyncio.run(main())
+
+        assert result == {"python": [{'id': '0'}], "broken": [], "django": [{'id': '0'}]}
+        assert "Ошибка соединения с сайтом" in capsys.readouterr().out
+
+    def test_search_many_respects_in_flight_limit(self):
+        """Тест что общее ограничение одновременных запросов соблюдается для всех поисков"""
+
+        state = {'in_flight': 0, 'max_in_flight': 0}
+
+        async def handler(request):
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+            await asyncio.sleep(0.001)
+            state['in_flight'] -= 1
+            return web.json_response({'items': [{'id': request.query.get('page')}]})
+
+        async def main():
+            runner, url = await start_stub_server(handler)
+            try:
+                return await search_many(["python", "django", "fastapi"], max_in_flight=3, url=url)
+            finally:
+                await runner.cleanup()
+
+        result = asyncio.run(main())
+
+        assert set(result) == {"python", "django", "fastapi"}
+        assert all(len(vacancies) == 20 for vacancies in result.values())
+        assert state['max_in_flight'] <= 3
+
+    def test_load_vacancies_stops_after_last_real_page(self):
+        """Тест что загрузка прекращается после последней страницы из метаданных pages"""
+
+        requested_pages = []
+
+        async def handler(request):
+            if 'page' in request.query:
+                requested_pages.append(int(request.query['page']))
+            return web.json_response({'items': [{'id': request.query.get('page')}], 'pages': 2})
+
+        async def main():
+            runner, url = await start_stub_server(handler)
+            try:
+                async with aiohttp.ClientSession() as session:
+                    hh = AsyncHH(session, url=url)
+                    await hh.load_vacancies("niche")
+                return hh
+            finally:
+                await runner.cleanup()
+
+        hh = asyncio.run(main())
+
+        assert sorted(requested_pages) == [0, 1]
+        assert [v['id'] for v in hh.vacancies] == ['0', '1']
+        assert hh.requests_issued == 2
+        assert hh.requests_skipped == 18
@@ -0,0 +1,84 @@
+import os
+import time
+
+import pytest
+from src.class_abs_cache import ResponseCache
+from src.class_file_cache import FileResponseCache
+
+URL = 'https://api.hh.ru/vacancies'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Фикстура для создания кеша во временной папке."""
+    return FileResponseCache(str(tmp_path / "cache"), ttl=60)
+
+
+class TestFileResponseCache:
+    """Тесты для класса FileResponseCache."""
+
+    def test_inheritance(self, cache):
+        """Тест, что класс наследуется от ResponseCache."""
+        assert isinstance(cache, ResponseCache)
+
+    def test_get_missing(self, cache):
+        """Тест получения ответа, которого нет в кеше."""
+        assert cache.get(URL, {'text': 'python', 'page': 0}) is None
+
+    def test_put_and_get(self, cache):
+        """Тест сохранения и получения ответа вместе с заголовками проверки."""
+        params = {'text': 'python', 'page': 0}
+        cache.put(URL, params, {'items': [{'id': '1'}]}, etag='"abc"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+
+        entry = cache.get(URL, params)
+        assert entry['body'] == {'items': [{'id': '1'}]}
+        assert entry['etag'] == '"abc"'
+        assert entry['last_modified'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+        assert entry['fresh'] is True
+
+    def test_key_depends_on_params(self, cache):
+        """Тест, что ответы для разных параметров хранятся отдельно."""
+        cache.put(URL, {'text': 'python', 'page': 0}, {'items': [1]})
+        cache.put(URL, {'text': 'python', 'page': 1}, {'items': [2]})
+
+        assert cache.get(URL, {'page': 0, 'text': 'python'})['body'] == {'items': [1]}
+        assert cache.get(URL, {'text': 'python', 'page': 1})['body'] == {'items': [2]}
+        assert cache.get(URL, {'text': 'java', 'page': 0}) is None
+
+    def test_stale_entry_and_refresh(self, tmp_path):
+        """Тест устаревания ответа и продления срока жизни после ответа 304."""
+        cache = FileResponseCache(str(tmp_path / "cache"), ttl=0)
+        params = {'text': 'python', 'page': 0}
+        cache.put(URL, params, {'items': []}, etag='"abc"')
+
+        assert cache.get(URL, params)['fresh'] is False
+
+        cache.ttl = 60
+        cache.refresh(URL, params)
+        entry = cache.get(URL, params)
+        assert entry['fresh'] is True
+        assert entry['etag'] == '"abc"'
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Тест вытеснения давно не использованных ответов при превышении размера."""
+        directory = tmp_path / "cache"
+        cache = FileResponseCache(str(directory), max_bytes=10 ** 6)
+        body = {'items': ['x' * 400]}
+
+        cache.put(URL, {'page': 0}, body)
+        cache.put(URL, {'page': 1}, body)
+        entry_size = next(directory.iterdir()).stat().st_size
+
+        # Делаем оба ответа "старыми", затем обращаемся ко второму
+        past = time.time() - 1000
+        for path in directory.iterdir():
+            os.utime(path, (past, past))
+        cache.get(URL, {'page': 1})
+
+        # В кеш помещаются только два ответа: вытесняется давно не использованный первый
+        cache.max_bytes = entry_size * 2 + 100
+        cache.put(URL, {'page': 2}, body)
+
+        assert cache.get(URL, {'page': 0}) is None
+        assert cache.get(URL, {'page': 1}) is not None
+        assert cache.get(URL, {'page': 2}) is not None
@@ -1,11 +1,12 @@
 import json
+import multiprocessing
 import pytest
 import tempfile
 import os
 from unittest.mock import Mock
 from src.class_abs_file_work import FileWorker
 from src.class_vacancies import Vacancy
-from src.class_file_work import JSONFileWorker
+from src.class_file_work import JSONFileWorker, atomic_write
 
 
 @pytest.fixture
@@ -15,9 +16,10 @@ def temp_file():
         f.write('[]')  # Создаем пустой JSON файл
         temp_path = f.name
     yield temp_path
-    # Удаляем временный файл после теста
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    # Удаляем временный файл после теста вместе с индексом, списком удаленных вакансий и блокировкой
+    for path in (temp_path, f"{temp_path}.idx", f"{temp_path}.deleted", f"{temp_path}.lock", f"{temp_path}.corrupt"):
+        if os.path.exists(path):
+            os.unlink(path)
 
 
 @pytest.fixture
@@ -168,12 +170,18 @@ class TestJSONFileWorker:
         worker.delete_data("https://hh.ru/vacancy/1")
 
         # Проверяем, что осталась только одна вакансия
-        with open(temp_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = worker.get_data()
 
         assert len(data) == 1
         assert data[0]["alternate_url"] == "https://hh.ru/vacancy/2"
 
+        # При следующем сохранении удаленная вакансия убирается из файла
+        worker.load_data([])
+        with open(temp_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        assert [v["alternate_url"] for v in data] == ["https://hh.ru/vacancy/2"]
+
     def test_delete_data_non_existing_url(self, temp_file, sample_vacancies):
         """Тест удаления по несуществующему URL."""
         worker = JSONFileWorker(temp_file)
@@ -215,6 +223,218 @@ class TestJSONFileWorker:
         worker = JSONFileWorker()
         assert isinstance(worker, FileWorker)
 
+    def test_delete_many(self, temp_file, sample_vacancies):
+        """Тест удаления нескольких вакансий одним вызовом."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+
+        worker.delete_many(["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2", "https://hh.ru/vacancy/999"])
+
+        assert worker.get_data() == []
+        # В список удаленных попадают только сохраненные вакансии
+        # Первая строка списка - признаки версии файла, к которой он относится
+        with open(f"{temp_file}.deleted", 'r', encoding='utf-8') as f:
+            assert f.read().splitlines()[1:] == ["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2"]
+
+    def test_delete_does_not_rewrite_file(self, temp_file, sample_vacancies):
+        """Тест что удаление не перечитывает и не перезаписывает JSON-файл."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+        with open(temp_file, 'rb') as f:
+            before = f.read()
+
+        worker.delete_data("https://hh.ru/vacancy/1")
+
+        with open(temp_file, 'rb') as f:
+            assert f.read() == before
+
+    def test_deleted_vacancy_can_be_saved_again(self, temp_file, sample_vacancies):
+        """Тест повторного сохранения удаленной вакансии."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+        worker.delete_data("https://hh.ru/vacancy/1")
+
+        worker.load_data(sample_vacancies)
+
+        assert len(worker.get_data()) == 2
+
+    def test_deleted_list_of_other_worker_is_reread(self, temp_file, sample_vacancies):
+        """Тест что список удаленных вакансий, перезаписанный другим экземпляром, читается заново."""
+        first = JSONFileWorker(temp_file)
+        second = JSONFileWorker(temp_file)
+        first.load_data(sample_vacancies)
+        first.delete_data("https://hh.ru/vacancy/1")
+        assert [v["alternate_url"] for v in first.get_data()] == ["https://hh.ru/vacancy/2"]
+
+        # Второй экземпляр сохраняет вакансию заново (список удаленных очищается) и удаляет другую
+        second.load_data(sample_vacancies)
+        second.delete_data("https://hh.ru/vacancy/2")
+
+        assert [v["alternate_url"] for v in first.get_data()] == ["https://hh.ru/vacancy/1"]
+        assert first.find_data("https://hh.ru/vacancy/2") is None
+        assert [v.alternate_url for v in first.iter_data()] == ["https://hh.ru/vacancy/1"]
+
+    def test_stale_deleted_list_is_ignored(self, temp_file, sample_vacancies):
+        """Тест что список удаленных вакансий от прежней версии файла не применяется."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+        worker.delete_data("https://hh.ru/vacancy/1")
+        # Файл перезаписан сторонней программой, список удаленных остался от прежней версии
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump([v.to_dict() for v in sample_vacancies], f, ensure_ascii=False, indent=4)
+
+        assert len(JSONFileWorker(temp_file).get_data()) == 2
+
+    def test_find_data(self, temp_file, sample_vacancies):
+        """Тест получения одной вакансии по индексу."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+
+        assert worker.find_data("https://hh.ru/vacancy/2") == sample_vacancies[1].to_dict()
+        assert worker.find_data("https://hh.ru/vacancy/999") is None
+
+        worker.delete_data("https://hh.ru/vacancy/2")
+        assert worker.find_data("https://hh.ru/vacancy/2") is None
+
+    def test_file_format_is_unchanged(self, temp_file, sample_vacancies):
+        """Тест что файл записывается в том же формате, что и json.dump с indent=4."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+
+        expected = json.dumps([v.to_dict() for v in sample_vacancies], ensure_ascii=False, indent=4)
+        with open(temp_file, 'r', encoding='utf-8') as f:
+            assert f.read() == expected
+
+    def test_index_rebuilt_for_file_without_index(self, temp_file):
+        """Тест удаления из файла, записанного без индекса."""
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump([{"name": "Test", "alternate_url": "https://hh.ru/vacancy/1"}], f)
+
+        worker = JSONFileWorker(temp_file)
+        worker.delete_data("https://hh.ru/vacancy/1")
+
+        assert worker.get_data() == []
+
+    def test_get_data_uses_read_cache(self, temp_file, sample_vacancies, mocker):
+        """Тест повторного чтения неизмененного файла без разбора JSON."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+        spy = mocker.spy(json, "load")
+
+        assert worker.get_data() == JSONFileWorker(temp_file).get_data()
+        assert len(worker.get_data()) == 2
+        spy.assert_not_called()
+
+    def test_read_cache_invalidated_on_external_change(self, temp_file, sample_vacancies):
+        """Тест повторного разбора файла, измененного в обход JSONFileWorker."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+        worker.get_data()
+
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump([{"name": "Other", "alternate_url": "https://hh.ru/vacancy/3"}], f)
+
+        assert worker.get_data() == [{"name": "Other", "alternate_url": "https://hh.ru/vacancy/3"}]
+
+    def test_read_cache_not_changed_by_caller(self, temp_file, sample_vacancies):
+        """Тест того, что изменение полученного списка не затрагивает кеш."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+
+        worker.get_data().clear()
+
+        assert len(worker.get_data()) == 2
+
+    def test_read_cache_records_not_changed_by_caller(self, temp_file, sample_vacancies, make_vacancy):
+        """Тест того, что изменение полученной записи не затрагивает кеш и не попадает в файл."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+
+        worker.get_data()[0]["name"] = "Changed"
+        assert JSONFileWorker(temp_file).get_data()[0]["name"] == "Python Developer"
+
+        JSONFileWorker(temp_file).load_data([make_vacancy(3)])
+        with open(temp_file, 'r', encoding='utf-8') as f:
+            assert [v["name"] for v in json.load(f)] == ["Python Developer", "Java Developer", "Python Developer"]
+
+    def test_iter_data(self, temp_file, sample_vacancies, mocker):
+        """Тест последовательного чтения вакансий небольшими частями файла."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+        worker.delete_data("https://hh.ru/vacancy/1")
+        spy = mocker.spy(json, "load")
+
+        vacancies = list(worker.iter_data(chunk_size=16))
+
+        assert all(isinstance(v, Vacancy) for v in vacancies)
+        assert [v.to_dict() for v in vacancies] == [sample_vacancies[1].to_dict()]
+        spy.assert_not_called()
+
+    def test_iter_data_is_lazy(self, temp_file, sample_vacancies):
+        """Тест того, что вакансии читаются из файла по мере перебора."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+
+        vacancies = worker.iter_data(chunk_size=64)
+        assert next(vacancies).alternate_url == "https://hh.ru/vacancy/1"
+        assert next(vacancies).alternate_url == "https://hh.ru/vacancy/2"
+        assert next(vacancies, None) is None
+
+    def test_iter_data_missing_or_corrupted_file(self, temp_file, capsys):
+        """Тест последовательного чтения отсутствующего и поврежденного файла."""
+        assert list(JSONFileWorker("non_existent_file.json").iter_data()) == []
+
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write('[{"name": "Test", "alternate_url": ')
+
+        assert list(JSONFileWorker(temp_file).iter_data(chunk_size=8)) == []
+        assert "поврежден" in capsys.readouterr().out
+
+    def test_iter_data_stops_at_garbage(self, temp_file, sample_vacancies, capsys, mocker):
+        """Тест что текст, не являющийся записью, считается повреждением без дочитывания всего файла."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies[:1])
+        with open(temp_file, 'r+', encoding='utf-8') as f:
+            content = f.read().rstrip().rstrip("]")
+            f.seek(0)
+            f.write(content + ', garbage' + ' x' * 10000 + ']')
+            f.truncate()
+        refill = mocker.spy(JSONFileWorker, '_JSONFileWorker__refill')
+
+        vacancies = list(worker.iter_data(chunk_size=64))
+
+        assert [v.alternate_url for v in vacancies] == ["https://hh.ru/vacancy/1"]
+        assert "поврежден" in capsys.readouterr().out
+        # Дочитывание выполнялось только для первой записи
+        assert not [call for call in refill.call_args_list if "garbage" in call.args[2]]
+
+    def test_iter_data_limits_record_size(self, temp_file, sample_vacancies, capsys, mocker):
+        """Тест что запись длиннее MAX_RECORD_SIZE считается повреждением, и буфер не растет дальше."""
+        mocker.patch.object(JSONFileWorker, 'MAX_RECORD_SIZE', 1000)
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write('[{"name": "' + 'x' * 100000)
+
+        assert list(JSONFileWorker(temp_file).iter_data(chunk_size=64)) == []
+        assert "поврежден" in capsys.readouterr().out
+
+    def test_iter_data_long_record(self, temp_file):
+        """Тест чтения записи, которая много длиннее одной части файла."""
+        record = {
+            "name": "x" * 100000,
+            "salary": 100000,
+            "alternate_url": "https://hh.ru/vacancy/1",
+            "employer": "Company A",
+            "snippet": None,
+            "experience": "Нет опыта",
+            "employment": "Полная занятость"
+        }
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump([record], f)
+
+        vacancies = list(JSONFileWorker(temp_file).iter_data(chunk_size=16))
+
+        assert [v.name for v in vacancies] == [record["name"]]
+
 
 # Дополнительные тесты для edge cases
 class TestJSONFileWorkerEdgeCases:
@@ -261,6 +481,125 @@ class TestJSONFileWorkerEdgeCases:
         assert len(data) == 1
         assert data[0]["alternate_url"] == "https://hh.ru/vacancy/1"
 
+        # Поврежденный файл сохранен рядом для восстановления
+        with open(f"{temp_file}.corrupt", 'r', encoding='utf-8') as f:
+            assert f.read() == "{ invalid json"
+
+    def test_failed_write_keeps_previous_file(self, temp_file, sample_vacancies, mocker):
+        """Тест что сбой во время записи не повреждает сохраненный файл."""
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies[:1])
+        with open(temp_file, 'rb') as f:
+            before = f.read()
+
+        mocker.patch('src.class_file_work.json.dumps', side_effect=[json.dumps({"partial": True}), OSError])
+        with pytest.raises(OSError):
+            worker.load_data(sample_vacancies)
+
+        with open(temp_file, 'rb') as f:
+            assert f.read() == before
+        # Временные файлы удалены
+        directory = os.path.dirname(temp_file)
+        assert not [name for name in os.listdir(directory)
+                    if name.startswith(f".{os.path.basename(temp_file)}") and name.endswith(".tmp")]
+
+    def test_write_keeps_file_mode(self, temp_file, sample_vacancies):
+        """Тест что перезапись файла сохраняет его права доступа, а новые файлы создаются с учетом umask."""
+        os.chmod(temp_file, 0o640)
+        worker = JSONFileWorker(temp_file)
+        worker.load_data(sample_vacancies)
+
+        assert os.stat(temp_file).st_mode & 0o777 == 0o640
+        umask = os.umask(0)
+        os.umask(umask)
+        assert os.stat(f"{temp_file}.idx").st_mode & 0o777 == 0o666 & ~umask
+
+    @pytest.mark.skipif(os.name != "posix", reason="права доступа POSIX")
+    def test_new_file_uses_current_umask(self, tmp_path):
+        """Тест что новый файл создается с текущей маской процесса, а сама маска не меняется."""
+        path = str(tmp_path / "new.json")
+        umask = os.umask(0o027)
+        try:
+            with atomic_write(path) as f:
+                f.write(b"[]")
+            assert os.umask(0o027) == 0o027
+        finally:
+            os.umask(umask)
+
+        assert os.stat(path).st_mode & 0o777 == 0o640
+
+    def test_two_workers_delete_rewrite_and_add_again(self, temp_file, sample_vacancies):
+        """Тест удаления, перезаписи файла и повторного сохранения вакансий двумя экземплярами."""
+        first = JSONFileWorker(temp_file)
+        second = JSONFileWorker(temp_file)
+        first.load_data(sample_vacancies)
+
+        second.delete_data("https://hh.ru/vacancy/1")
+        assert first.find_data("https://hh.ru/vacancy/1") is None
+        # Сохранение убирает удаленную вакансию из файла
+        first.load_data(sample_vacancies[1:])
+        assert [v["alternate_url"] for v in second.get_data()] == ["https://hh.ru/vacancy/2"]
+
+        second.load_data(sample_vacancies[:1])
+        first.delete_data("https://hh.ru/vacancy/2")
+
+        assert [v["alternate_url"] for v in first.get_data()] == ["https://hh.ru/vacancy/1"]
+        assert [v["alternate_url"] for v in second.get_data()] == ["https://hh.ru/vacancy/1"]
+        assert second.find_data("https://hh.ru/vacancy/1")["alternate_url"] == "https://hh.ru/vacancy/1"
+        assert second.find_data("https://hh.ru/vacancy/2") is None
+
+    def test_concurrent_writers_with_deletes(self, temp_file):
+        """Тест одновременного сохранения, удаления и повторного сохранения вакансий несколькими процессами."""
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            pool.starmap(churn_vacancies, [(temp_file, writer) for writer in range(4)])
+
+        data = JSONFileWorker(temp_file).get_data()
+        # Каждый процесс оставляет сохраненными вакансии с четными номерами
+        assert sorted(v["alternate_url"] for v in data) == sorted(
+            f"https://hh.ru/vacancy/{writer}_{i}" for writer in range(4) for i in range(0, 10, 2)
+        )
+
+    def test_concurrent_writers(self, temp_file):
+        """Тест одновременного сохранения вакансий несколькими процессами в один файл."""
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            pool.starmap(save_vacancies, [(temp_file, writer) for writer in range(4)])
+
+        data = JSONFileWorker(temp_file).get_data()
+        assert len(data) == 4 * 10
+        assert len({v["alternate_url"] for v in data}) == 4 * 10
+
+
+def make_writer_vacancy(writer, i):
+    """Создание вакансии с номером i для процесса writer."""
+    return Vacancy(
+        f"Vacancy {writer}_{i}",
+        {"from": 100000, "to": None},
+        f"https://hh.ru/vacancy/{writer}_{i}",
+        {"name": "Company"},
+        {"requirement": "Python"},
+        {"name": "Нет опыта"},
+        {"name": "Полная занятость"}
+    )
+
+
+def save_vacancies(filename, writer):
+    """Сохранение 10 вакансий по одной из отдельного процесса."""
+    worker = JSONFileWorker(filename)
+    for i in range(10):
+        worker.load_data([make_writer_vacancy(writer, i)])
+
+
+def churn_vacancies(filename, writer):
+    """Сохранение, удаление и повторное сохранение вакансий из отдельного процесса.
+    В конце сохранены только вакансии с четными номерами."""
+    worker = JSONFileWorker(filename)
+    for i in range(10):
+        vacancy = make_writer_vacancy(writer, i)
+        worker.load_data([vacancy])
+        worker.delete_data(vacancy.alternate_url)
+        if i % 2 == 0:
+            worker.load_data([vacancy])
+
 
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
@@ -0,0 +1,147 @@
+import json
+
+import pytest
+from src.class_abs_file_work import FileWorker
+from src.class_jsonl_file_work import JSONLFileWorker
+
+
+@pytest.fixture
+def filename(tmp_path):
+    """Фикстура с путем к временному JSONL-файлу."""
+    return str(tmp_path / "vacancy.jsonl")
+
+
+class TestJSONLFileWorker:
+    """Тесты для класса JSONLFileWorker."""
+
+    def test_inheritance(self, filename):
+        """Тест, что класс наследуется от FileWorker."""
+        assert isinstance(JSONLFileWorker(filename), FileWorker)
+
+    def test_get_data_file_not_exists(self, filename):
+        """Тест получения данных из несуществующего файла."""
+        assert JSONLFileWorker(filename).get_data() is None
+
+    def test_load_data_prevent_duplicates(self, filename, make_vacancy):
+        """Тест сохранения вакансий без дубликатов."""
+        worker = JSONLFileWorker(filename)
+        worker.load_data([make_vacancy(1), make_vacancy(2)])
+        worker.load_data([make_vacancy(2), make_vacancy(3)])
+
+        data = worker.get_data()
+        assert [v["alternate_url"] for v in data] == [f"https://hh.ru/vacancy/{i}" for i in (1, 2, 3)]
+
+    def test_load_data_only_appends(self, filename, make_vacancy):
+        """Тест что при сохранении старые строки файла не перезаписываются."""
+        worker = JSONLFileWorker(filename)
+        worker.load_data([make_vacancy(1)])
+        with open(filename, "rb") as f:
+            before = f.read()
+
+        worker.load_data([make_vacancy(2)])
+        with open(filename, "rb") as f:
+            after = f.read()
+
+        assert after.startswith(before)
+        assert json.loads(after[len(before):])["alternate_url"] == "https://hh.ru/vacancy/2"
+
+    def test_index_is_shared_between_instances(self, filename, make_vacancy):
+        """Тест что новый экземпляр использует индекс ссылок из файла."""
+        JSONLFileWorker(filename).load_data([make_vacancy(1)])
+
+        worker = JSONLFileWorker(filename)
+        worker.load_data([make_vacancy(1), make_vacancy(2)])
+
+        assert len(worker.get_data()) == 2
+
+    def test_delete_data(self, filename, make_vacancy):
+        """Тест удаления вакансии и повторного сохранения удаленной вакансии."""
+        worker = JSONLFileWorker(filename, compact_ratio=10)
+        worker.load_data([make_vacancy(1), make_vacancy(2)])
+
+        worker.delete_data("https://hh.ru/vacancy/1")
+        worker.delete_data("https://hh.ru/vacancy/999")
+        assert [v["alternate_url"] for v in worker.get_data()] == ["https://hh.ru/vacancy/2"]
+
+        worker.load_data([make_vacancy(1)])
+        assert len(worker.get_data()) == 2
+
+    def test_compact_removes_deleted_records(self, filename, make_vacancy):
+        """Тест сжатия файла: в файле остаются только актуальные записи."""
+        worker = JSONLFileWorker(filename, compact_ratio=10)
+        worker.load_data([make_vacancy(i) for i in range(5)])
+        worker.delete_data("https://hh.ru/vacancy/0")
+        worker.delete_data("https://hh.ru/vacancy/1")
+
+        worker.compact()
+
+        with open(filename, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        assert len(lines) == 3
+        with open(f"{filename}.idx", "r", encoding="utf-8") as f:
+            # Первая строка индекса - метка перезаписи
+            assert [line[0] for line in f] == ["#", "+", "+", "+"]
+
+        # После сжатия индекс продолжает работать
+        worker.load_data([make_vacancy(4), make_vacancy(5)])
+        assert len(worker.get_data()) == 4
+
+    def test_compact_in_background_after_many_deletes(self, filename, make_vacancy, mocker):
+        """Тест запуска фонового сжатия при большой доле удаленных записей."""
+        worker = JSONLFileWorker(filename, compact_ratio=0.5)
+        worker.load_data([make_vacancy(i) for i in range(4)])
+        spy = mocker.spy(worker, "compact_in_background")
+
+        worker.delete_data("https://hh.ru/vacancy/0")
+        spy.assert_not_called()
+        worker.delete_data("https://hh.ru/vacancy/1")
+
+        assert spy.call_count == 1
+        spy.spy_return.join()
+        with open(filename, "r", encoding="utf-8") as f:
+            assert len(f.readlines()) == 2
+
+    def test_partial_last_line_is_skipped(self, filename, make_vacancy):
+        """Тест чтения файла с недописанной последней строкой (сбой во время дописывания)."""
+        worker = JSONLFileWorker(filename, compact_ratio=10)
+        worker.load_data([make_vacancy(i) for i in range(3)])
+        with open(filename, "a", encoding="utf-8") as f:
+            f.write('{"name": "Developer 3", "sal')
+
+        assert len(worker.get_data()) == 3
+
+        # Недописанная строка удаляется перед следующей записью
+        worker.load_data([make_vacancy(4)])
+        assert [v["alternate_url"] for v in worker.get_data()][-1] == "https://hh.ru/vacancy/4"
+        assert len(JSONLFileWorker(filename).get_data()) == 4
+
+    def test_compact_keeps_file_when_it_cannot_be_read(self, filename, make_vacancy, capsys):
+        """Тест того, что сжатие поврежденного файла не стирает вакансии."""
+        worker = JSONLFileWorker(filename, compact_ratio=10)
+        worker.load_data([make_vacancy(i) for i in range(3)])
+        with open(filename, "a", encoding="utf-8") as f:
+            f.write("{ invalid json\n")
+        with open(filename, "rb") as f:
+            before = f.read()
+
+        worker.compact()
+
+        with open(filename, "rb") as f:
+            assert f.read() == before
+        assert "сжатие не выполнено" in capsys.readouterr().out
+
+    def test_compacted_index_is_reread_by_other_instance(self, filename, make_vacancy):
+        """Тест того, что другой экземпляр перечитывает индекс после сжатия, даже если индекс
+        успел дописаться длиннее прочитанного ранее."""
+        stale = JSONLFileWorker(filename, compact_ratio=10)
+        stale.load_data([make_vacancy(i) for i in range(4)])
+        other = JSONLFileWorker(filename, compact_ratio=10)
+        for i in range(3):
+            other.delete_data(f"https://hh.ru/vacancy/{i}")
+        other.compact()
+        other.load_data([make_vacancy(i) for i in range(10, 20)])
+
+        # Удаленная в другом экземпляре вакансия снова сохраняется
+        stale.load_data([make_vacancy(0)])
+
+        assert len(JSONLFileWorker(filename).get_data()) == 12
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from src.additional_functions import filter_vacancies
+from src.class_keyword_index import KeywordIndex, normalize, tokenize
+
+
+@pytest.fixture
+def vacancies(make_vacancy):
+    """Фикстура со списком вакансий."""
+    return [
+        make_vacancy(0, "Python-разработчик", snippet="Опыт работы с Django"),
+        make_vacancy(1, "Java Developer", snippet="Знание Spring"),
+        make_vacancy(2, "Ведущий разработчик Python", snippet=None),
+        make_vacancy(3, "Специалист по тестированию", snippet="Python, ёмкие тесты"),
+        make_vacancy(4, "JavaScript Developer", snippet="React"),
+    ]
+
+
+def test_normalize_and_tokenize():
+    """Тест нормализации и разбиения текста на слова."""
+    assert normalize("ЁЛКА") == "елка"
+    assert tokenize("Python-разработчик (Senior)") == ["python", "разработчик", "senior"]
+    assert tokenize(None) == []
+
+
+class TestKeywordIndex:
+    """Тесты для класса KeywordIndex."""
+
+    def test_search_any(self, vacancies):
+        """Тест поиска вакансий, подходящих хотя бы под одно ключевое слово."""
+        index = KeywordIndex(vacancies)
+
+        assert index.search(["PYTHON", "spring"]) == [vacancies[0], vacancies[2]]
+        assert index.search(["spring"], in_snippet=True) == [vacancies[1]]
+
+    def test_search_all(self, vacancies):
+        """Тест поиска вакансий, подходящих под все ключевые слова."""
+        index = KeywordIndex(vacancies)
+
+        assert index.search(["python", "разработчик"], mode="all") == [vacancies[0], vacancies[2]]
+        assert index.search(["python", "тестированию"], mode="all", in_snippet=True) == [vacancies[3]]
+        with pytest.raises(ValueError):
+            index.search(["python"], mode="some")
+
+    def test_prefix_and_exact(self, vacancies):
+        """Тест поиска по началу слова и по слову целиком."""
+        index = KeywordIndex(vacancies)
+
+        assert index.search(["разраб"]) == [vacancies[0], vacancies[2]]
+        assert index.search(["java"]) == [vacancies[1], vacancies[4]]
+        assert index.search(["java"], prefix=False) == [vacancies[1]]
+
+    def test_yo_normalisation(self, vacancies):
+        """Тест того, что "ё" и "е" не различаются."""
+        index = KeywordIndex(vacancies)
+
+        assert index.search(["емкие"], in_snippet=True) == [vacancies[3]]
+        assert index.search(["Ёмкие"], in_snippet=True) == [vacancies[3]]
+
+    def test_multiword_keyword(self, vacancies):
+        """Тест ключевого слова из нескольких слов."""
+        index = KeywordIndex(vacancies)
+
+        assert index.search(["java developer"]) == [vacancies[1], vacancies[4]]
+        assert index.search(["ведущий python"]) == [vacancies[2]]
+
+    def test_empty_queries(self, vacancies):
+        """Тест пустого списка ключевых слов и ключевых слов без букв."""
+        index = KeywordIndex(vacancies)
+
+        assert index.search([]) == []
+        assert index.search(["!!!"]) == []
+
+    def test_add_after_search(self, vacancies):
+        """Тест добавления вакансии после поиска."""
+        index = KeywordIndex(vacancies[:2])
+        assert index.search(["python"]) == [vacancies[0]]
+
+        index.add(vacancies[2])
+
+        assert len(index) == 3
+        assert index.search(["pyth"]) == [vacancies[0], vacancies[2]]
+
+    def test_matches_word_prefix_scan(self, make_vacancy):
+        """Тест совпадения с перебором вакансий на случайных названиях."""
+        rng = random.Random(0)
+        words = ["python", "java", "javascript", "go", "golang", "разработчик", "аналитик", "тестировщик"]
+        vacancies = [make_vacancy(i, " ".join(rng.sample(words, 3)), snippet=None) for i in range(200)]
+        index = KeywordIndex(vacancies)
+
+        for keywords in (["java"], ["go", "анал"], ["разработчик", "pyt"]):
+            expected = [
+                v for v in vacancies
+                if any(word.startswith(keyword) for keyword in keywords for word in v.name.split())
+            ]
+            assert index.search(keywords) == expected
+
+    def test_filter_vacancies_accepts_index(self, vacancies):
+        """Тест передачи индекса в функцию filter_vacancies."""
+        assert filter_vacancies(KeywordIndex(vacancies), ["python"]) == [vacancies[0], vacancies[2]]
@@ -0,0 +1,128 @@
+import itertools
+import random
+from unittest.mock import Mock, PropertyMock
+
+import pytest
+
+from src.class_keyword_index import KeywordIndex
+from src.class_query import Query
+from src.class_salary_index import SalaryIndex
+from src.class_vacancies import Vacancy
+
+
+@pytest.fixture
+def vacancies(make_vacancy):
+    """Фикстура со случайным списком вакансий."""
+    rng = random.Random(0)
+    names = ["Python Developer", "Java Developer", "Senior Python Engineer", "Аналитик данных", "Go Developer"]
+    experiences = ["Нет опыта", "От 1 года до 3 лет", "От 3 до 6 лет"]
+    return [
+        make_vacancy(
+            i,
+            rng.choice(names),
+            rng.randrange(5, 30) * 10000,
+            f"Company {rng.randrange(5)}",
+            experience=rng.choice(experiences)
+        )
+        for i in range(300)
+    ]
+
+
+def expected_result(vacancies, salary_from, salary_to, employer=None, experience=None):
+    """Функция отбора вакансий с "python" в названии перебором для сравнения с запросом."""
+    return [
+        v for v in vacancies
+        if "python" in v.name.lower()
+        and salary_from <= v.salary <= salary_to
+        and (employer is None or v.employer == employer)
+        and (experience is None or v.experience == experience)
+    ]
+
+
+class TestQuery:
+    """Тесты для класса Query."""
+
+    def test_scan(self, vacancies):
+        """Тест выполнения запроса перебором списка вакансий."""
+        query = Query().keywords(["python"]).salary(100000, 200000).employer("Company 1").experience("Нет опыта")
+
+        result = list(query.run(vacancies))
+
+        assert result == expected_result(vacancies, 100000, 200000, "Company 1", "Нет опыта")
+        assert result
+
+    def test_top(self, vacancies):
+        """Тест ограничения результата топ N вакансиями."""
+        result = list(Query().keywords(["python"]).salary(100000, 200000).top(5).run(vacancies))
+
+        expected = sorted(expected_result(vacancies, 100000, 200000), key=lambda v: v.salary, reverse=True)[:5]
+        assert result == expected
+
+    @pytest.mark.parametrize("salary_range", [(100000, 110000), (50000, 300000)])
+    def test_with_indexes(self, vacancies, salary_range):
+        """Тест выполнения запроса по индексам с выбором наименьшего набора вакансий."""
+        query = Query(KeywordIndex(vacancies), SalaryIndex(vacancies))
+        query.keywords(["python"]).salary(*salary_range).employer("Company 2").top(100)
+
+        expected = expected_result(vacancies, *salary_range, employer="Company 2")
+        assert list(query.run()) == sorted(expected, key=lambda v: v.salary, reverse=True)
+
+    def test_keyword_index_order(self, vacancies):
+        """Тест того, что без top порядок вакансий совпадает с порядком в индексе."""
+        result = list(Query(keyword_index=KeywordIndex(vacancies)).keywords(["python"]).salary(0, 10 ** 6).run())
+
+        assert result == expected_result(vacancies, 0, 10 ** 6)
+
+    def test_order_does_not_depend_on_chosen_index(self, vacancies):
+        """Тест того, что без top порядок вакансий не зависит от того, какой индекс нашел меньше вакансий."""
+        query = Query(KeywordIndex(vacancies), SalaryIndex(vacancies)).keywords(["python"])
+
+        for salary_range in [(100000, 110000), (0, 10 ** 6)]:
+            assert list(query.salary(*salary_range).run()) == expected_result(vacancies, *salary_range)
+
+    def test_passed_vacancies_are_not_replaced_by_index(self, vacancies):
+        """Тест того, что переданные вакансии перебираются, даже если у запроса есть индексы."""
+        query = Query(KeywordIndex(vacancies[:100]), SalaryIndex(vacancies[:100]))
+        query.keywords(["python"]).salary(100000, 200000)
+
+        assert list(query.run(vacancies[100:])) == expected_result(vacancies[100:], 100000, 200000)
+        assert list(query.top(3).run(vacancies[100:])) == sorted(
+            expected_result(vacancies[100:], 100000, 200000), key=lambda v: v.salary, reverse=True
+        )[:3]
+
+    def test_keywords_all_mode(self, vacancies):
+        """Тест условия на все ключевые слова."""
+        result = list(Query().keywords(["python", "senior"], mode="all").run(vacancies))
+
+        assert result and all(v.name == "Senior Python Engineer" for v in result)
+        with pytest.raises(ValueError):
+            Query().keywords(["python"], mode="some")
+
+    def test_selective_predicate_checked_first(self):
+        """Тест того, что самое избирательное условие проверяется первым."""
+        salary = PropertyMock(return_value=100000)
+        vacancies = []
+        for i in range(200):
+            vacancy = Mock(spec=Vacancy)
+            vacancy.name = "Python Developer" if i % 100 == 0 else "Java Developer"
+            type(vacancy).salary = salary
+            vacancies.append(vacancy)
+
+        result = list(Query().salary(0, 10 ** 6).keywords(["python"]).run(vacancies))
+
+        assert result == [vacancies[0], vacancies[100]]
+        # Зарплата проверяется у выборки для оценки и только у двух вакансий, прошедших условие по словам
+        assert salary.call_count < 100
+
+    def test_lazy_result(self, make_vacancy):
+        """Тест ленивого получения результата из бесконечного потока вакансий."""
+        stream = (make_vacancy(i, salary=100000 + i) for i in itertools.count())
+
+        result = Query().salary(100005, 10 ** 6).run(stream)
+
+        assert next(result).salary == 100005
+
+    def test_no_source(self):
+        """Тест запроса без вакансий и индексов."""
+        with pytest.raises(ValueError):
+            Query().salary(0, 1).run()
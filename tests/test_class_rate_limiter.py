@@ -0,0 +1,48 @@
+from src.class_rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Тесты для класса RateLimiter."""
+
+    def test_burst_within_capacity_without_waiting(self):
+        """Тест что запросы в пределах емкости корзины выполняются без ожидания."""
+        limiter = RateLimiter(rate=1, capacity=3)
+
+        assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_wait_time_grows_when_bucket_is_empty(self):
+        """Тест что при пустой корзине время ожидания растет с каждым запросом."""
+        limiter = RateLimiter(rate=2, capacity=1)
+        limiter.reserve()
+
+        first = limiter.reserve()
+        second = limiter.reserve()
+
+        assert 0.4 < first <= 0.5
+        assert 0.9 < second <= 1.0
+
+    def test_acquire_sleeps_for_reserved_time(self, mocker):
+        """Тест что acquire ждет зарезервированное время."""
+        limiter = RateLimiter(rate=1, capacity=1)
+        mock_sleep = mocker.patch('src.class_rate_limiter.time.sleep')
+
+        limiter.acquire()
+        mock_sleep.assert_not_called()
+
+        limiter.acquire()
+        mock_sleep.assert_called_once()
+
+    def test_rate_adapts_to_throttling(self):
+        """Тест подстройки частоты: уменьшение вдвое при 429 и плавный рост после успехов."""
+        limiter = RateLimiter(rate=8, min_rate=1, max_rate=10, increase=1)
+
+        limiter.on_throttle()
+        assert limiter.rate == 4
+
+        for _ in range(20):
+            limiter.on_success()
+        assert limiter.rate == 10
+
+        for _ in range(10):
+            limiter.on_throttle()
+        assert limiter.rate == 1
@@ -0,0 +1,50 @@
+import random
+
+from src.additional_functions import get_vacancies_by_salary
+from src.class_salary_index import SalaryIndex
+
+
+class TestSalaryIndex:
+    """Тесты для класса SalaryIndex."""
+
+    def test_range(self, make_vacancies):
+        """Тест выборки вакансий по диапазону зарплат с включенными границами."""
+        vacancies = make_vacancies([150000, 100000, 200000, 120000, 100000])
+        index = SalaryIndex(vacancies)
+
+        assert index.range(100000, 150000) == [vacancies[1], vacancies[4], vacancies[3], vacancies[0]]
+        assert index.range(160000, 190000) == []
+        assert index.range(200000, 100000) == []
+        assert index.count(100000, 150000) == 4
+        assert index.count(200000, 100000) == 0
+
+    def test_matches_linear_scan(self, make_vacancies):
+        """Тест совпадения результатов с перебором всех вакансий для многих диапазонов."""
+        rng = random.Random(0)
+        vacancies = make_vacancies([rng.randrange(50) * 5000 for _ in range(500)])
+        index = SalaryIndex(vacancies)
+
+        for _ in range(50):
+            salary_from, salary_to = sorted(rng.randrange(250000) for _ in range(2))
+            expected = [v for v in vacancies if salary_from <= v.salary <= salary_to]
+            assert index.range(salary_from, salary_to) == sorted(expected, key=lambda v: v.salary)
+
+    def test_add_and_extend(self, make_vacancies):
+        """Тест добавления вакансий в уже построенный индекс."""
+        first = make_vacancies([100000, 200000])
+        index = SalaryIndex(first)
+        second = make_vacancies([150000, 100000])
+
+        index.add(second[0])
+        index.extend([second[1]])
+
+        assert len(index) == 4
+        assert list(index) == [first[0], second[1], second[0], first[1]]
+
+    def test_get_vacancies_by_salary_accepts_index(self, make_vacancies):
+        """Тест передачи индекса в функцию get_vacancies_by_salary."""
+        vacancies = make_vacancies([150000, 100000, 200000])
+
+        result = get_vacancies_by_salary(SalaryIndex(vacancies), ["100000", "160000"])
+
+        assert result == [vacancies[1], vacancies[0]]
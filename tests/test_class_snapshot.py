@@ -0,0 +1,94 @@
+import json
+import os
+
+import pytest
+
+from src.class_snapshot import VacancySnapshot
+from src.class_vacancies import Vacancy
+
+
+@pytest.fixture
+def records():
+    """Фикстура со списком вакансий в формате Vacancy.to_dict."""
+    return [
+        {
+            "name": f"Python Developer {i}",
+            "salary": 100000 + i * 1000,
+            "alternate_url": f"https://hh.ru/vacancy/{i}",
+            "employer": f"Компания {i % 3}",
+            "snippet": None if i % 4 == 0 else f"Опыт работы с Python {i} лет",
+            "experience": "От 1 года до 3 лет" if i % 2 else "Нет опыта",
+            "employment": "Полная занятость"
+        }
+        for i in range(20)
+    ]
+
+
+class TestVacancySnapshot:
+    """Тесты для класса VacancySnapshot."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_save_and_load(self, tmp_path, records, compress):
+        """Тест сохранения и загрузки снимка с сжатием и без него."""
+        path = str(tmp_path / "vacancy.snap")
+        VacancySnapshot.save(path, records, compress=compress)
+
+        with VacancySnapshot(path) as snapshot:
+            assert len(snapshot) == 20
+            assert snapshot.get_data() == records
+
+    def test_save_vacancy_objects(self, tmp_path):
+        """Тест сохранения экземпляров Vacancy."""
+        vacancy = Vacancy(
+            "Python Developer",
+            {"from": 100000, "to": 150000},
+            "https://hh.ru/vacancy/1",
+            {"name": "Company A"},
+            {"requirement": "Python"},
+            {"name": "Нет опыта"},
+            {"name": "Полная занятость"}
+        )
+        path = str(tmp_path / "vacancy.snap")
+        VacancySnapshot.save(path, [vacancy])
+
+        with VacancySnapshot(path) as snapshot:
+            assert snapshot.get_data() == [vacancy.to_dict()]
+
+    def test_column_and_codes(self, tmp_path, records):
+        """Тест чтения отдельных колонок и словарных кодов."""
+        path = str(tmp_path / "vacancy.snap")
+        VacancySnapshot.save(path, records)
+
+        with VacancySnapshot(path) as snapshot:
+            assert snapshot.column("salary") == [record["salary"] for record in records]
+            codes, values = snapshot.codes("experience")
+            assert sorted(values) == ["Нет опыта", "От 1 года до 3 лет"]
+            assert [values[code] for code in codes] == [record["experience"] for record in records]
+            with pytest.raises(ValueError):
+                snapshot.codes("name")
+
+    def test_snapshot_smaller_than_json(self, tmp_path, records):
+        """Тест того, что снимок занимает меньше места, чем JSON-файл с отступами."""
+        json_path = tmp_path / "vacancy.json"
+        json_path.write_text(json.dumps(records, ensure_ascii=False, indent=4), encoding="utf-8")
+        path = str(tmp_path / "vacancy.snap")
+        VacancySnapshot.save(path, records, compress=True)
+
+        assert os.path.getsize(path) < os.path.getsize(json_path) / 2
+
+    def test_empty_snapshot(self, tmp_path):
+        """Тест сохранения пустого списка вакансий."""
+        path = str(tmp_path / "vacancy.snap")
+        VacancySnapshot.save(path, [])
+
+        with VacancySnapshot(path) as snapshot:
+            assert len(snapshot) == 0
+            assert snapshot.get_data() == []
+
+    def test_not_a_snapshot(self, tmp_path):
+        """Тест открытия файла, который не является снимком."""
+        path = tmp_path / "vacancy.json"
+        path.write_text("[]", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            VacancySnapshot(str(path))
@@ -0,0 +1,104 @@
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from src.class_abs_file_work import FileWorker
+from src.class_sqlite_file_work import SQLiteFileWorker
+from src.class_vacancies import Vacancy
+
+
+@pytest.fixture
+def worker(tmp_path, make_vacancy):
+    """Фикстура с базой данных, заполненной тестовыми вакансиями."""
+    worker = SQLiteFileWorker(str(tmp_path / "vacancy.db"))
+    worker.load_data([
+        make_vacancy(1, salary=150000),
+        make_vacancy(2, "Java Developer", 120000, employer="Company B", snippet="Spring, SQL"),
+        make_vacancy(3, "Старший Python-разработчик", 250000, employer="Яндекс"),
+        make_vacancy(4, "Аналитик данных", 90000, snippet="SQL, Python"),
+    ])
+    return worker
+
+
+class TestSQLiteFileWorker:
+    """Тесты для класса SQLiteFileWorker."""
+
+    def test_inheritance(self, worker):
+        """Тест, что класс наследуется от FileWorker."""
+        assert isinstance(worker, FileWorker)
+
+    def test_get_data(self, worker, make_vacancy):
+        """Тест получения всех вакансий в порядке сохранения."""
+        data = worker.get_data()
+        assert [v["alternate_url"] for v in data] == [f"https://hh.ru/vacancy/{i}" for i in range(1, 5)]
+        assert data[0] == make_vacancy(1, salary=150000).to_dict()
+
+    def test_load_data_prevent_duplicates(self, worker, make_vacancy):
+        """Тест что вакансии с уже сохраненной ссылкой не добавляются."""
+        worker.load_data([make_vacancy(1, salary=150000), make_vacancy(5, "Go Developer", 200000)])
+        assert len(worker.get_data()) == 5
+
+    def test_load_data_converts_each_vacancy_once(self, worker, make_vacancy):
+        """Тест что словарь каждой вакансии строится один раз."""
+        with patch.object(Vacancy, "to_dict", autospec=True, side_effect=Vacancy.to_dict) as to_dict:
+            worker.load_data([make_vacancy(5, "Go Developer", 200000)])
+        assert to_dict.call_count == 1
+
+    def test_delete_data(self, worker):
+        """Тест удаления вакансии, в том числе из полнотекстового индекса."""
+        worker.delete_data("https://hh.ru/vacancy/1")
+        worker.delete_data("https://hh.ru/vacancy/999")
+
+        assert len(worker.get_data()) == 3
+        assert [v["alternate_url"] for v in worker.filter_vacancies(["python"])] == ["https://hh.ru/vacancy/3"]
+
+    def test_delete_many(self, worker):
+        """Тест удаления нескольких вакансий одной транзакцией."""
+        worker.delete_many(["https://hh.ru/vacancy/1", "https://hh.ru/vacancy/2"])
+        assert [v["alternate_url"] for v in worker.get_data()] == ["https://hh.ru/vacancy/3", "https://hh.ru/vacancy/4"]
+
+    def test_get_vacancies_by_salary(self, worker):
+        """Тест выборки по диапазону зарплат с сортировкой по зарплате."""
+        result = worker.get_vacancies_by_salary(["100000", "200000"])
+        assert [v["salary"] for v in result] == [120000, 150000]
+
+    def test_get_vacancies_by_employer(self, worker):
+        """Тест выборки по работодателю."""
+        assert [v["alternate_url"] for v in worker.get_vacancies_by_employer("Яндекс")] == ["https://hh.ru/vacancy/3"]
+
+    def test_filter_vacancies(self, worker):
+        """Тест поиска по ключевым словам без учета регистра и по началу слова."""
+        assert [v["name"] for v in worker.filter_vacancies(["PYTHON"])] == [
+            "Python Developer", "Старший Python-разработчик"
+        ]
+        assert [v["name"] for v in worker.filter_vacancies(["java", "разраб"])] == [
+            "Java Developer", "Старший Python-разработчик"
+        ]
+        assert worker.filter_vacancies([]) == []
+
+    def test_filter_vacancies_in_snippet(self, worker):
+        """Тест поиска по ключевым словам в названии и требованиях."""
+        result = worker.filter_vacancies(["sql"], in_snippet=True)
+        assert [v["alternate_url"] for v in result] == ["https://hh.ru/vacancy/2", "https://hh.ru/vacancy/4"]
+
+    def test_filter_vacancies_quotes_in_keyword(self, worker):
+        """Тест что кавычки в ключевом слове не ломают запрос."""
+        assert len(worker.filter_vacancies(['"python'])) == 2
+
+    def test_get_top_vacancies(self, worker):
+        """Тест получения топ N вакансий по убыванию зарплаты."""
+        assert [v["salary"] for v in worker.get_top_vacancies(2)] == [250000, 150000]
+
+    def test_queries_use_indexes(self, worker, tmp_path):
+        """Тест что выборки по зарплате и работодателю используют индексы."""
+        connection = sqlite3.connect(str(tmp_path / "vacancy.db"))
+        plan_salary = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM vacancies WHERE salary BETWEEN 1 AND 2 ORDER BY salary"
+        ).fetchall()
+        plan_employer = connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM vacancies WHERE employer = 'A'"
+        ).fetchall()
+        connection.close()
+
+        assert "idx_vacancies_salary" in str(plan_salary)
+        assert "idx_vacancies_employer" in str(plan_employer)
@@ -0,0 +1,54 @@
+import random
+
+from src.class_top_n import TopVacancies
+
+
+class TestTopVacancies:
+    """Тесты для класса TopVacancies."""
+
+    def test_result_matches_sorted(self, make_vacancies):
+        """Тест совпадения топа с началом устойчиво отсортированного списка."""
+        rng = random.Random(0)
+        vacancies = make_vacancies([rng.randrange(10) * 10000 for _ in range(300)])
+
+        top = TopVacancies(15).extend(vacancies)
+
+        assert len(top) == 15
+        assert top.result() == sorted(vacancies, key=lambda v: v.salary, reverse=True)[:15]
+
+    def test_ties_keep_insertion_order(self, make_vacancies):
+        """Тест того, что из равных зарплат выше оказывается вакансия, добавленная раньше."""
+        vacancies = make_vacancies([100000, 150000, 150000, 150000])
+
+        assert TopVacancies(2).extend(vacancies).result() == [vacancies[1], vacancies[2]]
+
+    def test_incremental_updates(self, make_vacancies):
+        """Тест обновления топа по мере поступления новых страниц вакансий."""
+        first_page = make_vacancies([100000, 120000, 90000])
+        second_page = make_vacancies([200000, 80000])
+        top = TopVacancies(2)
+
+        top.extend(first_page)
+        assert top.result() == [first_page[1], first_page[0]]
+
+        top.extend(second_page)
+        assert top.result() == [second_page[0], first_page[1]]
+
+    def test_fewer_than_top_n(self, make_vacancies):
+        """Тест, когда вакансий меньше, чем N."""
+        vacancies = make_vacancies([100000, 120000])
+
+        assert TopVacancies(5).extend(vacancies).result() == [vacancies[1], vacancies[0]]
+
+    def test_zero_top_n_and_custom_key(self, make_vacancies):
+        """Тест нулевого N и выбора по другому ключу."""
+        vacancies = make_vacancies([100000, 120000, 110000])
+
+        assert TopVacancies(0).extend(vacancies).result() == []
+        assert TopVacancies(1, key=lambda v: -v.salary).extend(vacancies).result() == [vacancies[0]]
+
+    def test_accepts_iterator(self, make_vacancies):
+        """Тест добавления вакансий из генератора."""
+        vacancies = make_vacancies([100000, 120000, 110000])
+
+        assert TopVacancies(1).extend(v for v in vacancies).result() == [vacancies[1]]
@@ -1,5 +1,27 @@
+import gc
+import threading
+
+import pytest
+
 from src.class_vacancies import Vacancy
 
+
+def make_raw_items(count: int) -> list[dict]:
+    """Функция создания списка вакансий в формате ответа API HH.ru."""
+
+    return [
+        {
+            "name": f"Python Developer {i}",
+            "salary": {"from": 100000 + i if i % 2 else None, "to": 200000 if i % 3 else None, "currency": "RUR"},
+            "alternate_url": f"https://hh.ru/vacancy/{i}",
+            "employer": {"name": f"Company {i % 4}", "id": str(i % 4)},
+            "snippet": {"requirement": None if i % 5 == 0 else "Python, Django"},
+            "experience": {"name": "От 1 года до 3 лет" if i % 2 else "Нет опыта"},
+            "employment": {"name": "Полная занятость"}
+        }
+        for i in range(count)
+    ]
+
 class TestVacancy:
     """Тесты для класса Vacancy."""
 
@@ -163,3 +185,151 @@ class TestVacancy:
         vacancy = Vacancy(**test_data)
         assert vacancy.salary == 0
         assert "0 рублей" in str(vacancy)
+
+
+class TestVacancyFromRawBatch:
+    """Тесты для метода Vacancy.from_raw_batch."""
+
+    @staticmethod
+    def one_by_one(items: list[dict]) -> list[dict]:
+        """Создание вакансий по одному для сравнения."""
+
+        return [Vacancy(**{key: item[key] for key in Vacancy.__slots__}).to_dict() for item in items]
+
+    def test_matches_one_by_one(self):
+        """Тест совпадения результата с созданием вакансий по одному."""
+
+        items = make_raw_items(50)
+        vacancies = Vacancy.from_raw_batch(items)
+
+        assert all(isinstance(v, Vacancy) for v in vacancies)
+        assert [v.to_dict() for v in vacancies] == self.one_by_one(items)
+
+    def test_empty_batch(self):
+        """Тест пустого списка вакансий."""
+
+        assert Vacancy.from_raw_batch([]) == []
+
+    def test_gc_restored_after_error(self):
+        """Тест того, что сборщик мусора включается обратно после ошибки в данных."""
+
+        items = make_raw_items(3)
+        del items[1]["employer"]
+
+        with pytest.raises(KeyError):
+            Vacancy.from_raw_batch(items, pause_gc=True)
+        assert gc.isenabled()
+
+    def test_gc_not_paused_by_default(self, mocker):
+        """Тест того, что без pause_gc сборщик мусора не выключается и не включается."""
+
+        disable = mocker.patch("src.class_vacancies.gc.disable")
+        enable = mocker.patch("src.class_vacancies.gc.enable")
+
+        Vacancy.from_raw_batch(make_raw_items(2))
+
+        disable.assert_not_called()
+        enable.assert_not_called()
+
+    def test_gc_paused_until_last_thread_finishes(self):
+        """Тест того, что сборщик мусора не включается, пока создание вакансий идет в другом потоке."""
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def records():
+            started.set()
+            release.wait(timeout=5)
+            yield from [v.to_dict() for v in Vacancy.from_raw_batch(make_raw_items(2))]
+
+        thread = threading.Thread(target=Vacancy.from_records, args=(records(),), kwargs={"pause_gc": True})
+        thread.start()
+        started.wait(timeout=5)
+        try:
+            Vacancy.from_raw_batch(make_raw_items(2), pause_gc=True)
+            assert not gc.isenabled()
+        finally:
+            release.set()
+            thread.join()
+        assert gc.isenabled()
+
+    def test_gc_left_disabled_if_it_was_disabled(self):
+        """Тест того, что выключенный заранее сборщик мусора не включается."""
+
+        gc.disable()
+        try:
+            Vacancy.from_raw_batch(make_raw_items(2), pause_gc=True)
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+
+class TestVacancyFromDict:
+    """Тесты для методов Vacancy.from_dict и Vacancy.from_records."""
+
+    def test_from_dict_round_trip(self):
+        """Тест восстановления вакансии из словаря to_dict."""
+
+        vacancy = Vacancy.from_raw_batch(make_raw_items(2))[1]
+
+        restored = Vacancy.from_dict(vacancy.to_dict())
+
+        assert isinstance(restored, Vacancy)
+        assert restored.to_dict() == vacancy.to_dict()
+
+    def test_from_dict_skips_validation(self):
+        """Тест того, что зарплата из словаря не пересчитывается."""
+
+        record = Vacancy.from_raw_batch(make_raw_items(1))[0].to_dict()
+        record["salary"] = 123456
+
+        assert Vacancy.from_dict(record).salary == 123456
+
+    def test_from_records(self):
+        """Тест создания списка вакансий из словарей."""
+
+        records = [v.to_dict() for v in Vacancy.from_raw_batch(make_raw_items(20))]
+
+        vacancies = Vacancy.from_records(iter(records))
+        paused = Vacancy.from_records(iter(records), pause_gc=True)
+
+        assert [v.to_dict() for v in vacancies] == records
+        assert [v.to_dict() for v in paused] == records
+        assert gc.isenabled()
+
+
+class TestVacancyPooling:
+    """Тесты общих копий строк работодателя, опыта и типа занятости."""
+
+    @staticmethod
+    def copies(record: dict) -> list[dict]:
+        """Создание двух словарей с равными, но разными объектами строк."""
+
+        return [{key: "".join(value) if isinstance(value, str) else value for key, value in record.items()}
+                for _ in range(2)]
+
+    @pytest.mark.parametrize("build", [
+        lambda records: [Vacancy.from_dict(record) for record in records],
+        Vacancy.from_records,
+    ])
+    def test_from_stored_records(self, build):
+        """Тест общих строк у вакансий, созданных из словарей to_dict."""
+
+        record = Vacancy.from_raw_batch(make_raw_items(1))[0].to_dict()
+        first, second = build(self.copies(record))
+
+        assert first.employer is second.employer
+        assert first.experience is second.experience
+        assert first.employment is second.employment
+
+    def test_from_raw_items(self):
+        """Тест общих строк у вакансий, созданных из ответа API."""
+
+        items = make_raw_items(8)
+        for item in items:
+            item["employer"] = {"name": "".join(["Company ", "A"])}
+
+        vacancies = Vacancy.from_raw_batch(items)
+        vacancies.append(Vacancy(**{key: items[0][key] for key in Vacancy.__slots__}))
+
+        assert all(v.employer is vacancies[0].employer for v in vacancies)
@@ -0,0 +1,92 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.class_vacancy_table import VacancyTable
+
+
+@pytest.fixture
+def vacancies(make_vacancy):
+    """Фикстура со списком вакансий с повторяющимися зарплатами."""
+    return [
+        make_vacancy(0, "Python Developer", 100000, "Company A", experience="От 1 года до 3 лет"),
+        make_vacancy(1, "Java Developer", 150000, "Company B"),
+        make_vacancy(2, "Senior Python", 150000, "Company A", experience="От 1 года до 3 лет"),
+        make_vacancy(3, "Go Developer", 90000, "Company C"),
+        make_vacancy(4, "Python Team Lead", 150000, "Company B", experience="От 1 года до 3 лет"),
+    ]
+
+
+class TestVacancyTable:
+    """Тесты для класса VacancyTable."""
+
+    def test_len_iter_and_salary(self, vacancies):
+        """Тест построения таблицы из списка вакансий."""
+        table = VacancyTable(vacancies)
+
+        assert len(table) == 5
+        assert list(table) == vacancies
+        assert table.salary.tolist() == [100000, 150000, 150000, 90000, 150000]
+        with pytest.raises(ValueError):
+            table.salary[0] = 0
+
+    def test_filter_by_category(self, vacancies):
+        """Тест выбора вакансий по работодателю и опыту."""
+        table = VacancyTable(vacancies)
+
+        assert table.filter("employer", "Company B").to_list() == [vacancies[1], vacancies[4]]
+        assert len(table.filter("experience", "Нет опыта")) == 2
+        assert len(table.filter("employer", "Unknown")) == 0
+
+    def test_salary_range_and_search(self, vacancies):
+        """Тест выбора вакансий по диапазону зарплат и ключевым словам."""
+        table = VacancyTable(vacancies)
+
+        assert table.salary_range(95000, 120000).to_list() == [vacancies[0]]
+        assert table.search(["PYTHON"]).to_list() == [vacancies[0], vacancies[2], vacancies[4]]
+
+    def test_combined_masks(self, vacancies):
+        """Тест объединения булевых масок."""
+        table = VacancyTable(vacancies)
+
+        mask = table.keyword_mask(["python"]) & table.category_mask("employer", "Company B")
+        assert table.mask(mask).to_list() == [vacancies[4]]
+
+    def test_sort_is_stable(self, vacancies):
+        """Тест сортировки по убыванию зарплаты с сохранением порядка равных зарплат."""
+        table = VacancyTable(vacancies)
+
+        assert table.sort().to_list() == sorted(vacancies, key=lambda v: v.salary, reverse=True)
+
+    @pytest.mark.parametrize("top_n", [0, 1, 2, 3, 5, 10])
+    def test_top(self, vacancies, top_n):
+        """Тест выбора топ N вакансий при равных зарплатах на границе."""
+        table = VacancyTable(vacancies)
+
+        expected = sorted(vacancies, key=lambda v: v.salary, reverse=True)[:top_n]
+        assert table.top(top_n).to_list() == expected
+
+    def test_top_random(self, make_vacancy):
+        """Тест выбора топ N вакансий на случайных данных."""
+        rng = random.Random(0)
+        vacancies = [make_vacancy(i, salary=rng.randrange(10) * 10000) for i in range(500)]
+        table = VacancyTable(vacancies)
+
+        expected = sorted(vacancies, key=lambda v: v.salary, reverse=True)[:37]
+        assert table.top(37).to_list() == expected
+
+    def test_subtable_operations(self, vacancies):
+        """Тест операций над таблицей, полученной фильтрацией."""
+        table = VacancyTable(vacancies).search(["python"])
+
+        assert table.filter("employer", "Company A").to_list() == [vacancies[0], vacancies[2]]
+        assert table.top(1).to_list() == [vacancies[2]]
+
+    def test_empty_table(self):
+        """Тест пустой таблицы."""
+        table = VacancyTable()
+
+        assert len(table) == 0
+        assert table.top(3).to_list() == []
+        assert table.mask(np.zeros(0, dtype=bool)).to_list() == []
@@ -0,0 +1,49 @@
+import os
+from datetime import datetime
+
+import pytest
+from src.class_watermark import WatermarkStore
+
+
+class TestWatermarkStore:
+    """Тесты для класса WatermarkStore."""
+
+    def test_get_missing_keyword(self, tmp_path):
+        """Тест получения отметки для ключевого слова, по которому еще не было загрузок."""
+        store = WatermarkStore(str(tmp_path / "watermarks.json"))
+        assert store.get("python") is None
+
+    def test_set_and_get(self, tmp_path):
+        """Тест сохранения отметок для нескольких ключевых слов."""
+        store = WatermarkStore(str(tmp_path / "watermarks.json"))
+        first = datetime.fromisoformat("2024-01-15T10:00:00+0300")
+        second = datetime.fromisoformat("2024-01-16T12:30:00+0300")
+
+        store.set("python", first)
+        store.set("django", second)
+
+        # Отметки читаются из файла новым экземпляром
+        other = WatermarkStore(str(tmp_path / "watermarks.json"))
+        assert other.get("python") == first
+        assert other.get("django") == second
+
+    def test_corrupted_file(self, tmp_path):
+        """Тест чтения отметок из поврежденного файла."""
+        path = tmp_path / "watermarks.json"
+        path.write_text("{ invalid json", encoding="utf-8")
+
+        store = WatermarkStore(str(path))
+        assert store.get("python") is None
+
+    def test_failed_write_keeps_previous_file(self, tmp_path, mocker):
+        """Тест что сбой во время записи не повреждает сохраненные отметки."""
+        store = WatermarkStore(str(tmp_path / "watermarks.json"))
+        first = datetime.fromisoformat("2024-01-15T10:00:00+0300")
+        store.set("python", first)
+
+        mocker.patch("src.class_file_work.os.fsync", side_effect=OSError)
+        with pytest.raises(OSError):
+            store.set("python", datetime.fromisoformat("2024-01-16T12:30:00+0300"))
+
+        assert store.get("python") == first
+        assert os.listdir(tmp_path) == ["watermarks.json"]